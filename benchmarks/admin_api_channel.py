@@ -0,0 +1,96 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures the latency of a connection info refresh over a warm versus a
+cold AlloyDB Admin API gRPC channel.
+
+Each refresh is made by a new AlloyDBClient, as by a newly created
+connector. Cold refreshes close the pooled channels first, so each pays for
+the channel's connection and TLS handshake; warm refreshes reuse the
+process-wide channel. Requires Application Default Credentials and an
+instance to refresh.
+
+Usage:
+    python benchmarks/admin_api_channel.py INSTANCE_URI [--refreshes 10]
+        [--driver asyncpg]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any
+
+import google.auth
+from google.cloud.alloydbconnector import channel_pool
+from google.cloud.alloydbconnector.client import AlloyDBClient
+from google.cloud.alloydbconnector.utils import generate_keys
+
+
+def close_pooled_channels() -> None:
+    with channel_pool._lock:
+        entries = list(channel_pool._channels.values())
+        channel_pool._channels.clear()
+    for entry in entries:
+        entry.close()
+
+
+async def refresh(instance_uri: str, driver: str, credentials: Any) -> float:
+    """Returns the seconds taken by a refresh with a new client."""
+    _, project, _, region, _, cluster, _, name = instance_uri.split("/")
+    keys = asyncio.ensure_future(generate_keys())
+    await keys
+    client = AlloyDBClient("alloydb.googleapis.com", None, credentials, driver=driver)
+    start = time.perf_counter()
+    await client.get_connection_info(project, region, cluster, name, keys)
+    elapsed = time.perf_counter() - start
+    client.close()
+    return elapsed
+
+
+async def run(instance_uri: str, driver: str, refreshes: int) -> None:
+    credentials, _ = google.auth.default(
+        scopes=["https://www.googleapis.com/auth/cloud-platform"]
+    )
+    cold = []
+    for _ in range(refreshes):
+        close_pooled_channels()
+        cold.append(await refresh(instance_uri, driver, credentials))
+    # the last cold refresh left the channel open in the pool
+    warm = [await refresh(instance_uri, driver, credentials) for _ in range(refreshes)]
+    close_pooled_channels()
+
+    print(f"{'channel':>8} {'median (ms)':>12} {'max (ms)':>10}")
+    for label, times in (("cold", cold), ("warm", warm)):
+        print(
+            f"{label:>8} {statistics.median(times) * 1000:>12.1f} "
+            f"{max(times) * 1000:>10.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("instance_uri")
+    parser.add_argument("--refreshes", type=int, default=10)
+    parser.add_argument(
+        "--driver",
+        default="pg8000",
+        help="pg8000 uses the sync gRPC client, asyncpg the asyncio one",
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.instance_uri, args.driver, args.refreshes))
+
+
+if __name__ == "__main__":
+    main()
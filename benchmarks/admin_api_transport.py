@@ -0,0 +1,105 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compares the gRPC and REST transports of the AlloyDB Admin API client.
+
+For each transport, a fresh interpreter creates an AlloyDBClient and reports
+the time taken and the peak resident memory of the process, so the cost of
+importing and starting the transport is measured as a new process would pay
+it. Given an instance URI, each interpreter also times refreshes of the
+instance's connection info, which requires Application Default Credentials;
+without one, no credentials are needed.
+
+Usage:
+    python benchmarks/admin_api_transport.py [INSTANCE_URI] [--refreshes 5]
+        [--runs 5]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# run in a fresh interpreter per transport; prints a JSON result
+_CHILD = """
+import asyncio, json, resource, sys, time
+import google.auth
+from google.auth.credentials import AnonymousCredentials
+transport, instance_uri, refreshes = sys.argv[1], sys.argv[2], int(sys.argv[3])
+start = time.perf_counter()
+from google.cloud.alloydbconnector.client import AlloyDBClient
+from google.cloud.alloydbconnector.utils import generate_keys
+if instance_uri:
+    credentials, _ = google.auth.default(
+        scopes=["https://www.googleapis.com/auth/cloud-platform"]
+    )
+else:
+    credentials = AnonymousCredentials()
+client = AlloyDBClient(
+    "alloydb.googleapis.com", None, credentials, driver="pg8000",
+    transport=transport,
+)
+setup = time.perf_counter() - start
+times = []
+if instance_uri:
+    _, project, _, region, _, cluster, _, name = instance_uri.split("/")
+    async def refresh():
+        keys = asyncio.ensure_future(generate_keys())
+        await keys
+        for _ in range(refreshes):
+            start = time.perf_counter()
+            await client.get_connection_info(project, region, cluster, name, keys)
+            times.append(time.perf_counter() - start)
+    asyncio.run(refresh())
+client.close()
+# ru_maxrss is in KiB on Linux
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+print(json.dumps({"setup": setup, "rss": rss, "refreshes": times}))
+"""
+
+
+def measure(transport: str, instance_uri: str, refreshes: int) -> dict:
+    out = subprocess.check_output(
+        [sys.executable, "-c", _CHILD, transport, instance_uri, str(refreshes)],
+        text=True,
+    )
+    return json.loads(out)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("instance_uri", nargs="?", default="")
+    parser.add_argument("--refreshes", type=int, default=5)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'transport':>10} {'setup (ms)':>11} {'peak RSS (MiB)':>15} "
+        f"{'refresh median (ms)':>20}"
+    )
+    for transport in ("grpc", "rest"):
+        runs = [
+            measure(transport, args.instance_uri, args.refreshes)
+            for _ in range(args.runs)
+        ]
+        setup = statistics.median(r["setup"] for r in runs) * 1000
+        rss = statistics.median(r["rss"] for r in runs)
+        refreshes = [t for r in runs for t in r["refreshes"]]
+        refresh = f"{statistics.median(refreshes) * 1000:>20.1f}" if refreshes else "-"
+        print(f"{transport:>10} {setup:>11.1f} {rss:>15.1f} {refresh:>20}")
+
+
+if __name__ == "__main__":
+    main()
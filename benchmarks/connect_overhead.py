@@ -0,0 +1,136 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures the per-connect overhead of Connector.connect with cached
+connection info.
+
+The metadata exchange and the driver are replaced with no-ops, so the
+numbers are the connector's own cost: the direct path on the calling
+thread against the path through the event loop and its executor.
+
+Usage:
+    python benchmarks/connect_overhead.py [--connects 20000] [--threads 1 8]
+"""
+
+import argparse
+import asyncio
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+import ssl
+import threading
+import time
+from typing import Any
+from typing import Callable
+
+from google.auth.credentials import AnonymousCredentials
+from google.cloud.alloydbconnector import Connector
+from google.cloud.alloydbconnector import connector as connector_module
+from google.cloud.alloydbconnector.connection_info import ConnectionInfo
+
+INSTANCE_URI = "projects/p/locations/r/clusters/c/instances/i"
+
+
+class CachedInfo:
+    """A connection info cache that is always ready."""
+
+    def __init__(self) -> None:
+        self._info = ConnectionInfo(
+            [],
+            "",
+            None,
+            {"PRIVATE": "10.0.0.1"},
+            datetime.now(timezone.utc) + timedelta(hours=1),
+            ssl.create_default_context(),
+        )
+
+    async def connect_info(self) -> ConnectionInfo:
+        return self._info
+
+    def connect_info_nowait(self) -> ConnectionInfo:
+        return self._info
+
+    async def force_refresh(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class NoopDriver:
+    @staticmethod
+    def connect(sock: Any, **kwargs: Any) -> Any:
+        return sock
+
+
+def make_connector() -> Connector:
+    connector = Connector(credentials=AnonymousCredentials())
+    connector._client = type(  # type: ignore[assignment]
+        "Client", (), {"_user_agent": "benchmark", "close": lambda self: None}
+    )()
+    connector._cache[INSTANCE_URI] = CachedInfo()  # type: ignore[assignment]
+    connector.metadata_exchange = lambda *args: None  # type: ignore[method-assign]
+    connector_module._DRIVERS["noop"] = NoopDriver
+    return connector
+
+
+def direct(connector: Connector) -> None:
+    connector.connect(INSTANCE_URI, "noop", user="u", password="p", db="d")
+
+
+def through_loop(connector: Connector) -> None:
+    asyncio.run_coroutine_threadsafe(
+        connector.connect_async(INSTANCE_URI, "noop", user="u", password="p", db="d"),
+        connector._loop,
+    ).result()
+
+
+def run(connect: Callable[[Connector], None], connects: int, threads: int) -> float:
+    """Returns the mean microseconds per connect across all threads."""
+    connector = make_connector()
+    per_thread = connects // threads
+
+    def worker() -> None:
+        for _ in range(per_thread):
+            connect(connector)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - start
+    connector.close()
+    return elapsed / (per_thread * threads) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connects", type=int, default=20000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 8])
+    args = parser.parse_args()
+
+    print(f"{'threads':>8} {'loop (us)':>12} {'direct (us)':>12} {'saved':>8}")
+    for threads in args.threads:
+        loop_us = run(through_loop, args.connects, threads)
+        direct_us = run(direct, args.connects, threads)
+        print(
+            f"{threads:>8} {loop_us:>12.1f} {direct_us:>12.1f} "
+            f"{loop_us - direct_us:>7.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures the memory held by the connection infos of many cached
+instances.
+
+Each instance gets its own copy of the PEM strings, as from a separate
+Admin API response. The client certificate is the same for all instances,
+so that SSL contexts can be built with the one key, but as it is a copy it
+takes the memory of a unique one. The Python heap is measured with
+tracemalloc for a replica of the previous ConnectionInfo, for the current
+one, and for the current one after its SSL context is built. The memory
+OpenSSL allocates for SSL contexts is not traced.
+
+Usage:
+    python benchmarks/connection_info_memory.py [--instances 1000 10000]
+"""
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+import gc
+import ssl
+import tracemalloc
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+
+from google.cloud.alloydbconnector.connection_info import ConnectionInfo
+
+
+@dataclass
+class LegacyConnectionInfo:
+    """ConnectionInfo as it was before it shared and dropped the PEMs."""
+
+    cert_chain: list[str]
+    ca_cert: str
+    key: Any
+    ip_addrs: dict[str, Optional[str]]
+    expiration: datetime
+    context: Optional[ssl.SSLContext] = None
+
+
+def _cert(
+    name: str, key: rsa.RSAPrivateKey, issuer: Optional[x509.Certificate], signer: Any
+) -> x509.Certificate:
+    subject = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, name)])
+    now = datetime.now(timezone.utc)
+    return (
+        x509.CertificateBuilder()
+        .subject_name(subject)
+        .issuer_name(issuer.subject if issuer else subject)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + timedelta(hours=1))
+        .add_extension(
+            x509.BasicConstraints(ca=name != "client", path_length=None), True
+        )
+        .sign(signer, hashes.SHA256())
+    )
+
+
+def _pem(cert: x509.Certificate) -> str:
+    return cert.public_bytes(serialization.Encoding.PEM).decode()
+
+
+def make_certs() -> tuple[rsa.RSAPrivateKey, str, str, str, str]:
+    """Returns a client key, and the client, intermediate, root and CA
+    certificates in PEM format."""
+    root_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    root = _cert("root", root_key, None, root_key)
+    intermediate_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    intermediate = _cert("intermediate", intermediate_key, root, root_key)
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    client = _cert("client", key, intermediate, intermediate_key)
+    return key, _pem(client), _pem(intermediate), _pem(root), _pem(root)
+
+
+def copy(pem: str) -> str:
+    """Returns a new string equal to pem, as decoded from a response."""
+    return pem.encode().decode()
+
+
+def measure(count: int, create: Callable[[int], Any], build: bool) -> float:
+    """Returns the traced bytes held per connection info."""
+    gc.collect()
+    tracemalloc.start()
+    infos = [create(i) for i in range(count)]
+    if build:
+
+        async def build_contexts(infos: list[Any]) -> None:
+            for info in infos:
+                await info.create_ssl_context()
+
+        asyncio.run(build_contexts(infos))
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del infos
+    return size / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--instances", type=int, nargs="+", default=[1000, 10000])
+    args = parser.parse_args()
+
+    key, client, intermediate, root, ca = make_certs()
+    expiration = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    def factory(cls: Any) -> Callable[[int], Any]:
+        def create(i: int) -> Any:
+            return cls(
+                [copy(client), copy(intermediate), copy(root)],
+                copy(ca),
+                key,
+                {"PRIVATE": f"10.0.{i // 256 % 256}.{i % 256}"},
+                expiration,
+            )
+
+        return create
+
+    scenarios = [
+        ("previous", factory(LegacyConnectionInfo), False),
+        ("compact", factory(ConnectionInfo), False),
+        ("compact, context built", factory(ConnectionInfo), True),
+    ]
+    print(
+        f"{'connection info':<24} {'instances':>10} {'bytes each':>11} {'total (MiB)':>12}"
+    )
+    for name, create, build in scenarios:
+        for count in args.instances:
+            each = measure(count, create, build)
+            print(f"{name:<24} {count:>10} {each:>11.0f} {each * count / 2**20:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
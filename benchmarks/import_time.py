@@ -0,0 +1,94 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures the import time of the connector against a committed budget.
+
+Each scenario is imported in a fresh interpreter with `-X importtime` and
+the cumulative time of its top-level module is taken, so interpreter
+startup is not counted. The median over several runs is compared with
+import_budget.json; the script exits non-zero if a scenario is over budget.
+
+Usage:
+    python benchmarks/import_time.py [--runs 7] [--top 10]
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+BUDGET_FILE = os.path.join(os.path.dirname(__file__), "import_budget.json")
+
+# scenario name -> statement importing it
+SCENARIOS = {
+    "package": "import google.cloud.alloydbconnector",
+    "AsyncConnector": "from google.cloud.alloydbconnector import AsyncConnector",
+    "Connector": "from google.cloud.alloydbconnector import Connector",
+}
+
+# "import time: <self us> | <cumulative us> | <indented module name>"
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def import_times(statement: str) -> dict[str, int]:
+    """Returns the cumulative import time in microseconds of every module
+    imported by the statement."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(2))
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument(
+        "--top", type=int, default=10, help="slowest modules to list per scenario"
+    )
+    args = parser.parse_args()
+
+    with open(BUDGET_FILE) as f:
+        budget_ms = json.load(f)
+
+    over = []
+    print(f"{'scenario':<16} {'median (ms)':>12} {'budget (ms)':>12}")
+    for name, statement in SCENARIOS.items():
+        runs = [import_times(statement) for _ in range(args.runs)]
+        top_module = statement.split()[1]
+        median_ms = statistics.median(r[top_module] for r in runs) / 1000
+        print(f"{name:<16} {median_ms:>12.1f} {budget_ms[name]:>12.1f}")
+        if median_ms > budget_ms[name]:
+            over.append(name)
+            slowest = sorted(runs[-1].items(), key=lambda m: m[1], reverse=True)
+            for module, us in slowest[: args.top]:
+                print(f"    {us / 1000:>8.1f}ms  {module}")
+
+    if over:
+        print(f"over budget: {', '.join(over)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
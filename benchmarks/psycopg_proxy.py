@@ -0,0 +1,158 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compares the psycopg proxy engine with the previous thread-per-direction
+proxy.
+
+Measures forwarding throughput (MB/s) for a single bulk transfer and the
+resident memory and thread count of N idle proxied connections.
+
+Usage:
+    python benchmarks/psycopg_proxy.py [--mb 256] [--idle 300]
+"""
+
+import argparse
+import gc
+import os
+import socket
+import threading
+import time
+from typing import Callable
+
+from google.cloud.alloydbconnector.proxy import DEFAULT_BUFFER_SIZE
+from google.cloud.alloydbconnector.proxy import ProxyEngine
+
+_LEGACY_CHUNK_SIZE = 8 * 1024
+
+
+def legacy_proxy(local: socket.socket, remote: socket.socket) -> None:
+    """The previous design: one thread per direction with 8 KiB buffers."""
+
+    def forward(src: socket.socket, dst: socket.socket) -> None:
+        buf = bytearray(_LEGACY_CHUNK_SIZE)
+        view = memoryview(buf)
+        try:
+            while True:
+                n = src.recv_into(view)
+                if n == 0:
+                    break
+                dst.sendall(view[:n])
+        except OSError:
+            pass
+        finally:
+            for s in (local, remote):
+                try:
+                    s.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                s.close()
+
+    threading.Thread(target=forward, args=(remote, local), daemon=True).start()
+    threading.Thread(target=forward, args=(local, remote), daemon=True).start()
+
+
+def rss_bytes() -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+def throughput(
+    start_proxy: Callable[[socket.socket, socket.socket], None], mb: int
+) -> float:
+    """Pushes `mb` MiB from the driver side to the server side."""
+    driver, local = socket.socketpair()
+    remote, server = socket.socketpair()
+    start_proxy(local, remote)
+    total = mb * 1024 * 1024
+    chunk = os.urandom(1024 * 1024)
+
+    def write() -> None:
+        for _ in range(mb):
+            driver.sendall(chunk)
+
+    writer = threading.Thread(target=write)
+    begin = time.perf_counter()
+    writer.start()
+    received = 0
+    while received < total:
+        n = len(server.recv(1024 * 1024))
+        if n == 0:
+            break
+        received += n
+    elapsed = time.perf_counter() - begin
+    writer.join()
+    driver.close()
+    server.close()
+    return received / (1024 * 1024) / elapsed
+
+
+def idle_cost(
+    start_proxy: Callable[[socket.socket, socket.socket], None], count: int
+) -> tuple[float, int]:
+    """Returns (bytes of RSS per connection, threads per connection)."""
+    gc.collect()
+    threads_before = threading.active_count()
+    rss_before = rss_bytes()
+    ends = []
+    for _ in range(count):
+        driver, local = socket.socketpair()
+        remote, server = socket.socketpair()
+        start_proxy(local, remote)
+        ends.append((driver, server))
+    # let every proxy thread reach its blocking recv
+    time.sleep(0.5)
+    rss_after = rss_bytes()
+    threads = threading.active_count() - threads_before
+    for driver, server in ends:
+        driver.close()
+        server.close()
+    time.sleep(0.5)
+    return (rss_after - rss_before) / count, threads
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mb", type=int, default=256, help="MiB to transfer")
+    parser.add_argument(
+        "--idle", type=int, default=300, help="number of idle connections"
+    )
+    parser.add_argument(
+        "--buffer-size",
+        type=int,
+        default=DEFAULT_BUFFER_SIZE,
+        help="proxy engine buffer size in bytes",
+    )
+    args = parser.parse_args()
+
+    engine = ProxyEngine(args.buffer_size)
+    designs: dict[str, Callable[[socket.socket, socket.socket], None]] = {
+        "thread-per-direction": legacy_proxy,
+        "engine": lambda local, remote: engine.proxy(local, remote) and None,
+    }
+    print(f"{'design':<22}{'MB/s':>10}{'RSS/conn':>12}{'threads/conn':>14}")
+    for name, start_proxy in designs.items():
+        mbps = throughput(start_proxy, args.mb)
+        per_conn, threads = idle_cost(start_proxy, args.idle)
+        print(
+            f"{name:<22}{mbps:>10.1f}{per_conn / 1024:>10.1f}KiB"
+            f"{threads / args.idle:>14.2f}"
+        )
+    engine.retire()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures how Connector.connect throughput scales with the number of
+threads connecting at once.
+
+All threads share one Connector with cached connection info. The metadata
+exchange is a no-op and the driver runs a pure Python busy loop of
+--work-us microseconds, standing in for pg8000's handshake. Threads can
+only run it in parallel on a free-threaded (no-GIL) build, so run the
+script with both builds to compare, e.g. python3.13 and python3.13t.
+
+Usage:
+    python benchmarks/thread_scaling.py [--connects 20000] [--work-us 50]
+        [--threads 1 2 4 8 16 32 64]
+"""
+
+import argparse
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+import ssl
+import sys
+import threading
+import time
+from typing import Any
+
+from google.auth.credentials import AnonymousCredentials
+from google.cloud.alloydbconnector import Connector
+from google.cloud.alloydbconnector import connector as connector_module
+from google.cloud.alloydbconnector.connection_info import ConnectionInfo
+
+INSTANCE_URI = "projects/p/locations/r/clusters/c/instances/i"
+
+
+class CachedInfo:
+    """A connection info cache that is always ready."""
+
+    def __init__(self) -> None:
+        self._info = ConnectionInfo(
+            [],
+            "",
+            None,
+            {"PRIVATE": "10.0.0.1"},
+            datetime.now(timezone.utc) + timedelta(hours=1),
+            ssl.create_default_context(),
+        )
+        self.stale_served = 0
+        self.serving_stale = False
+
+    async def connect_info(self) -> ConnectionInfo:
+        return self._info
+
+    def connect_info_nowait(self) -> ConnectionInfo:
+        return self._info
+
+    async def force_refresh(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class BusyDriver:
+    """A driver whose connect runs Python code for a fixed time."""
+
+    work = 0.0
+
+    @classmethod
+    def connect(cls, sock: Any, **kwargs: Any) -> Any:
+        end = time.perf_counter() + cls.work
+        while time.perf_counter() < end:
+            pass
+        return sock
+
+
+def make_connector() -> Connector:
+    connector = Connector(credentials=AnonymousCredentials())
+    connector._client = type(  # type: ignore[assignment]
+        "Client", (), {"_user_agent": "benchmark", "close": lambda self: None}
+    )()
+    connector._cache[INSTANCE_URI] = CachedInfo()  # type: ignore[assignment]
+    connector.metadata_exchange = lambda *args: None  # type: ignore[method-assign]
+    connector_module._DRIVERS["busy"] = BusyDriver
+    return connector
+
+
+def run(connects: int, threads: int) -> float:
+    """Returns the connects per second across all threads."""
+    connector = make_connector()
+    per_thread = max(connects // threads, 1)
+    start_barrier = threading.Barrier(threads + 1)
+
+    def worker() -> None:
+        start_barrier.wait()
+        for _ in range(per_thread):
+            connector.connect(INSTANCE_URI, "busy", user="u", password="p", db="d")
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in workers:
+        t.start()
+    start_barrier.wait()
+    start = time.perf_counter()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - start
+    connector.close()
+    return per_thread * threads / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connects", type=int, default=20000)
+    parser.add_argument("--work-us", type=float, default=50.0)
+    parser.add_argument(
+        "--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32, 64]
+    )
+    args = parser.parse_args()
+    BusyDriver.work = args.work_us / 1e6
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{'threads':>8} {'connects/s':>12} {'speedup':>8}")
+    baseline = None
+    for threads in args.threads:
+        rate = run(args.connects, threads)
+        baseline = baseline or rate
+        print(f"{threads:>8} {rate:>12.0f} {rate / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
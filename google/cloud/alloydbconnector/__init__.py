@@ -13,14 +13,18 @@
 # limitations under the License.
 from google.cloud.alloydbconnector.async_connector import AsyncConnector
 from google.cloud.alloydbconnector.connector import Connector
+from google.cloud.alloydbconnector.enums import AdminAPITransport
 from google.cloud.alloydbconnector.enums import IPTypes
 from google.cloud.alloydbconnector.enums import RefreshStrategy
+from google.cloud.alloydbconnector.instance_change import InstanceChange
 from google.cloud.alloydbconnector.version import __version__
 
 __all__ = [
     "__version__",
     "Connector",
     "AsyncConnector",
+    "AdminAPITransport",
+    "InstanceChange",
     "IPTypes",
     "RefreshStrategy",
 ]
@@ -15,36 +15,76 @@
 from __future__ import annotations
 
 import asyncio
+import importlib
 import logging
+import struct
+import threading
 from types import TracebackType
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Coroutine
 from typing import Optional
+from typing import TypeVar
 
 import google.auth
 from google.auth.credentials import with_scopes_if_required
-import google.auth.transport.requests
 import google.cloud.alloydbconnector.asyncpg as asyncpg
+from google.cloud.alloydbconnector.circuit_breaker import CircuitBreakers
+from google.cloud.alloydbconnector.circuit_breaker import _attempt
 from google.cloud.alloydbconnector.client import AlloyDBClient
+from google.cloud.alloydbconnector.connection_info import ConnectionInfo
+from google.cloud.alloydbconnector.enums import AdminAPITransport
 from google.cloud.alloydbconnector.enums import IPTypes
 from google.cloud.alloydbconnector.enums import RefreshStrategy
 from google.cloud.alloydbconnector.exceptions import ClosedConnectorError
+from google.cloud.alloydbconnector.exceptions import MetadataExchangeError
 from google.cloud.alloydbconnector.instance import RefreshAheadCache
+from google.cloud.alloydbconnector.instance_change import InstanceChange
+from google.cloud.alloydbconnector.instance_change import InstanceChangeListeners
 from google.cloud.alloydbconnector.lazy import LazyRefreshCache
+from google.cloud.alloydbconnector.negative_cache import NegativeCache
+from google.cloud.alloydbconnector.pool import PoolRotation
+from google.cloud.alloydbconnector.pool import _max_lifetime
+from google.cloud.alloydbconnector.pool import _pool_stats
+from google.cloud.alloydbconnector.proxy import AsyncProxyProtocol
+import google.cloud.alloydbconnector.psycopg as psycopg
+from google.cloud.alloydbconnector.refresh_utils import _instance_stats
+from google.cloud.alloydbconnector.refresh_utils import _refresh_may_help
+from google.cloud.alloydbconnector.token_manager import TokenManager
 from google.cloud.alloydbconnector.types import CacheTypes
+from google.cloud.alloydbconnector.utils import CONNECT_TIMEOUT
+from google.cloud.alloydbconnector.utils import IO_TIMEOUT
+from google.cloud.alloydbconnector.utils import SERVER_PROXY_PORT
+from google.cloud.alloydbconnector.utils import _deadline
+from google.cloud.alloydbconnector.utils import _remaining
 from google.cloud.alloydbconnector.utils import generate_keys
 from google.cloud.alloydbconnector.utils import strip_http_prefix
 
 if TYPE_CHECKING:
+    import ssl
+
     from google.auth.credentials import Credentials
 
 logger = logging.getLogger(name=__name__)
 
+T = TypeVar("T")
+
+# drivers that connect through the metadata exchange
+_METADATA_EXCHANGE_DRIVERS = ("psycopg",)
+
 
 class AsyncConnector:
     """A class to configure and create connections to Cloud SQL instances
     asynchronously.
 
+    A connector can be used from several event loops, e.g. one per thread.
+    Connection info is refreshed on the loop that first used the connector
+    and shared by all of them, while each connection is dialed on the loop
+    that asked for it. When the refreshing loop stops, the next loop to
+    connect takes over refreshing.
+
     Args:
         credentials (google.auth.credentials.Credentials):
             A credentials object created from the google-auth Python library.
@@ -72,6 +112,32 @@ class AsyncConnector:
             of the following: RefreshStrategy.LAZY ("LAZY") or
             RefreshStrategy.BACKGROUND ("BACKGROUND").
             Default: RefreshStrategy.BACKGROUND
+        timeout (float): Default seconds allowed for a connection attempt,
+            covering the wait for connection info, the dial, TLS handshake,
+            metadata exchange and the driver's handshake. Can be set per
+            connection with the `timeout` argument of connect(). None
+            disables it. Defaults to 60.
+        circuit_breaker_threshold (int): Consecutive failures to reach an
+            instance IP address after which connection attempts to it fail
+            right away with CircuitOpenError, instead of waiting for the dial
+            to fail. Failures raised by the database itself, such as a wrong
+            password, don't count. None disables the circuit breaker.
+            Defaults to None.
+        circuit_breaker_timeout (float): Seconds an open circuit fails
+            connection attempts before letting a single trial attempt
+            through, which closes the circuit if it reaches the instance.
+            Defaults to 30.
+        admin_api_timeout (float): Deadline in seconds of each AlloyDB Admin
+            API call. Defaults to None, which uses the API's default.
+        admin_api_hedge_percentile (float): Sends a duplicate of an AlloyDB
+            Admin API call that takes longer than this percentile of the
+            recent latencies of its method (e.g. 0.95), and uses whichever
+            answers first. Until enough latencies are recorded, calls are
+            hedged after 1 second. Defaults to None, for no hedging.
+        admin_api_transport (str | AdminAPITransport): Calls the AlloyDB
+            Admin API over gRPC ("GRPC") or REST ("REST"). REST calls don't
+            import or start gRPC and work from any event loop, at the cost of
+            a thread per call. Defaults to AdminAPITransport.GRPC.
     """
 
     def __init__(
@@ -84,6 +150,12 @@ class AsyncConnector:
         ip_type: str | IPTypes = IPTypes.PRIVATE,
         user_agent: Optional[str] = None,
         refresh_strategy: str | RefreshStrategy = RefreshStrategy.BACKGROUND,
+        timeout: Optional[float] = CONNECT_TIMEOUT,
+        circuit_breaker_threshold: Optional[int] = None,
+        circuit_breaker_timeout: float = 30.0,
+        admin_api_timeout: Optional[float] = None,
+        admin_api_hedge_percentile: Optional[float] = None,
+        admin_api_transport: str | AdminAPITransport = AdminAPITransport.GRPC,
     ) -> None:
         self._cache: dict[str, CacheTypes] = {}
         # initialize default params
@@ -99,39 +171,203 @@ class AsyncConnector:
             refresh_strategy = RefreshStrategy(refresh_strategy.upper())
         self._refresh_strategy = refresh_strategy
         self._user_agent = user_agent
+        # credentials are resolved right away when given; discovering
+        # Application Default Credentials may probe the metadata server, so
+        # it is deferred to start() or the first connection
+        self._credentials_arg = credentials
+        self._db_credentials_arg = db_credentials
+        self._credentials: Credentials
+        self._db_credentials: Credentials
+        # keeps the DB token fresh ahead of expiry for IAM database
+        # authentication
+        self._token_manager: TokenManager
+        self._credentials_resolved = False
+        if credentials is not None:
+            self._resolve_credentials()
+        # key pair of the client certificate, generated on start
+        self._keys: Optional[asyncio.Future] = None
+        # discovers credentials and generates keys, created on start
+        self._ready: Optional[asyncio.Future] = None
+        self._client: Optional[AlloyDBClient] = None
+        # the event loop the key pair, the AlloyDB Admin API client and the
+        # connection info caches belong to; connections from other loops
+        # get connection info through it
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        # whether this connector's drivers use the metadata exchange, set by
+        # the first connection attempt
+        self._use_metadata: Optional[bool] = None
+        # pools created with create_pool and their rotations
+        self._pools: list[tuple[str, Any, PoolRotation]] = []
+        self._timeout = timeout
+        if admin_api_hedge_percentile is not None and not (
+            0 < admin_api_hedge_percentile < 1
+        ):
+            raise ValueError(
+                "Arg `admin_api_hedge_percentile` must be between 0 and 1, "
+                f"got {admin_api_hedge_percentile}."
+            )
+        self._admin_api_timeout = admin_api_timeout
+        self._admin_api_hedge_percentile = admin_api_hedge_percentile
+        # if admin_api_transport is str, convert to AdminAPITransport enum
+        if isinstance(admin_api_transport, str):
+            admin_api_transport = AdminAPITransport(admin_api_transport.upper())
+        self._admin_api_transport = admin_api_transport
+        # callbacks subscribed with on_instance_change
+        self._instance_listeners = InstanceChangeListeners()
+        # errors getting connection info, to fail fast on repeated attempts
+        self._negative_cache = NegativeCache()
+        self._breakers: Optional[CircuitBreakers] = None
+        if circuit_breaker_threshold is not None:
+            self._breakers = CircuitBreakers(
+                circuit_breaker_threshold, circuit_breaker_timeout
+            )
+        self._closed = False
+
+    def _resolve_credentials(self) -> None:
+        """Sets up the credentials for the AlloyDB Admin API and the
+        database, discovering Application Default Credentials if none were
+        given. Blocking, so run in a thread unless credentials were given."""
         # initialize credentials for authenticating with AlloyDB Admin API
         scopes = ["https://www.googleapis.com/auth/cloud-platform"]
-        if credentials:
-            self._credentials = with_scopes_if_required(credentials, scopes=scopes)
+        if self._credentials_arg:
+            credentials = with_scopes_if_required(self._credentials_arg, scopes=scopes)
         # otherwise use application default credentials
         else:
-            self._credentials, _ = google.auth.default(scopes=scopes)
+            credentials, _ = google.auth.default(scopes=scopes)
         # initialize credentials for authenticating with the DB
-        if db_credentials:
-            self._db_credentials = db_credentials
+        if self._db_credentials_arg:
+            db_credentials = self._db_credentials_arg
         # otherwise use the same credentials as the one for authenticating with
         # AlloyDB Admin API
         else:
             scopes = ["https://www.googleapis.com/auth/alloydb.login"]
-            self._db_credentials = with_scopes_if_required(
-                self._credentials, scopes=scopes
+            db_credentials = with_scopes_if_required(credentials, scopes=scopes)
+        self._credentials = credentials
+        self._db_credentials = db_credentials
+        self._token_manager = TokenManager(db_credentials)
+        self._credentials_resolved = True
+
+    async def _initialize(self) -> None:
+        """Discovers credentials, generates the key pair and imports the
+        AlloyDB Admin API client concurrently."""
+        if self._keys is None:
+            self._keys = asyncio.ensure_future(generate_keys())
+        tasks: list[Awaitable[Any]] = [self._keys]
+        if self._admin_api_transport == AdminAPITransport.GRPC:
+            # importing the gRPC client takes a few hundred milliseconds
+            tasks.append(
+                asyncio.to_thread(
+                    importlib.import_module, "google.cloud.alloydb_v1beta"
+                )
             )
+        if not self._credentials_resolved:
+            tasks.append(asyncio.to_thread(self._resolve_credentials))
+        await asyncio.gather(*tasks)
 
-        # check if AsyncConnector is being initialized with event loop running
-        # Otherwise we will lazy init keys
-        self._keys: Optional[asyncio.Task] = None
-        try:
-            # Try to get the running loop before creating a task. The call here
-            # will raise a RuntimeError if no loop is running. Without calling
-            # get_running_loop, a direct call to create_task would also raise
-            # an exception but it would leak the generate_keys coroutine. To
-            # avoid leaking the coroutine, we call get_running_loop first.
-            asyncio.get_running_loop()
-            self._keys = asyncio.create_task(generate_keys())
-        except RuntimeError:
-            pass
-        self._client: Optional[AlloyDBClient] = None
-        self._closed = False
+    async def start(self, driver: Optional[str] = None) -> None:
+        """
+        Initializes the connector: discovering Application Default
+        Credentials, generating the key pair of the client certificate and
+        loading the AlloyDB Admin API client run concurrently.
+
+        Connecting starts and waits for the initialization on its own, so
+        calling start() is optional; awaiting it early, e.g. when a web app
+        starts, takes it off the first connection's latency.
+
+        Args:
+            driver (str): The database driver that will be used, to also
+                create the AlloyDB Admin API client. Optional.
+        """
+        if self._closed:
+            raise ClosedConnectorError(
+                "Start failed because the connector has already been closed."
+            )
+        await self._run_on_refresh_loop(self._start, driver)
+
+    async def _start(self, driver: Optional[str]) -> None:
+        """Initializes the connector. Runs on the refresh loop."""
+        # a failed initialization, e.g. without credentials, is retried
+        if self._ready is None or (
+            self._ready.done() and self._ready.exception() is not None
+        ):
+            self._ready = asyncio.ensure_future(self._initialize())
+        # shielded, so that a cancelled connection attempt doesn't cancel
+        # the initialization shared with the others
+        await asyncio.shield(self._ready)
+        if driver is None:
+            return
+        # the client certificate is issued either for the metadata exchange
+        # or without it, so drivers of both kinds can't share a connector
+        use_metadata = driver in _METADATA_EXCHANGE_DRIVERS
+        if self._use_metadata is None:
+            self._use_metadata = use_metadata
+        elif self._use_metadata != use_metadata:
+            raise ValueError(
+                f"Driver '{driver}' cannot be used with a connector that has "
+                "already connected with a driver that "
+                f"{'uses' if self._use_metadata else 'does not use'} "
+                "the metadata exchange. Use a separate AsyncConnector."
+            )
+        if self._client is None:
+            # lazy init client as it has to be initialized in async context
+            self._client = AlloyDBClient(
+                self._alloydb_api_endpoint,
+                self._quota_project,
+                self._credentials,
+                user_agent=self._user_agent,
+                driver=driver,
+                rpc_timeout=self._admin_api_timeout,
+                hedge_percentile=self._admin_api_hedge_percentile,
+                transport=self._admin_api_transport,
+                async_transport=True,
+            )
+
+    async def _run_on_refresh_loop(
+        self, func: Callable[..., Coroutine[Any, Any, T]], *args: Any
+    ) -> T:
+        """
+        Runs a coroutine function of the refresh pipeline on its event loop
+        and returns its result on the running loop.
+
+        The running loop becomes the refresh loop if there is none yet, or if
+        the refresh loop has stopped, e.g. when each test or asyncio.run()
+        call uses a new loop.
+        """
+        running = asyncio.get_running_loop()
+        with self._loop_lock:
+            loop = self._loop
+            if loop is not running and (
+                loop is None or loop.is_closed() or not loop.is_running()
+            ):
+                self._move_refresh_loop(running)
+                loop = running
+        if loop is running:
+            return await func(*args)
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(func(*args), loop)
+        )
+
+    def _move_refresh_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Makes the loop the refresh loop, dropping what was bound to the
+        stopped previous one. Must hold _loop_lock."""
+        if self._loop is not None:
+            logger.debug("Refresh loop stopped, refreshing on a new event loop")
+            # the key pair is kept, its future and the caches' tasks belonged
+            # to the stopped loop
+            keys = self._keys
+            self._keys = None
+            if keys is not None and keys.done() and not keys.cancelled():
+                if keys.exception() is None:
+                    self._keys = loop.create_future()
+                    self._keys.set_result(keys.result())
+            self._ready = None
+            self._cache = {}
+            # an asyncio gRPC channel is bound to the stopped loop
+            if self._client is not None and self._client.loop_bound:
+                self._client.close()
+                self._client = None
+        self._loop = loop
 
     async def connect(
         self,
@@ -150,31 +386,114 @@ class AsyncConnector:
             instance_uri (str): The instance URI of the AlloyDB instance.
                 ex. projects/<PROJECT>/locations/<REGION>/clusters/<CLUSTER>/instances/<INSTANCE>
             driver (str): A string representing the database driver to connect
-                with. Supported drivers are asyncpg.
+                with. Supported drivers are asyncpg and psycopg.
             **kwargs: Pass in any database driver-specific arguments needed
-                to fine tune connection.
+                to fine tune connection. `timeout` overrides the connector's
+                timeout for this connection attempt.
 
         Returns:
             connection: A DBAPI connection to the specified AlloyDB instance.
+
+        Raises:
+            TimeoutError: The connection attempt exceeded its timeout.
         """
         if self._closed:
             raise ClosedConnectorError(
                 "Connection attempt failed because the connector has already been closed."
             )
-        if self._keys is None:
-            self._keys = asyncio.create_task(generate_keys())
-        if self._client is None:
-            # lazy init client as it has to be initialized in async context
-            self._client = AlloyDBClient(
-                self._alloydb_api_endpoint,
-                self._quota_project,
-                self._credentials,
-                user_agent=self._user_agent,
-                driver=driver,
+        timeout = kwargs.pop("timeout", self._timeout)
+        try:
+            return await asyncio.wait_for(
+                self._connect(instance_uri, driver, _deadline(timeout), **kwargs),
+                timeout,
             )
+        except asyncio.TimeoutError as e:
+            raise TimeoutError(
+                f"['{instance_uri}']: Connection attempt timed out after {timeout}s."
+            ) from e
+
+    async def _connect(
+        self,
+        instance_uri: str,
+        driver: str,
+        deadline: Optional[float],
+        **kwargs: Any,
+    ) -> Any:
+        """Connects to an AlloyDB instance. Connections cancelled midway
+        close what they have opened."""
+        connect_func: dict[str, Callable[..., Awaitable[Any]]] = {
+            "asyncpg": asyncpg.connect,
+            "psycopg": psycopg.connect_async,
+        }
+        # only accept supported database drivers
+        try:
+            connector = connect_func[driver]
+        except KeyError:
+            raise ValueError(f"Driver '{driver}' is not a supported database driver.")
+
+        await self.start(driver)
 
         enable_iam_auth = kwargs.pop("enable_iam_auth", self._enable_iam_auth)
+        ip_type: str | IPTypes = kwargs.pop("ip_type", self._ip_type)
+        # if ip_type is str, convert to IPTypes enum
+        if isinstance(ip_type, str):
+            ip_type = IPTypes(ip_type.upper())
+        # fail fast with a remembered error getting the connection info,
+        # without calling the AlloyDB API again
+        self._negative_cache.check(instance_uri, ip_type)
+
+        # Host and ssl options come from the certificates and instance IP
+        # address so we don't want the user to specify them.
+        kwargs.pop("host", None)
+        kwargs.pop("ssl", None)
+        kwargs.pop("port", None)
+
+        # get connection info for AlloyDB instance
+        try:
+            conn_info = await self._run_on_refresh_loop(
+                self._connect_info, instance_uri
+            )
+            ip_address = conn_info.get_preferred_ip(ip_type)
+        except Exception as e:
+            # with an error from AlloyDB API call or IP type, remember the
+            # error, invalidate the cache and re-raise the error
+            self._negative_cache.record(instance_uri, ip_type, e)
+            await self._run_on_refresh_loop(self._remove_cached, instance_uri)
+            raise
+        self._negative_cache.clear(instance_uri, ip_type)
+        logger.debug(f"['{instance_uri}']: Connecting to {ip_address}:5433")
 
+        if enable_iam_auth:
+            self._token_manager.start(self._loop)  # type: ignore[arg-type]
+        # an open circuit fails fast, without refreshing the connection info
+        with _attempt(self._breakers, instance_uri, ip_address):
+            try:
+                ctx = await conn_info.create_ssl_context()
+                if self._use_metadata:
+                    # the metadata exchange carries the IAM token, if any
+                    remote = await self._metadata_exchange(
+                        instance_uri, ip_address, ctx, enable_iam_auth
+                    )
+                    return await connector(
+                        remote, timeout=_remaining(deadline), **kwargs
+                    )
+                # if enable_iam_auth is set, use auth token as database password
+                if enable_iam_auth:
+                    kwargs["password"] = self._token_manager.token_async
+                return await connector(
+                    ip_address, ctx, timeout=_remaining(deadline), **kwargs
+                )
+            except Exception as e:
+                # only force a refresh if a new certificate or IP address
+                # could help, then throw the error
+                if _refresh_may_help(e):
+                    await self._run_on_refresh_loop(self._force_refresh, instance_uri)
+                raise
+
+    async def _connect_info(self, instance_uri: str) -> ConnectionInfo:
+        """Returns the instance's connection info from its cache, creating
+        the cache if needed. Runs on the refresh loop."""
+        assert self._client is not None and self._keys is not None
         # use existing connection info if possible
         if instance_uri in self._cache:
             cache = self._cache[instance_uri]
@@ -183,74 +502,347 @@ class AsyncConnector:
                 logger.debug(
                     f"['{instance_uri}']: Refresh strategy is set to lazy refresh"
                 )
-                cache = LazyRefreshCache(instance_uri, self._client, self._keys)
+                cache = LazyRefreshCache(
+                    instance_uri,
+                    self._client,
+                    self._keys,
+                    on_change=self._instance_listeners.notify,
+                )
             else:
                 logger.debug(
                     f"['{instance_uri}']: Refresh strategy is set to background refresh"
                 )
-                cache = RefreshAheadCache(instance_uri, self._client, self._keys)
+                cache = RefreshAheadCache(
+                    instance_uri,
+                    self._client,
+                    self._keys,
+                    on_change=self._instance_listeners.notify,
+                )
             self._cache[instance_uri] = cache
             logger.debug(f"['{instance_uri}']: Connection info added to cache")
+        return await cache.connect_info()
 
-        connect_func = {
-            "asyncpg": asyncpg.connect,
-        }
-        # only accept supported database drivers
-        try:
-            connector = connect_func[driver]
-        except KeyError:
-            raise ValueError(f"Driver '{driver}' is not a supported database driver.")
+    async def _cached_info(self, instance_uri: str) -> Optional[ConnectionInfo]:
+        """Returns the instance's connection info if it is cached. Runs on
+        the refresh loop."""
+        cache = self._cache.get(instance_uri)
+        if cache is None:
+            return None
+        return await cache.connect_info()
 
-        # Host and ssl options come from the certificates and instance IP
-        # address so we don't want the user to specify them.
-        kwargs.pop("host", None)
-        kwargs.pop("ssl", None)
-        kwargs.pop("port", None)
+    async def _force_refresh(self, instance_uri: str) -> None:
+        """Refreshes the instance's connection info right away, if it is
+        cached. Runs on the refresh loop."""
+        cache = self._cache.get(instance_uri)
+        if cache is not None:
+            await cache.force_refresh()
 
-        # get connection info for AlloyDB instance
-        ip_type: str | IPTypes = kwargs.pop("ip_type", self._ip_type)
-        # if ip_type is str, convert to IPTypes enum
+    async def create_pool(
+        self,
+        instance_uri: str,
+        driver: str = "asyncpg",
+        min_size: int = 10,
+        max_size: int = 10,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Creates a connection pool whose connections are made through the
+        connector.
+
+        The pool fills up to min_size concurrently, with all connections
+        sharing the cached connection info and SSL context. Pooled
+        connections are recycled shortly before the client certificate they
+        were made with expires, and as soon as a new connection finds that
+        the instance's IP address has changed.
+
+        Args:
+            instance_uri (str): The instance URI of the AlloyDB instance.
+                ex. projects/<PROJECT>/locations/<REGION>/clusters/<CLUSTER>/instances/<INSTANCE>
+            driver (str): The database driver of the pool's connections.
+                "asyncpg" creates an asyncpg.Pool and "psycopg" a
+                psycopg_pool.AsyncConnectionPool. Defaults to "asyncpg".
+            min_size (int): Number of connections the pool is initialized
+                with. Defaults to 10.
+            max_size (int): Maximum number of connections in the pool.
+                Defaults to 10.
+            **kwargs: Arguments for asyncpg.create_pool (e.g.
+                max_inactive_connection_lifetime, init, setup) or
+                psycopg_pool.AsyncConnectionPool (e.g. max_idle, configure,
+                max_lifetime); all others are passed to connect() for each
+                connection, including user, password, db, ip_type and
+                enable_iam_auth.
+
+        Returns:
+            asyncpg.Pool | psycopg_pool.AsyncConnectionPool: An open
+                connection pool. An asyncpg pool is initialized with
+                min_size connections, a psycopg pool fills up in the
+                background. It is closed together with the connector if still
+                open.
+        """
+        if self._closed:
+            raise ClosedConnectorError(
+                "Pool creation failed because the connector has already been closed."
+            )
+        if driver not in ("asyncpg", "psycopg"):
+            raise ValueError(f"Driver '{driver}' is not a supported database driver.")
+        ip_type: str | IPTypes = kwargs.get("ip_type", self._ip_type)
         if isinstance(ip_type, str):
             ip_type = IPTypes(ip_type.upper())
+        max_lifetime = kwargs.pop("max_lifetime", 3600.0)
+        pool: Any = None
+
+        def recycle() -> Any:
+            if pool is None:
+                return None
+            # asyncpg replaces expired connections when next released or
+            # acquired, psycopg_pool right away
+            if driver == "asyncpg":
+                return pool.expire_connections()
+            return pool.drain()
+
+        pool_loop = asyncio.get_running_loop()
+        rotation = PoolRotation(instance_uri, recycle, pool_loop)
+
+        def instance_changed(change: InstanceChange) -> None:
+            # changes are reported on the refresh loop, which may not be the
+            # pool's
+            if asyncio.get_running_loop() is pool_loop:
+                rotation.instance_changed(change)
+            elif not pool_loop.is_closed():
+                pool_loop.call_soon_threadsafe(rotation.instance_changed, change)
+
+        # recycle right away when the instance moves to another IP address
+        self.on_instance_change(instance_changed)
+
+        async def connect(*args: Any, **connect_kwargs: Any) -> Any:
+            # asyncpg passes its (unused) dsn and the deprecated loop with
+            # every call
+            connect_kwargs.pop("loop", None)
+            conn = await self.connect(instance_uri, driver, **connect_kwargs)
+            conn_info = await self._run_on_refresh_loop(self._cached_info, instance_uri)
+            if conn_info is not None:
+                rotation.observe(conn_info, conn_info.get_preferred_ip(ip_type))
+                if driver == "psycopg":
+                    # psycopg_pool sets the connection's expiry date when
+                    # this returns
+                    pool.max_lifetime = _max_lifetime(
+                        conn_info.expiration, max_lifetime
+                    )
+            return conn
+
         try:
-            conn_info = await cache.connect_info()
-            ip_address = conn_info.get_preferred_ip(ip_type)
-        except Exception:
-            # with an error from AlloyDB API call or IP type, invalidate the
-            # cache and re-raise the error
-            await self._remove_cached(instance_uri)
+            if driver == "asyncpg":
+                pool = await asyncpg.create_pool(
+                    connect, min_size=min_size, max_size=max_size, **kwargs
+                )
+            else:
+                pool = psycopg.create_async_pool(
+                    connect,
+                    min_size=min_size,
+                    max_size=max_size,
+                    max_lifetime=max_lifetime,
+                    **kwargs,
+                )
+                await pool.open()
+        except BaseException:
+            rotation.close()
             raise
-        logger.debug(f"['{instance_uri}']: Connecting to {ip_address}:5433")
+        self._pools.append((instance_uri, pool, rotation))
+        return pool
+
+    def on_instance_change(
+        self, callback: Callable[[InstanceChange], Any]
+    ) -> Callable[[], None]:
+        """
+        Subscribes a callback to changes of the connection info of the
+        instances connected to.
+
+        The callback is called with an InstanceChange after a refresh
+        returns different IP addresses (e.g. on failover or a PSC endpoint
+        change) or a new client certificate. It runs on the event loop; it
+        may return an awaitable, which is run as a task there. Pools created
+        with create_pool already recycle their connections when the IP
+        address they connect to goes away.
+
+        Args:
+            callback (Callable): Called with the InstanceChange.
+
+        Returns:
+            Callable: Unsubscribes the callback.
+        """
+        return self._instance_listeners.add(callback)
+
+    def admin_api_stats(self) -> list[dict[str, Any]]:
+        """
+        Returns the calls made to the AlloyDB Admin API.
+
+        Returns:
+            list[dict]: For each API method, its name, number of calls,
+                number of hedged calls, how many of those the duplicate
+                answered first, and the current hedge delay in seconds.
+                Empty before the first connection attempt.
+        """
+        if self._client is None:
+            return []
+        return self._client.stats()
+
+    def stats(self) -> list[dict[str, Any]]:
+        """
+        Returns the state and refresh schedule of the connection info caches.
+
+        Returns:
+            list[dict]: For each cached instance, its instance URI, refresh
+                strategy ("BACKGROUND", "LAZY" or "STATIC"), certificate
+                expiration and IP addresses, whether the SSL context is
+                built, the time of the next refresh, the duration, outcome
+                ("success" or "failure") and error of the last refresh, the
+                consecutive failed refreshes, whether stale connection info
+                is served and how often, the refresh rate limiter's available
+                tokens (None without one) and the number of open psycopg
+                proxy connections to the instance's IP addresses. Times are
+                UTC datetimes; those not known yet are None.
+        """
+        return [
+            _instance_stats(instance_uri, cache)
+            for instance_uri, cache in list(self._cache.items())
+        ]
+
+    def cache_stats(self) -> list[dict[str, Any]]:
+        """
+        Returns the state of the connection info caches.
+
+        Returns:
+            list[dict]: For each cached instance, its instance URI, whether
+                its connection info is served stale because refreshing it
+                fails, and how many times stale connection info was served.
+        """
+        return [
+            {
+                "instance_uri": instance_uri,
+                "serving_stale": cache.serving_stale,
+                "stale_served": cache.stale_served,
+            }
+            for instance_uri, cache in list(self._cache.items())
+        ]
+
+    def pool_stats(self) -> list[dict[str, Any]]:
+        """
+        Returns the state of the pools created with create_pool.
+
+        Returns:
+            list[dict]: For each pool, its instance URI, current, idle,
+                minimum and maximum size, the IP address and certificate
+                expiration of its newest connection, and how many times its
+                connections were recycled and why.
+        """
+        return [
+            _pool_stats(instance_uri, pool, rotation)
+            for instance_uri, pool, rotation in self._pools
+        ]
+
+    def circuit_breaker_stats(self) -> list[dict[str, Any]]:
+        """
+        Returns the state of the circuit breakers.
+
+        Returns:
+            list[dict]: For each instance IP address connected to, its
+                instance URI, IP address, circuit state ("closed", "open" or
+                "half-open"), consecutive failures, and how many times the
+                circuit opened and turned down connection attempts. Empty if
+                the circuit breaker is disabled.
+        """
+        if self._breakers is None:
+            return []
+        return self._breakers.stats()
+
+    async def _metadata_exchange(
+        self,
+        instance_uri: str,
+        ip_address: str,
+        ctx: ssl.SSLContext,
+        enable_iam_auth: bool,
+    ) -> AsyncProxyProtocol:
+        """
+        Dials the AlloyDB proxy server on the running event loop and sends
+        metadata about the connection prior to the database protocol taking
+        over.
 
-        # callable to be used for auto IAM authn
-        async def get_authentication_token() -> str:
-            """Get OAuth2 access token to be used for IAM database authentication"""
-            # refresh credentials if expired
-            if not self._db_credentials.valid:
-                request = google.auth.transport.requests.Request()
-                await asyncio.to_thread(self._db_credentials.refresh, request)
-            return self._db_credentials.token
+        The exchange is the same as Connector.metadata_exchange, done with
+        non-blocking I/O.
 
-        # if enable_iam_auth is set, use auth token as database password
+        Args:
+            ip_address (str): IP address of AlloyDB instance to connect to.
+            ctx (ssl.SSLContext): Context used to create a TLS connection
+                with AlloyDB instance ssl certificates.
+            enable_iam_auth (bool): Flag to enable IAM database authentication.
+
+        Returns:
+            AsyncProxyProtocol: Protocol of the mTLS/SSL connection to the
+                AlloyDB proxy server.
+        """
+        # set auth type for metadata exchange
+        # the metadata exchange messages are imported on first use, as
+        # drivers that don't use it shouldn't pay for importing them
+        import google.cloud.alloydb_connectors_v1.proto.resources_pb2 as connectorspb
+
+        auth_type = connectorspb.MetadataExchangeRequest.DB_NATIVE
         if enable_iam_auth:
-            kwargs["password"] = get_authentication_token
+            auth_type = connectorspb.MetadataExchangeRequest.AUTO_IAM
+
+        payload = await self._token_manager.metadata_exchange_request_async(
+            f"{self._client._user_agent}",  # type: ignore
+            auth_type,
+        )
+        logger.debug(f"['{instance_uri}']: Metadata exchange started")
+
+        loop = asyncio.get_running_loop()
+        _, protocol = await asyncio.wait_for(
+            loop.create_connection(
+                AsyncProxyProtocol,
+                ip_address,
+                SERVER_PROXY_PORT,
+                ssl=ctx,
+                server_hostname=ip_address,
+            ),
+            IO_TIMEOUT,
+        )
         try:
-            return await connector(
-                ip_address, await conn_info.create_ssl_context(), **kwargs
+            protocol.write(payload)
+            # read metadata message length (4 bytes), then the message
+            message_len_buffer = await asyncio.wait_for(
+                protocol.read_exactly(struct.Struct(">I").size), IO_TIMEOUT
             )
-        except Exception:
-            # we attempt a force refresh, then throw the error
-            await cache.force_refresh()
+            (message_len,) = struct.unpack(">I", message_len_buffer)
+            buffer = await asyncio.wait_for(
+                protocol.read_exactly(message_len), IO_TIMEOUT
+            )
+        except asyncio.IncompleteReadError:
+            protocol.close()
+            raise RuntimeError("Connection closed while performing metadata exchange!")
+        except BaseException:
+            protocol.close()
             raise
 
+        resp = connectorspb.MetadataExchangeResponse()
+        resp.ParseFromString(buffer)
+        # validate metadata exchange response
+        if resp.response_code != connectorspb.MetadataExchangeResponse.OK:
+            protocol.close()
+            raise MetadataExchangeError(
+                f"Metadata Exchange request has failed with error: {resp.error}"
+            )
+        return protocol
+
     async def _remove_cached(self, instance_uri: str) -> None:
         """Stops all background refreshes and deletes the connection
         info cache from the map of caches.
         """
         logger.debug(f"['{instance_uri}']: Removing connection info from cache")
-        # remove cache from stored caches and close it
-        cache = self._cache.pop(instance_uri)
-        await cache.close()
+        # remove cache from stored caches and close it; connections from
+        # another loop may have removed it already
+        cache = self._cache.pop(instance_uri, None)
+        if cache is not None:
+            await cache.close()
 
     async def __aenter__(self) -> AsyncConnector:
         """Enter async context manager by returning Connector object"""
@@ -268,5 +860,35 @@ class AsyncConnector:
     async def close(self) -> None:
         """Helper function to cancel RefreshAheadCaches' tasks
         and close client."""
-        await asyncio.gather(*[cache.close() for cache in self._cache.values()])
+        running = asyncio.get_running_loop()
+        for _, pool, rotation in self._pools:
+            rotation.close()
+            # connections can't be opened once the connector is closed;
+            # pools are closed on the loop they were created on
+            if rotation.loop is running:
+                await _close_pool(pool)
+            elif rotation.loop.is_running():
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(_close_pool(pool), rotation.loop)
+                )
+        await self._run_on_refresh_loop(self._close_refresh_pipeline)
         self._closed = True
+
+    async def _close_refresh_pipeline(self) -> None:
+        """Closes the caches, the client and the token manager. Runs on the
+        refresh loop."""
+        if self._credentials_resolved:
+            await self._token_manager.close_async()
+        await asyncio.gather(*[cache.close() for cache in self._cache.values()])
+        if self._client is not None:
+            self._client.close()
+
+
+async def _close_pool(pool: Any) -> None:
+    """Closes a pool created with create_pool, on its event loop."""
+    if hasattr(pool, "terminate"):
+        # asyncpg.Pool
+        if not pool.is_closing():
+            pool.terminate()
+    elif not pool.closed:
+        await pool.close()
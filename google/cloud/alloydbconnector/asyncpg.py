@@ -15,6 +15,8 @@
 import ssl
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Awaitable
+from typing import Callable
 
 SERVER_PROXY_PORT = 5433
 
@@ -62,3 +64,28 @@ async def connect(
         direct_tls=True,
         **kwargs,
     )
+
+
+async def create_pool(
+    connect: Callable[..., Awaitable["asyncpg.Connection"]], **kwargs: Any
+) -> "asyncpg.Pool":
+    """Helper function to create an asyncpg connection pool.
+
+    :type connect: Callable
+    :param connect: Coroutine function used by the pool to open each
+        connection.
+
+    :type kwargs: Any
+    :param kwargs: Keyword arguments for asyncpg.create_pool. Arguments
+        not used by the pool are passed on to ``connect``.
+
+    :rtype: asyncpg.Pool
+    :returns: An initialized asyncpg.Pool.
+    """
+    try:
+        import asyncpg
+    except ImportError:
+        raise ImportError(
+            'Unable to import module "asyncpg." Please install and try again.'
+        )
+    return await asyncpg.create_pool(connect=connect, **kwargs)
@@ -0,0 +1,95 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import inspect
+import threading
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Optional
+
+if TYPE_CHECKING:
+    from google.auth.transport import Request
+
+# connections kept open to each host, enough for the refreshes of the
+# connectors of a process to run concurrently
+_POOL_MAXSIZE = 10
+
+_lock = threading.Lock()
+_request: Optional[Request] = None
+
+
+def sync_request() -> Request:
+    """
+    Returns the process-wide transport used to refresh credentials.
+
+    The transport is backed by a single requests.Session, so refreshes reuse
+    the connections to the token endpoint instead of opening a new session
+    and TLS connection each time. requests and google-auth's requests
+    transport are imported on first use, as importing them is slow.
+    """
+    global _request
+    with _lock:
+        if _request is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            from google.auth.transport import requests as auth_requests
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=_POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _request = auth_requests.Request(session=session)
+        return _request
+
+
+def is_async_credentials(credentials: Any) -> bool:
+    """Whether the credentials refresh with a coroutine, e.g. those of
+    google.auth's _default_async, which use an async HTTP transport."""
+    return inspect.iscoroutinefunction(getattr(credentials, "refresh", None))
+
+
+class AsyncRequest:
+    """
+    An aiohttp session for refreshing async credentials, opened on first
+    use on the event loop it's used from.
+
+    aiohttp sessions are bound to an event loop, so an AsyncRequest must
+    only be used from a single loop, and closed on it.
+    """
+
+    def __init__(self) -> None:
+        self._request: Any = None
+        self._session: Any = None
+
+    def get(self) -> Any:
+        """Returns the google-auth aiohttp transport, opening its session
+        if needed. Must be called on the event loop."""
+        if self._request is None:
+            import aiohttp
+
+            from google.auth.transport import _aiohttp_requests
+
+            # google-auth's aiohttp transport decompresses responses itself
+            self._session = aiohttp.ClientSession(auto_decompress=False)
+            self._request = _aiohttp_requests.Request(session=self._session)
+        return self._request
+
+    async def close(self) -> None:
+        """Closes the session, if it was opened."""
+        session, self._session, self._request = self._session, None, None
+        if session is not None:
+            await session.close()
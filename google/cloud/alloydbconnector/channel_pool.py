@@ -0,0 +1,170 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Optional
+
+if TYPE_CHECKING:
+    from google.auth.credentials import Credentials
+
+logger = logging.getLogger(name=__name__)
+
+# seconds an unused channel is kept open, so that a connector created right
+# after another one was closed reuses its channel
+_IDLE_TIMEOUT = 300
+# keepalive pings keep idle channels usable between refreshes (~every 50
+# minutes). 5 minutes is the shortest interval servers accept by default
+# without calls in flight.
+CHANNEL_OPTIONS = [
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+    ("grpc.keepalive_time_ms", 300_000),
+    ("grpc.keepalive_timeout_ms", 20_000),
+    ("grpc.keepalive_permit_without_calls", 1),
+]
+
+
+class _Channel:
+    """A pooled channel and the clients using it."""
+
+    def __init__(self, channel: Any, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        self.channel = channel
+        # the event loop an asyncio channel is bound to
+        self.loop = loop
+        self.refs = 0
+        self.idle_since = 0.0
+
+    def usable(self) -> bool:
+        return self.loop is None or not self.loop.is_closed()
+
+    def close(self) -> None:
+        """Closes the channel. A channel bound to an event loop is closed
+        on its loop, unless the loop is already closed."""
+        if self.loop is None:
+            self.channel.close()
+            return
+        if self.loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            task = self.loop.create_task(self.channel.close())
+            _closing.add(task)
+            task.add_done_callback(_closing.discard)
+        elif self.loop.is_running():
+            asyncio.run_coroutine_threadsafe(self.channel.close(), self.loop)
+
+
+_lock = threading.Lock()
+_channels: dict[Hashable, _Channel] = {}
+_closing: set[asyncio.Task] = set()
+
+
+def _credentials_key(credentials: Credentials) -> Hashable:
+    """
+    Returns a key identifying what the credentials authenticate as.
+
+    google.auth.default() returns new credentials for each connector, so
+    credentials of the same type for the same account and scopes share a
+    key; others are told apart by identity.
+    """
+    account = getattr(credentials, "service_account_email", None) or getattr(
+        credentials, "refresh_token", None
+    )
+    if account is None:
+        return id(credentials)
+    scopes = getattr(credentials, "scopes", None) or ()
+    return (type(credentials), account, tuple(scopes))
+
+
+def _purge(now: float) -> list[_Channel]:
+    """Removes the channels unused for longer than the idle timeout or whose
+    event loop is closed, returning them to be closed. Must hold _lock."""
+    expired = [
+        key
+        for key, entry in _channels.items()
+        if not entry.usable()
+        or (entry.refs == 0 and now - entry.idle_since > _IDLE_TIMEOUT)
+    ]
+    return [_channels.pop(key) for key in expired]
+
+
+def acquire_channel(
+    endpoint: str,
+    credentials: Credentials,
+    quota_project: Optional[str],
+    create: Callable[[], Any],
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> tuple[Hashable, Any]:
+    """
+    Returns the shared gRPC channel to the endpoint for the credentials and
+    quota project, creating it if there is none, and adds a reference to it.
+
+    Args:
+        endpoint (str): The host and port of the AlloyDB API.
+        credentials (google.auth.credentials.Credentials): The credentials
+            the channel authenticates with.
+        quota_project (str): The quota project of the channel's calls.
+        create (Callable): Creates the channel.
+        loop (asyncio.AbstractEventLoop): The event loop an asyncio channel
+            is bound to. None for a sync channel.
+
+    Returns:
+        tuple: The key to release the channel with, and the channel.
+    """
+    key = (endpoint, _credentials_key(credentials), quota_project, loop)
+    with _lock:
+        stale = _purge(time.monotonic())
+        entry = _channels.get(key)
+        if entry is None:
+            logger.debug(f"Creating gRPC channel to {endpoint}")
+            entry = _Channel(create(), loop)
+            _channels[key] = entry
+        entry.refs += 1
+        channel = entry.channel
+    for e in stale:
+        e.close()
+    return key, channel
+
+
+def release_channel(key: Hashable) -> None:
+    """Removes a reference to a shared channel. The channel stays open for
+    reuse until it has been unused for the idle timeout."""
+    now = time.monotonic()
+    with _lock:
+        entry = _channels.get(key)
+        if entry is not None:
+            entry.refs -= 1
+            if entry.refs == 0:
+                entry.idle_since = now
+        stale = _purge(now)
+    for e in stale:
+        e.close()
+
+
+def channel_count() -> int:
+    """Returns the number of open shared channels."""
+    with _lock:
+        return len(_channels)
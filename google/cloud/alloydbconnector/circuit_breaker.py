@@ -0,0 +1,226 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import AbstractContextManager
+from contextlib import nullcontext
+import logging
+import threading
+import time
+from types import TracebackType
+from typing import Any
+from typing import Optional
+
+from google.cloud.alloydbconnector.exceptions import CircuitOpenError
+
+logger = logging.getLogger(name=__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+def _is_dial_failure(e: BaseException) -> bool:
+    """Returns whether a connection attempt failed to reach the instance,
+    as opposed to being turned down by it."""
+    # includes refused and timed out connections and TLS errors
+    return isinstance(e, OSError)
+
+
+class CircuitBreaker:
+    """
+    Stops connection attempts to an unreachable instance IP address.
+
+    The circuit opens after failure_threshold consecutive dial failures.
+    While open, attempts fail right away with CircuitOpenError. After
+    reset_timeout seconds the circuit is half-open: a single trial attempt
+    is let through and closes the circuit if it reaches the instance, or
+    opens it again if it doesn't.
+
+    Every attempt let through by acquire() must be followed by
+    record_success() or record_failure(). Used as a context manager, the
+    breaker does both around an attempt: an attempt that raises a dial
+    failure or is cancelled counts as a failure.
+
+    Args:
+        name (str): Name used in errors and logs.
+        failure_threshold (int): Consecutive dial failures that open the
+            circuit.
+        reset_timeout (float): Seconds the circuit stays open before a
+            trial attempt.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float) -> None:
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial = False
+        # times the circuit opened and attempts it turned down
+        self.opens = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and self._retry_in() <= 0:
+                return HALF_OPEN
+            return self._state
+
+    def _retry_in(self) -> float:
+        return self._opened_at + self._reset_timeout - time.monotonic()
+
+    def acquire(self) -> None:
+        """
+        Lets a connection attempt through, or raises CircuitOpenError.
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return
+            if self._state == OPEN:
+                retry_in = self._retry_in()
+                if retry_in > 0:
+                    self.rejected += 1
+                    raise CircuitOpenError(
+                        f"['{self._name}']: Circuit is open after repeated "
+                        f"connection failures; retrying in {retry_in:.1f}s."
+                    )
+                self._state = HALF_OPEN
+                self._trial = False
+            # half-open: only a single trial at a time
+            if self._trial:
+                self.rejected += 1
+                raise CircuitOpenError(
+                    f"['{self._name}']: Circuit is half-open and a trial "
+                    "connection is in progress."
+                )
+            self._trial = True
+
+    def record_success(self) -> None:
+        """Records an attempt that reached the instance."""
+        with self._lock:
+            if self._state != CLOSED:
+                logger.debug(f"['{self._name}']: Circuit closed")
+            self._state = CLOSED
+            self._failures = 0
+            self._trial = False
+
+    def record_failure(self) -> bool:
+        """
+        Records an attempt that failed to reach the instance.
+
+        Returns:
+            bool: True if the circuit opened.
+        """
+        with self._lock:
+            self._trial = False
+            self._failures += 1
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED and self._failures >= self._failure_threshold
+            ):
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self.opens += 1
+                logger.debug(
+                    f"['{self._name}']: Circuit opened after {self._failures} "
+                    "consecutive connection failures"
+                )
+                return True
+            return False
+
+    def __enter__(self) -> CircuitBreaker:
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        if exc_val is not None and (
+            _is_dial_failure(exc_val) or isinstance(exc_val, asyncio.CancelledError)
+        ):
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def stats(self) -> dict[str, Any]:
+        """Returns the state of the circuit."""
+        state = self.state
+        with self._lock:
+            return {
+                "state": state,
+                "failures": self._failures,
+                "opens": self.opens,
+                "rejected": self.rejected,
+            }
+
+
+class CircuitBreakers:
+    """
+    The circuit breakers of a connector, one per instance and IP address.
+
+    Args:
+        failure_threshold (int): Consecutive dial failures that open a
+            circuit.
+        reset_timeout (float): Seconds a circuit stays open before a trial
+            attempt.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        if failure_threshold < 1:
+            raise ValueError(
+                f"Arg `circuit_breaker_threshold` must be at least 1, got {failure_threshold}."
+            )
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._breakers: dict[tuple[str, str], CircuitBreaker] = {}
+
+    def get(self, instance_uri: str, ip_address: str) -> CircuitBreaker:
+        """Returns the circuit breaker for an instance IP address."""
+        key = (instance_uri, ip_address)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers.setdefault(
+                key,
+                CircuitBreaker(
+                    f"{instance_uri} ({ip_address})",
+                    self._failure_threshold,
+                    self._reset_timeout,
+                ),
+            )
+        return breaker
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Returns the state of every circuit."""
+        return [
+            {"instance_uri": instance_uri, "ip_address": ip_address, **breaker.stats()}
+            for (instance_uri, ip_address), breaker in list(self._breakers.items())
+        ]
+
+
+def _attempt(
+    breakers: Optional[CircuitBreakers], instance_uri: str, ip_address: str
+) -> AbstractContextManager:
+    """Returns the context guarding a connection attempt to an instance IP
+    address, which does nothing if the connector has no circuit breakers."""
+    if breakers is None:
+        return nullcontext()
+    return breakers.get(instance_uri, ip_address)
@@ -15,30 +15,45 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from datetime import timedelta
+import inspect
 import logging
+import time
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Hashable
 from typing import Optional
 from typing import Union
 
-from cryptography import x509
-
-from google.api_core.client_options import ClientOptions
-from google.api_core.gapic_v1.client_info import ClientInfo
 from google.auth.credentials import TokenState
-from google.auth.transport import requests
-import google.cloud.alloydb_v1beta as v1beta
+from google.cloud.alloydbconnector.auth_transport import sync_request
+from google.cloud.alloydbconnector.channel_pool import CHANNEL_OPTIONS
+from google.cloud.alloydbconnector.channel_pool import acquire_channel
+from google.cloud.alloydbconnector.channel_pool import release_channel
 from google.cloud.alloydbconnector.connection_info import ConnectionInfo
+from google.cloud.alloydbconnector.enums import AdminAPITransport
+from google.cloud.alloydbconnector.rest_client import AlloyDBRestClient
 from google.cloud.alloydbconnector.version import __version__ as version
-from google.protobuf import duration_pb2
 
+# the AlloyDB API client library and x509 are imported on first use, as they take longer to import than the rest of the
+# connector
 if TYPE_CHECKING:
     from google.auth.credentials import Credentials
+    import google.cloud.alloydb_v1beta as v1beta
 
 USER_AGENT: str = f"alloydb-python-connector/{version}"
 API_VERSION: str = "v1beta"
 
 logger = logging.getLogger(name=__name__)
 
+# seconds before hedging a call until enough latencies are recorded to
+# compute the percentile
+_INITIAL_HEDGE_DELAY = 1.0
+_MIN_HEDGE_SAMPLES = 10
+_MAX_HEDGE_SAMPLES = 100
+
 
 def _format_user_agent(
     driver: Optional[str],
@@ -54,6 +69,24 @@ def _format_user_agent(
     return agent
 
 
+class _RpcStats:
+    """Latencies and hedges of an AlloyDB API method."""
+
+    def __init__(self) -> None:
+        self.latencies: deque[float] = deque(maxlen=_MAX_HEDGE_SAMPLES)
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def hedge_delay(self, percentile: float) -> float:
+        """Returns the seconds after which a call is hedged: the given
+        percentile of the recent latencies."""
+        if len(self.latencies) < _MIN_HEDGE_SAMPLES:
+            return _INITIAL_HEDGE_DELAY
+        latencies = sorted(self.latencies)
+        return latencies[min(int(len(latencies) * percentile), len(latencies) - 1)]
+
+
 class AlloyDBClient:
     def __init__(
         self,
@@ -63,6 +96,10 @@ class AlloyDBClient:
         client: Optional[v1beta.AlloyDBAdminAsyncClient] = None,
         driver: Optional[str] = None,
         user_agent: Optional[str] = None,
+        async_transport: bool = False,
+        rpc_timeout: Optional[float] = None,
+        hedge_percentile: Optional[float] = None,
+        transport: str | AdminAPITransport = AdminAPITransport.GRPC,
     ) -> None:
         """
         Establish the client to be used for AlloyDB API requests.
@@ -84,9 +121,96 @@ class AlloyDBClient:
             user_agent (str): The custom user-agent string to use in the HTTP
                 header when making requests to AlloyDB APIs.
                 Optional, defaults to None and uses a pre-defined one.
+            async_transport (bool): Always use the async gRPC transport,
+                regardless of driver. Used by the AsyncConnector, whose calls
+                are all made from its refresh loop.
+            rpc_timeout (float): Deadline in seconds of each AlloyDB API
+                call. Optional, defaults to None and uses the API's default.
+            hedge_percentile (float): Sends a duplicate of a call that takes
+                longer than this percentile of the method's recent latencies
+                (e.g. 0.95), and uses whichever answers first. Until enough
+                latencies are recorded, calls are hedged after 1 second.
+                Optional, defaults to None for no hedging.
+            transport (str | AdminAPITransport): Calls the AlloyDB API over
+                gRPC ("GRPC") or REST ("REST"). REST calls are made in a
+                thread, without importing gRPC. async_transport only applies
+                to gRPC. Defaults to AdminAPITransport.GRPC.
         """
+        if hedge_percentile is not None and not 0 < hedge_percentile < 1:
+            raise ValueError(
+                "Arg `hedge_percentile` must be between 0 and 1, "
+                f"got {hedge_percentile}."
+            )
+        if isinstance(transport, str):
+            transport = AdminAPITransport(transport.upper())
         user_agent = _format_user_agent(driver, user_agent)
 
+        self._client: Any
+        # the key of the pooled channel this client uses
+        self._channel_key: Optional[Hashable] = None
+        if client:
+            self._client = client
+            self._sync_client = not inspect.iscoroutinefunction(
+                client.get_connection_info
+            )
+        elif transport == AdminAPITransport.REST:
+            # blocking calls, made in a thread from any event loop
+            self._client = AlloyDBRestClient(
+                alloydb_api_endpoint,
+                API_VERSION,
+                credentials,
+                quota_project,
+                user_agent,
+            )
+            self._sync_client = True
+        else:
+            self._sync_client = not async_transport and driver in (
+                "pg8000",
+                "psycopg",
+            )
+            self._client = self._grpc_client(
+                alloydb_api_endpoint,
+                quota_project,
+                credentials,
+                user_agent,
+                use_asyncio=not self._sync_client,
+            )
+        self._credentials = credentials
+        # asyncpg does not currently support using metadata exchange
+        # only use metadata exchange for pg8000 and psycopg drivers
+        use_metadata = True
+        if driver in ("asyncpg", None):
+            use_metadata = False
+
+        self._use_metadata = use_metadata
+        self._user_agent = user_agent
+        self._rpc_timeout = rpc_timeout
+        self._hedge_percentile = hedge_percentile
+        self._rpc_stats = {
+            "get_connection_info": _RpcStats(),
+            "generate_client_certificate": _RpcStats(),
+        }
+
+    def _grpc_client(
+        self,
+        alloydb_api_endpoint: str,
+        quota_project: Optional[str],
+        credentials: Credentials,
+        user_agent: str,
+        use_asyncio: bool,
+    ) -> Union[v1beta.AlloyDBAdminClient, v1beta.AlloyDBAdminAsyncClient]:
+        """Creates the generated AlloyDB API client over a pooled gRPC
+        channel."""
+        from google.api_core.client_options import ClientOptions
+        from google.api_core.gapic_v1.client_info import ClientInfo
+        import google.cloud.alloydb_v1beta as v1beta
+        from google.cloud.alloydb_v1beta.services.alloy_db_admin import transports
+
+        client_options = ClientOptions(
+            api_endpoint=alloydb_api_endpoint,
+            quota_project_id=quota_project,
+        )
+        client_info = ClientInfo(user_agent=user_agent)
         # TODO(rhatgadkar-goog): Rollback the PR of deciding between creating
         # AlloyDBAdminClient or AlloyDBAdminAsyncClient when either
         # https://github.com/grpc/grpc/issues/25364 is resolved or an async REST
@@ -96,43 +220,159 @@ class AlloyDBClient:
         # API, even from multiple threads, need to be made to a single-event
         # loop. See https://github.com/GoogleCloudPlatform/alloydb-python-connector/issues/435
         # for more details.
-        self._client: Union[v1beta.AlloyDBAdminClient, v1beta.AlloyDBAdminAsyncClient]
-        if client:
-            self._client = client
-        elif driver == "pg8000" or driver == "psycopg":
-            self._client = v1beta.AlloyDBAdminClient(
-                credentials=credentials,
-                transport="grpc",
-                client_options=ClientOptions(
-                    api_endpoint=alloydb_api_endpoint,
-                    quota_project_id=quota_project,
-                ),
-                client_info=ClientInfo(
-                    user_agent=user_agent,
+        if not use_asyncio:
+            return v1beta.AlloyDBAdminClient(
+                transport=self._pooled_transport(
+                    transports.AlloyDBAdminGrpcTransport,
+                    alloydb_api_endpoint,
+                    quota_project,
+                    credentials,
+                    loop=None,
                 ),
+                client_options=client_options,
+                client_info=client_info,
             )
-        else:
-            self._client = v1beta.AlloyDBAdminAsyncClient(
+        return v1beta.AlloyDBAdminAsyncClient(
+            transport=self._pooled_transport(
+                transports.AlloyDBAdminGrpcAsyncIOTransport,
+                alloydb_api_endpoint,
+                quota_project,
+                credentials,
+                loop=asyncio.get_running_loop(),
+            ),
+            client_options=client_options,
+            client_info=client_info,
+        )
+
+    def _pooled_transport(
+        self,
+        transport_cls: Any,
+        endpoint: str,
+        quota_project: Optional[str],
+        credentials: Credentials,
+        loop: Optional[asyncio.AbstractEventLoop],
+    ) -> Callable[..., Any]:
+        """Returns a factory of the gRPC transport over the process-wide
+        channel for the endpoint, credentials and quota project."""
+        host = endpoint if ":" in endpoint else f"{endpoint}:443"
+        self._channel_key, channel = acquire_channel(
+            host,
+            credentials,
+            quota_project,
+            lambda: transport_cls.create_channel(
+                host,
                 credentials=credentials,
-                transport="grpc_asyncio",
-                client_options=ClientOptions(
-                    api_endpoint=alloydb_api_endpoint,
-                    quota_project_id=quota_project,
-                ),
-                client_info=ClientInfo(
-                    user_agent=user_agent,
-                ),
+                quota_project_id=quota_project,
+                options=CHANNEL_OPTIONS,
+            ),
+            loop=loop,
+        )
+
+        def transport(**kwargs: Any) -> Any:
+            # the transport ignores the credentials given with a channel
+            return transport_cls(channel=channel, **kwargs)
+
+        return transport
+
+    @property
+    def loop_bound(self) -> bool:
+        """Whether the client's calls must be made from the event loop it
+        was created on, as those of the asyncio gRPC client."""
+        return not self._sync_client
+
+    def close(self) -> None:
+        """Releases the client's pooled channel."""
+        key, self._channel_key = self._channel_key, None
+        if key is not None:
+            release_channel(key)
+        if isinstance(self._client, AlloyDBRestClient):
+            self._client.close()
+
+    async def _call(self, method: str, request: Any) -> Any:
+        """
+        Calls an AlloyDB API method with the configured deadline, hedging
+        the call if it is slower than usual.
+
+        Calls of the sync client run in a thread, so that the event loop
+        isn't blocked and calls run concurrently.
+        """
+        stats = self._rpc_stats[method]
+        stats.calls += 1
+        if self._hedge_percentile is None:
+            return await self._timed_call(method, request)
+        first = asyncio.ensure_future(self._timed_call(method, request))
+        pending = {first}
+        try:
+            done, _ = await asyncio.wait(
+                pending, timeout=stats.hedge_delay(self._hedge_percentile)
             )
+            if done:
+                return first.result()
+            logger.debug(f"Hedging slow AlloyDB API call {method}")
+            stats.hedges += 1
+            hedge = asyncio.ensure_future(self._timed_call(method, request))
+            pending.add(hedge)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            stats.hedge_wins += 1
+                        return task.result()
+            # both calls failed
+            return first.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _timed_call(self, method: str, request: Any) -> Any:
+        """Calls an AlloyDB API method, recording its latency on success."""
+        kwargs: dict[str, Any] = {"request": request}
+        if self._rpc_timeout is not None:
+            kwargs["timeout"] = self._rpc_timeout
+        start = time.monotonic()
+        if self._sync_client:
+            resp = await asyncio.to_thread(getattr(self._client, method), **kwargs)
+        else:
+            resp = await getattr(self._client, method)(**kwargs)
+        self._rpc_stats[method].latencies.append(time.monotonic() - start)
+        return resp
 
-        self._credentials = credentials
-        # asyncpg does not currently support using metadata exchange
-        # only use metadata exchange for pg8000 driver
-        use_metadata = True
-        if driver in ("asyncpg", None):
-            use_metadata = False
+    def stats(self) -> list[dict[str, Any]]:
+        """
+        Returns the calls made to each AlloyDB API method.
 
-        self._use_metadata = use_metadata
-        self._user_agent = user_agent
+        Returns:
+            list[dict]: For each method, its name, number of calls, number
+                of hedged calls, how many of those the duplicate answered
+                first, and the current hedge delay in seconds (None without
+                hedging).
+        """
+        return [
+            {
+                "method": method,
+                "calls": stats.calls,
+                "hedges": stats.hedges,
+                "hedge_wins": stats.hedge_wins,
+                "hedge_delay": (
+                    None
+                    if self._hedge_percentile is None
+                    else stats.hedge_delay(self._hedge_percentile)
+                ),
+            }
+            for method, stats in self._rpc_stats.items()
+        ]
+
+    def _request(self, name: str, **fields: Any) -> Any:
+        """Returns the request message of the given name with the fields,
+        or the fields as a dict for the REST client."""
+        if isinstance(self._client, AlloyDBRestClient):
+            return fields
+        import google.cloud.alloydb_v1beta as v1beta
+
+        return getattr(v1beta, name)(**fields)
 
     async def _get_metadata(
         self,
@@ -162,11 +402,8 @@ class AlloyDBClient:
             f"projects/{project}/locations/{region}/clusters/{cluster}/instances/{name}"
         )
 
-        req = v1beta.GetConnectionInfoRequest(parent=parent)
-        if isinstance(self._client, v1beta.AlloyDBAdminClient):
-            resp = self._client.get_connection_info(request=req)
-        else:
-            resp = await self._client.get_connection_info(request=req)
+        req = self._request("GetConnectionInfoRequest", parent=parent)
+        resp = await self._call("get_connection_info", req)
 
         # Remove trailing period from PSC DNS name.
         psc_dns = resp.psc_dns_name
@@ -205,18 +442,14 @@ class AlloyDBClient:
                 and certificate chain for the AlloyDB instance.
         """
         parent = f"projects/{project}/locations/{region}/clusters/{cluster}"
-        dur = duration_pb2.Duration()
-        dur.seconds = 3600
-        req = v1beta.GenerateClientCertificateRequest(
+        req = self._request(
+            "GenerateClientCertificateRequest",
             parent=parent,
-            cert_duration=dur,
+            cert_duration=timedelta(seconds=3600),
             public_key=pub_key,
             use_metadata_exchange=self._use_metadata,
         )
-        if isinstance(self._client, v1beta.AlloyDBAdminClient):
-            resp = self._client.generate_client_certificate(request=req)
-        else:
-            resp = await self._client.generate_client_certificate(request=req)
+        resp = await self._call("generate_client_certificate", req)
         return (resp.ca_cert, list(resp.pem_certificate_chain))
 
     async def get_connection_info(
@@ -242,12 +475,14 @@ class AlloyDBClient:
             ConnectionInfo: All the information required to connect securely to
                 the AlloyDB instance.
         """
+        from cryptography import x509
+
         priv_key, pub_key = await keys
 
         # Before making AlloyDB API calls, refresh creds if required
         # Run refresh in a separate thread to avoid blocking the main thread.
         if not self._credentials.token_state == TokenState.FRESH:
-            await asyncio.to_thread(self._credentials.refresh, requests.Request())
+            await asyncio.to_thread(self._credentials.refresh, sync_request())
 
         # fetch metadata
         metadata_task = asyncio.create_task(
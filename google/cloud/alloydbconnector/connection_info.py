@@ -15,13 +15,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from dataclasses import field
+import functools
+import hashlib
 import logging
 import ssl
 from typing import TYPE_CHECKING
 from typing import Optional
 
-from aiofiles.tempfile import TemporaryDirectory
-
+from google.cloud.alloydbconnector import proxy
 from google.cloud.alloydbconnector.exceptions import IPTypeNotFoundError
 from google.cloud.alloydbconnector.utils import _write_to_file
 
@@ -35,44 +37,93 @@ if TYPE_CHECKING:
 logger = logging.getLogger(name=__name__)
 
 
-@dataclass
+@functools.lru_cache(maxsize=256)
+def _shared_pem(pem: str) -> str:
+    """Returns the first seen copy of a PEM string equal to pem.
+
+    The CA and intermediate certificates are the same for every instance of
+    a cluster, so connection infos share one copy of them. The cache is
+    bounded, unlike sys.intern, which keeps strings alive on Python 3.12.
+    """
+    return pem
+
+
+def _cert_digest(cert_chain: list[str], ca_cert: str) -> bytes:
+    digest = hashlib.sha256(ca_cert.encode())
+    for cert in cert_chain:
+        digest.update(cert.encode())
+    return digest.digest()
+
+
+@dataclass(slots=True)
 class ConnectionInfo:
     """Contains all necessary information to connect securely to the
-    server-side Proxy running on an AlloyDB instance."""
+    server-side Proxy running on an AlloyDB instance.
+
+    Once the SSL context is built, the certificates and key are only held by
+    the context: cert_chain and ca_cert are emptied and key is set to None.
+    cert_digest identifies the certificates for comparing connection infos.
+    """
 
     cert_chain: list[str]
     ca_cert: str
-    key: PrivateKeyTypes
+    key: Optional[PrivateKeyTypes]
     ip_addrs: dict[str, Optional[str]]
     expiration: datetime.datetime
     context: Optional[ssl.SSLContext] = None
+    cert_digest: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.cert_digest = _cert_digest(self.cert_chain, self.ca_cert)
+        # the client certificate is unique, the rest of the chain is shared
+        self.cert_chain = self.cert_chain[:1] + [
+            _shared_pem(cert) for cert in self.cert_chain[1:]
+        ]
+        self.ca_cert = _shared_pem(self.ca_cert)
 
-    async def create_ssl_context(self) -> ssl.SSLContext:
+    async def create_ssl_context(self, enable_ktls: bool = False) -> ssl.SSLContext:
         """Constructs a SSL/TLS context for the given connection info.
 
         Cache the SSL context to ensure we don't read from disk repeatedly when
         configuring a secure connection.
+
+        Args:
+            enable_ktls (bool): Request kernel TLS offload for sockets created
+                from the context. Only applied when the context is built.
         """
         # if SSL context is cached, use it
         if self.context is not None:
             return self.context
+        # read before awaiting, as a concurrent call may build the context
+        # and drop them in the meantime
+        ca_cert, cert_chain, key = self.ca_cert, self.cert_chain, self.key
+        if key is None:
+            raise ValueError("ConnectionInfo has no private key to build a context.")
 
         # create TLS context
         context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
         # force TLSv1.3
         context.minimum_version = ssl.TLSVersion.TLSv1_3
+        if enable_ktls:
+            proxy.enable_ktls(context)
+
+        from aiofiles.tempfile import TemporaryDirectory
 
         # tmpdir and its contents are automatically deleted after the CA cert
         # and cert chain are loaded into the SSLcontext. The values
         # need to be written to files in order to be loaded by the SSLContext
         async with TemporaryDirectory() as tmpdir:
             ca_filename, cert_chain_filename, key_filename = await _write_to_file(
-                tmpdir, self.ca_cert, self.cert_chain, self.key
+                tmpdir, ca_cert, cert_chain, key
             )
             context.load_cert_chain(cert_chain_filename, keyfile=key_filename)
             context.load_verify_locations(cafile=ca_filename)
         # set class attribute to cache context for subsequent calls
         self.context = context
+        # the context holds the loaded certificates and key from now on
+        self.cert_chain = []
+        self.ca_cert = ""
+        self.key = None
         return context
 
     def get_preferred_ip(self, ip_type: IPTypes) -> str:
@@ -15,49 +15,95 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 from datetime import datetime
 from datetime import timezone
 from functools import partial
+import importlib
 import io
 import logging
+import os
 import socket
+import ssl
 import struct
+from threading import Lock
 from threading import Thread
 from types import TracebackType
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Awaitable
 from typing import Callable
 from typing import Optional
 
 from google.auth import default
-from google.auth.credentials import TokenState
 from google.auth.credentials import with_scopes_if_required
-from google.auth.transport import requests
-import google.cloud.alloydb_connectors_v1.proto.resources_pb2 as connectorspb
+from google.cloud.alloydbconnector.auth_transport import is_async_credentials
+from google.cloud.alloydbconnector.circuit_breaker import CircuitBreakers
+from google.cloud.alloydbconnector.circuit_breaker import _attempt
 from google.cloud.alloydbconnector.client import AlloyDBClient
+from google.cloud.alloydbconnector.enums import AdminAPITransport
 from google.cloud.alloydbconnector.enums import IPTypes
 from google.cloud.alloydbconnector.enums import RefreshStrategy
 from google.cloud.alloydbconnector.exceptions import ClosedConnectorError
+from google.cloud.alloydbconnector.exceptions import MetadataExchangeError
 from google.cloud.alloydbconnector.instance import RefreshAheadCache
+from google.cloud.alloydbconnector.instance_change import InstanceChange
+from google.cloud.alloydbconnector.instance_change import InstanceChangeListeners
 from google.cloud.alloydbconnector.lazy import LazyRefreshCache
+from google.cloud.alloydbconnector.loop_thread import LoopThread
+from google.cloud.alloydbconnector.loop_thread import acquire_loop_thread
+from google.cloud.alloydbconnector.loop_thread import release_loop_thread
+from google.cloud.alloydbconnector.negative_cache import NegativeCache
 import google.cloud.alloydbconnector.pg8000 as pg8000
+from google.cloud.alloydbconnector.pool import PoolRotation
+from google.cloud.alloydbconnector.pool import _max_lifetime
+from google.cloud.alloydbconnector.pool import _pool_stats
 import google.cloud.alloydbconnector.psycopg as psycopg
+from google.cloud.alloydbconnector.refresh_utils import _instance_stats
+from google.cloud.alloydbconnector.refresh_utils import _refresh_may_help
+from google.cloud.alloydbconnector.static import StaticConnectionInfo
 from google.cloud.alloydbconnector.static import StaticConnectionInfoCache
+from google.cloud.alloydbconnector.token_manager import TokenManager
 from google.cloud.alloydbconnector.types import CacheTypes
+from google.cloud.alloydbconnector.utils import CONNECT_TIMEOUT
+from google.cloud.alloydbconnector.utils import IO_TIMEOUT
+from google.cloud.alloydbconnector.utils import SERVER_PROXY_PORT
+from google.cloud.alloydbconnector.utils import _deadline
+from google.cloud.alloydbconnector.utils import _remaining
 from google.cloud.alloydbconnector.utils import generate_keys
 from google.cloud.alloydbconnector.utils import strip_http_prefix
 
 if TYPE_CHECKING:
-    import ssl
-
     from google.auth.credentials import Credentials
+    from google.cloud.alloydbconnector.connection_info import ConnectionInfo
 
 logger = logging.getLogger(name=__name__)
 
-# the port the AlloyDB server-side proxy receives connections on
-SERVER_PROXY_PORT = 5433
-# the maximum amount of time to wait before aborting a metadata exchange
-IO_TIMEOUT = 30
+# modules of the supported drivers, each with a connect(sock, **kwargs)
+_DRIVERS: dict[str, Any] = {
+    "pg8000": pg8000,
+    "psycopg": psycopg,
+}
+
+
+async def _close_on_cancel(future: asyncio.Future) -> Any:
+    """
+    Waits for an executor future whose result is a socket or connection,
+    closing the result if the wait is cancelled before it is done.
+
+    The executor thread can't be interrupted, so without this a socket it
+    finishes after a timeout or cancellation would leak.
+    """
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+
+        def close(f: asyncio.Future) -> None:
+            if not f.cancelled() and f.exception() is None:
+                f.result().close()
+
+        future.add_done_callback(close)
+        raise
 
 
 class Connector:
@@ -89,12 +135,52 @@ class Connector:
             of the following: RefreshStrategy.LAZY ("LAZY") or
             RefreshStrategy.BACKGROUND ("BACKGROUND").
             Default: RefreshStrategy.BACKGROUND
-        static_conn_info (io.TextIOBase): A file-like JSON object that contains
-            static connection info for the StaticConnectionInfoCache.
-            Defaults to None, which will not use the StaticConnectionInfoCache.
+        static_conn_info (io.TextIOBase | str | os.PathLike): A file-like
+            JSON object that contains static connection info for the
+            StaticConnectionInfoCache, or the path of a JSON file, which is
+            reloaded when it changes. It is parsed when the connector is
+            created. Defaults to None, which will not use the
+            StaticConnectionInfoCache.
             This is a *dev-only* option and should not be used in production as
             it will result in failed connections after the client certificate
             expires.
+        enable_ktls (bool): Requests kernel TLS offload for the TLS sockets
+            of all drivers. pg8000 sockets then have records encrypted by the
+            kernel, and the psycopg proxy moves bytes with splice() instead of
+            through Python. Requires Linux with the tls kernel module, Python
+            3.12+ and OpenSSL built with kTLS support; otherwise has no
+            effect. Defaults to False.
+        shared_loop (bool): Runs the connector on a background event loop
+            thread shared with the other Connectors created with
+            shared_loop=True, instead of starting its own. The thread stops
+            once all of them are closed. The number of shared threads is set
+            with loop_thread.configure_loop_threads. Defaults to False.
+        timeout (float): Default seconds allowed for a connection attempt,
+            covering the wait for connection info, the dial, TLS handshake,
+            metadata exchange and the driver's handshake. Can be set per
+            connection with the `timeout` argument of connect(). None
+            disables it. Defaults to 60.
+        circuit_breaker_threshold (int): Consecutive failures to reach an
+            instance IP address after which connection attempts to it fail
+            right away with CircuitOpenError, instead of waiting for the dial
+            to fail. Failures raised by the database itself, such as a wrong
+            password, don't count. None disables the circuit breaker.
+            Defaults to None.
+        circuit_breaker_timeout (float): Seconds an open circuit fails
+            connection attempts before letting a single trial attempt
+            through, which closes the circuit if it reaches the instance.
+            Defaults to 30.
+        admin_api_timeout (float): Deadline in seconds of each AlloyDB Admin
+            API call. Defaults to None, which uses the API's default.
+        admin_api_hedge_percentile (float): Sends a duplicate of an AlloyDB
+            Admin API call that takes longer than this percentile of the
+            recent latencies of its method (e.g. 0.95), and uses whichever
+            answers first. Until enough latencies are recorded, calls are
+            hedged after 1 second. Defaults to None, for no hedging.
+        admin_api_transport (str | AdminAPITransport): Calls the AlloyDB
+            Admin API over gRPC ("GRPC") or REST ("REST"). REST calls don't
+            import or start gRPC and work from any event loop, at the cost of
+            a thread per call. Defaults to AdminAPITransport.GRPC.
     """
 
     def __init__(
@@ -107,13 +193,33 @@ class Connector:
         ip_type: str | IPTypes = IPTypes.PRIVATE,
         user_agent: Optional[str] = None,
         refresh_strategy: str | RefreshStrategy = RefreshStrategy.BACKGROUND,
-        static_conn_info: Optional[io.TextIOBase] = None,
+        static_conn_info: Optional[io.TextIOBase | str | os.PathLike] = None,
+        enable_ktls: bool = False,
+        shared_loop: bool = False,
+        timeout: Optional[float] = CONNECT_TIMEOUT,
+        circuit_breaker_threshold: Optional[int] = None,
+        circuit_breaker_timeout: float = 30.0,
+        admin_api_timeout: Optional[float] = None,
+        admin_api_hedge_percentile: Optional[float] = None,
+        admin_api_transport: str | AdminAPITransport = AdminAPITransport.GRPC,
     ) -> None:
-        # create event loop and start it in background thread
-        self._loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
-        self._thread = Thread(target=self._loop.run_forever, daemon=True)
-        self._thread.start()
+        # use a shared event loop thread or create an event loop and start it
+        # in a background thread
+        self._shared_loop: Optional[LoopThread] = None
+        if shared_loop:
+            self._shared_loop = acquire_loop_thread()
+            self._loop: asyncio.AbstractEventLoop = self._shared_loop.loop
+            self._thread = self._shared_loop.thread
+        else:
+            self._loop = asyncio.new_event_loop()
+            self._thread = Thread(target=self._loop.run_forever, daemon=True)
+            self._thread.start()
+        # caches are added and removed under _lock; connections read them
+        # from any thread without locking, dict lookups being atomic, also
+        # on free-threaded builds
         self._cache: dict[str, CacheTypes] = {}
+        # guards the lazily created client and caches, and the pools
+        self._lock = Lock()
         # initialize default params
         self._quota_project = quota_project
         self._alloydb_api_endpoint = strip_http_prefix(alloydb_api_endpoint)
@@ -127,30 +233,158 @@ class Connector:
             refresh_strategy = RefreshStrategy(refresh_strategy.upper())
         self._refresh_strategy = refresh_strategy
         self._user_agent = user_agent
+        # credentials are resolved right away when given; discovering
+        # Application Default Credentials may probe the metadata server, so
+        # it is deferred to start() or the first connection
+        self._credentials_arg = credentials
+        self._db_credentials_arg = db_credentials
+        self._credentials: Credentials
+        self._db_credentials: Credentials
+        # keeps the DB token fresh ahead of expiry and caches the serialized
+        # metadata exchange request
+        self._token_manager: TokenManager
+        self._credentials_resolved = False
+        if credentials is not None:
+            self._resolve_credentials()
+        # key pair of the client certificate, generated on start
+        self._keys: Optional[asyncio.Future] = None
+        # discovers credentials and generates keys, created on start
+        self._ready: Optional[asyncio.Future] = None
+        self._client: Optional[AlloyDBClient] = None
+        # parsed once and shared by the caches of all instances
+        self._static_conn_info: Optional[StaticConnectionInfo] = None
+        if static_conn_info is not None:
+            self._static_conn_info = StaticConnectionInfo(static_conn_info)
+        if enable_ktls and not hasattr(ssl, "OP_ENABLE_KTLS"):
+            logger.debug("Kernel TLS is not supported by this Python build")
+            enable_ktls = False
+        self._enable_ktls = enable_ktls
+        self._pools: list[tuple[str, Any, PoolRotation]] = []
+        self._timeout = timeout
+        if admin_api_hedge_percentile is not None and not (
+            0 < admin_api_hedge_percentile < 1
+        ):
+            raise ValueError(
+                "Arg `admin_api_hedge_percentile` must be between 0 and 1, "
+                f"got {admin_api_hedge_percentile}."
+            )
+        self._admin_api_timeout = admin_api_timeout
+        self._admin_api_hedge_percentile = admin_api_hedge_percentile
+        # if admin_api_transport is str, convert to AdminAPITransport enum
+        if isinstance(admin_api_transport, str):
+            admin_api_transport = AdminAPITransport(admin_api_transport.upper())
+        self._admin_api_transport = admin_api_transport
+        # callbacks subscribed with on_instance_change
+        self._instance_listeners = InstanceChangeListeners()
+        # errors getting connection info, to fail fast on repeated attempts
+        self._negative_cache = NegativeCache()
+        self._breakers: Optional[CircuitBreakers] = None
+        if circuit_breaker_threshold is not None:
+            self._breakers = CircuitBreakers(
+                circuit_breaker_threshold, circuit_breaker_timeout
+            )
+        self._closed = False
+
+    def _resolve_credentials(self) -> None:
+        """Sets up the credentials for the AlloyDB Admin API and the
+        database, discovering Application Default Credentials if none were
+        given. Blocking, so run in a thread unless credentials were given."""
         # initialize credentials for authenticating with AlloyDB Admin API
         scopes = ["https://www.googleapis.com/auth/cloud-platform"]
-        if credentials:
-            self._credentials = with_scopes_if_required(credentials, scopes=scopes)
+        if self._credentials_arg:
+            credentials = with_scopes_if_required(self._credentials_arg, scopes=scopes)
         # otherwise use application default credentials
         else:
-            self._credentials, _ = default(scopes=scopes)
+            credentials, _ = default(scopes=scopes)
         # initialize credentials for authenticating with the DB
-        if db_credentials:
-            self._db_credentials = db_credentials
+        if self._db_credentials_arg:
+            db_credentials = self._db_credentials_arg
         # otherwise use the same credentials as the one for authenticating with
         # AlloyDB Admin API
         else:
             scopes = ["https://www.googleapis.com/auth/alloydb.login"]
-            self._db_credentials = with_scopes_if_required(
-                self._credentials, scopes=scopes
+            db_credentials = with_scopes_if_required(credentials, scopes=scopes)
+        # tokens are requested from threads outside the event loop
+        if is_async_credentials(db_credentials):
+            raise ValueError(
+                "Credentials refreshed with a coroutine are only supported by "
+                "the AsyncConnector."
             )
-        self._keys = asyncio.wrap_future(
-            asyncio.run_coroutine_threadsafe(generate_keys(), self._loop),
-            loop=self._loop,
-        )
-        self._client: Optional[AlloyDBClient] = None
-        self._static_conn_info = static_conn_info
-        self._closed = False
+        self._credentials = credentials
+        self._db_credentials = db_credentials
+        self._token_manager = TokenManager(db_credentials)
+        self._credentials_resolved = True
+
+    async def _initialize(self) -> None:
+        """Discovers credentials, generates the key pair and imports the
+        AlloyDB Admin API client concurrently."""
+        if self._keys is None:
+            self._keys = asyncio.ensure_future(generate_keys())
+        tasks: list[Awaitable[Any]] = [self._keys]
+        if self._admin_api_transport == AdminAPITransport.GRPC:
+            # importing the gRPC client takes a few hundred milliseconds
+            tasks.append(
+                asyncio.to_thread(
+                    importlib.import_module, "google.cloud.alloydb_v1beta"
+                )
+            )
+        if not self._credentials_resolved:
+            tasks.append(asyncio.to_thread(self._resolve_credentials))
+        await asyncio.gather(*tasks)
+
+    async def _start(self, driver: Optional[str] = None) -> None:
+        """Waits for the connector to be initialized, then creates the
+        AlloyDB Admin API client for the given driver if there is none yet.
+        Must be run on the connector's event loop."""
+        # a failed initialization, e.g. without credentials, is retried
+        if self._ready is None or (
+            self._ready.done() and self._ready.exception() is not None
+        ):
+            self._ready = asyncio.ensure_future(self._initialize())
+        # shielded, so that a cancelled connection attempt doesn't cancel
+        # the initialization shared with the others
+        await asyncio.shield(self._ready)
+        if driver is not None and self._client is None:
+            with self._lock:
+                # connect_async may also be awaited on another event loop
+                if self._client is None:
+                    # lazy init client as it has to be initialized in async context
+                    self._client = AlloyDBClient(
+                        self._alloydb_api_endpoint,
+                        self._quota_project,
+                        self._credentials,
+                        user_agent=self._user_agent,
+                        driver=driver,
+                        rpc_timeout=self._admin_api_timeout,
+                        hedge_percentile=self._admin_api_hedge_percentile,
+                        transport=self._admin_api_transport,
+                    )
+
+    def start(self, driver: Optional[str] = None) -> concurrent.futures.Future[None]:
+        """
+        Starts initializing the connector in the background without waiting
+        for it: discovering Application Default Credentials, generating the
+        key pair of the client certificate and loading the AlloyDB Admin API
+        client run concurrently.
+
+        Connecting starts and waits for the initialization on its own, so
+        calling start() is optional; calling it early, e.g. when a web app
+        starts, takes it off the first connection's latency.
+
+        Args:
+            driver (str): The database driver that will be used, to also
+                create the AlloyDB Admin API client. Optional.
+
+        Returns:
+            concurrent.futures.Future: Completes once the connector is
+                ready, or with the error that stopped it from getting ready.
+                Await it from asyncio code with asyncio.wrap_future.
+        """
+        if self._closed:
+            raise ClosedConnectorError(
+                "Start failed because the connector has already been closed."
+            )
+        return asyncio.run_coroutine_threadsafe(self._start(driver), self._loop)
 
     def connect(self, instance_uri: str, driver: str, **kwargs: Any) -> Any:
         """
@@ -160,21 +394,43 @@ class Connector:
         AlloyDB instance IP address. Creates a secure TLS connection
         to establish connection to AlloyDB instance.
 
+        Once the connection info for the instance is cached, the connection
+        is made on the calling thread.
+
         Args:
             instance_uri (str): The instance URI of the AlloyDB instance.
                 ex. projects/<PROJECT>/locations/<REGION>/clusters/<CLUSTER>/instances/<INSTANCE>
             driver (str): A string representing the database driver to connect with.
                 Supported drivers are pg8000.
             **kwargs: Pass in any database driver-specific arguments needed
-                to fine tune connection.
+                to fine tune connection. `timeout` overrides the connector's
+                timeout for this connection attempt.
 
         Returns:
             connection: A DBAPI connection to the specified AlloyDB instance.
+
+        Raises:
+            TimeoutError: The connection attempt exceeded its timeout.
         """
         if self._closed:
             raise ClosedConnectorError(
                 "Connection attempt failed because the connector has already been closed."
             )
+        # with ready connection info, connect without a trip through the loop
+        cache = self._cache.get(instance_uri)
+        if cache is not None and self._client is not None and driver in _DRIVERS:
+            conn_info = cache.connect_info_nowait()
+            if conn_info is not None and conn_info.context is not None:
+                timeout = kwargs.pop("timeout", self._timeout)
+                return self._connect_cached(
+                    instance_uri,
+                    driver,
+                    cache,
+                    conn_info,
+                    conn_info.context,
+                    _deadline(timeout),
+                    **kwargs,
+                )
         # call async connect and wait on result
         connect_task = asyncio.run_coroutine_threadsafe(
             self.connect_async(instance_uri, driver, **kwargs), self._loop
@@ -195,87 +451,410 @@ class Connector:
             driver (str): A string representing the database driver to connect with.
                 Supported drivers are pg8000.
             **kwargs: Pass in any database driver-specific arguments needed
-                to fine tune connection.
+                to fine tune connection. `timeout` overrides the connector's
+                timeout for this connection attempt.
 
         Returns:
             connection: A DBAPI connection to the specified AlloyDB instance.
+
+        Raises:
+            TimeoutError: The connection attempt exceeded its timeout.
         """
-        if self._client is None:
-            # lazy init client as it has to be initialized in async context
-            self._client = AlloyDBClient(
-                self._alloydb_api_endpoint,
-                self._quota_project,
-                self._credentials,
-                user_agent=self._user_agent,
-                driver=driver,
+        timeout = kwargs.pop("timeout", self._timeout)
+        try:
+            return await asyncio.wait_for(
+                self._connect_async(instance_uri, driver, _deadline(timeout), **kwargs),
+                timeout,
             )
+        except asyncio.TimeoutError as e:
+            raise TimeoutError(
+                f"['{instance_uri}']: Connection attempt timed out after {timeout}s."
+            ) from e
+
+    async def _connect_async(
+        self,
+        instance_uri: str,
+        driver: str,
+        deadline: Optional[float],
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Connects through the event loop, with the dial and the driver's
+        handshake run in its executor. Sockets and connections completed
+        after the attempt is cancelled are closed.
+        """
+        await self._start(driver)
+        assert self._client is not None and self._keys is not None
         enable_iam_auth = kwargs.pop("enable_iam_auth", self._enable_iam_auth)
+        ip_type: IPTypes | str = kwargs.pop("ip_type", self._ip_type)
+        # if ip_type is str, convert to IPTypes enum
+        if isinstance(ip_type, str):
+            ip_type = IPTypes(ip_type.upper())
+        # fail fast with a remembered error getting the connection info,
+        # without calling the AlloyDB API again
+        self._negative_cache.check(instance_uri, ip_type)
+
+        cache = self._get_cache(instance_uri)
+
+        # only accept supported database drivers
+        try:
+            connector = _DRIVERS[driver].connect
+        except KeyError:
+            raise ValueError(f"Driver '{driver}' is not a supported database driver.")
+
+        # Host and ssl options come from the certificates and instance IP address
+        # so we don't want the user to specify them.
+        kwargs.pop("host", None)
+        kwargs.pop("ssl", None)
+        kwargs.pop("port", None)
+
+        # get connection info for AlloyDB instance
+        try:
+            conn_info = await cache.connect_info()
+            ip_address = conn_info.get_preferred_ip(ip_type)
+        except Exception as e:
+            # with an error from AlloyDB API call or IP type, remember the
+            # error, invalidate the cache and re-raise the error
+            self._negative_cache.record(instance_uri, ip_type, e)
+            await self._remove_cached(instance_uri)
+            raise
+        self._negative_cache.clear(instance_uri, ip_type)
+        logger.debug(f"['{instance_uri}']: Connecting to {ip_address}:5433")
+
+        # the login token is only worth refreshing ahead of expiry when it
+        # authenticates the database user
+        if enable_iam_auth:
+            self._token_manager.start(self._loop)
+
+        # synchronous drivers are blocking and run using executor; an open
+        # circuit fails fast, without refreshing the connection info
+        with _attempt(self._breakers, instance_uri, ip_address):
+            try:
+                ctx = await conn_info.create_ssl_context(enable_ktls=self._enable_ktls)
+                metadata_partial = partial(
+                    self.metadata_exchange,
+                    instance_uri,
+                    ip_address,
+                    ctx,
+                    enable_iam_auth,
+                    _remaining(deadline),
+                )
+                sock = await _close_on_cancel(
+                    self._loop.run_in_executor(None, metadata_partial)
+                )
+                connect_partial = partial(
+                    connector, sock, timeout=_remaining(deadline), **kwargs
+                )
+                return await _close_on_cancel(
+                    self._loop.run_in_executor(None, connect_partial)
+                )
+            except Exception as e:
+                # only force a refresh if a new certificate or IP address
+                # could help, then throw the error
+                if _refresh_may_help(e):
+                    await cache.force_refresh()
+                raise
+
+    def _get_cache(self, instance_uri: str) -> CacheTypes:
+        """Returns the instance's connection info cache, creating it if
+        there is none. Must be run on an event loop."""
         # use existing connection info if possible
-        if instance_uri in self._cache:
-            cache = self._cache[instance_uri]
-        elif self._static_conn_info:
-            cache = StaticConnectionInfoCache(instance_uri, self._static_conn_info)
-        else:
+        cache = self._cache.get(instance_uri)
+        if cache is not None:
+            return cache
+        if self._static_conn_info:
+            return StaticConnectionInfoCache(instance_uri, self._static_conn_info)
+        assert self._client is not None and self._keys is not None
+        with self._lock:
+            # connections awaited on other event loops may race to create it
+            cache = self._cache.get(instance_uri)
+            if cache is not None:
+                return cache
             if self._refresh_strategy == RefreshStrategy.LAZY:
                 logger.debug(
                     f"['{instance_uri}']: Refresh strategy is set to lazy refresh"
                 )
-                cache = LazyRefreshCache(instance_uri, self._client, self._keys)
+                cache = LazyRefreshCache(
+                    instance_uri,
+                    self._client,
+                    self._keys,
+                    on_change=self._instance_listeners.notify,
+                )
             else:
                 logger.debug(
                     f"['{instance_uri}']: Refresh strategy is set to background refresh"
                 )
-                cache = RefreshAheadCache(instance_uri, self._client, self._keys)
+                cache = RefreshAheadCache(
+                    instance_uri,
+                    self._client,
+                    self._keys,
+                    on_change=self._instance_listeners.notify,
+                )
             self._cache[instance_uri] = cache
-            logger.debug(f"['{instance_uri}']: Connection info added to cache")
+        logger.debug(f"['{instance_uri}']: Connection info added to cache")
+        return cache
 
-        connect_func: dict[str, Callable[..., Any]] = {
-            "pg8000": pg8000.connect,
-            "psycopg": psycopg.connect,
-        }
-        # only accept supported database drivers
-        try:
-            connector = connect_func[driver]
-        except KeyError:
-            raise ValueError(f"Driver '{driver}' is not a supported database driver.")
+    def _connect_cached(
+        self,
+        instance_uri: str,
+        driver: str,
+        cache: CacheTypes,
+        conn_info: ConnectionInfo,
+        ctx: ssl.SSLContext,
+        deadline: Optional[float],
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Connects on the calling thread with cached connection info whose SSL
+        context is already built.
 
+        Does the same as connect_async, without handing the metadata exchange
+        and the driver's connect off to the event loop and its executor.
+        """
+        enable_iam_auth = kwargs.pop("enable_iam_auth", self._enable_iam_auth)
         # Host and ssl options come from the certificates and instance IP address
         # so we don't want the user to specify them.
         kwargs.pop("host", None)
         kwargs.pop("ssl", None)
         kwargs.pop("port", None)
-
-        # get connection info for AlloyDB instance
         ip_type: IPTypes | str = kwargs.pop("ip_type", self._ip_type)
         # if ip_type is str, convert to IPTypes enum
         if isinstance(ip_type, str):
             ip_type = IPTypes(ip_type.upper())
+        self._negative_cache.check(instance_uri, ip_type)
         try:
-            conn_info = await cache.connect_info()
             ip_address = conn_info.get_preferred_ip(ip_type)
-        except Exception:
-            # with an error from AlloyDB API call or IP type, invalidate the
-            # cache and re-raise the error
-            await self._remove_cached(instance_uri)
+        except Exception as e:
+            # with an error from the IP type, remember the error, invalidate
+            # the cache and re-raise the error
+            self._negative_cache.record(instance_uri, ip_type, e)
+            asyncio.run_coroutine_threadsafe(
+                self._remove_cached(instance_uri), self._loop
+            ).result()
             raise
+        self._negative_cache.clear(instance_uri, ip_type)
         logger.debug(f"['{instance_uri}']: Connecting to {ip_address}:5433")
 
-        # synchronous drivers are blocking and run using executor
-        try:
-            metadata_partial = partial(
-                self.metadata_exchange,
-                instance_uri,
-                ip_address,
-                await conn_info.create_ssl_context(),
-                enable_iam_auth,
+        if enable_iam_auth:
+            self._token_manager.start(self._loop)
+
+        with _attempt(self._breakers, instance_uri, ip_address):
+            try:
+                sock = self.metadata_exchange(
+                    instance_uri,
+                    ip_address,
+                    ctx,
+                    enable_iam_auth,
+                    _remaining(deadline),
+                )
+                return _DRIVERS[driver].connect(
+                    sock, timeout=_remaining(deadline), **kwargs
+                )
+            except Exception as e:
+                # only force a refresh if a new certificate or IP address
+                # could help, then throw the error
+                if _refresh_may_help(e):
+                    asyncio.run_coroutine_threadsafe(
+                        cache.force_refresh(), self._loop
+                    ).result()
+                raise
+
+    def create_pool(
+        self,
+        instance_uri: str,
+        driver: str = "psycopg",
+        min_size: int = 4,
+        max_size: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Creates a psycopg_pool connection pool whose connections are made
+        through the connector.
+
+        The pool is opened and fills up to min_size in the background, with
+        all connections sharing the cached connection info and SSL context.
+        The max_lifetime of pooled connections is capped at the time left on
+        the client certificate they were made with, and the pool is drained
+        as soon as a new connection finds that the instance's IP address has
+        changed.
+
+        Args:
+            instance_uri (str): The instance URI of the AlloyDB instance.
+                ex. projects/<PROJECT>/locations/<REGION>/clusters/<CLUSTER>/instances/<INSTANCE>
+            driver (str): The database driver of the pool's connections.
+                Only psycopg is supported.
+            min_size (int): Number of connections the pool keeps open.
+                Defaults to 4.
+            max_size (int): Maximum number of connections in the pool.
+                Defaults to min_size.
+            **kwargs: Arguments for psycopg_pool.ConnectionPool (e.g.
+                max_idle, max_lifetime, configure, num_workers); all others
+                are passed to connect() for each connection, including user,
+                password, db, ip_type and enable_iam_auth.
+
+        Returns:
+            psycopg_pool.ConnectionPool: An open connection pool. It is closed
+                together with the connector if still open.
+        """
+        if self._closed:
+            raise ClosedConnectorError(
+                "Pool creation failed because the connector has already been closed."
             )
-            sock = await self._loop.run_in_executor(None, metadata_partial)
-            connect_partial = partial(connector, sock, **kwargs)
-            return await self._loop.run_in_executor(None, connect_partial)
-        except Exception:
-            # we attempt a force refresh, then throw the error
-            await cache.force_refresh()
-            raise
+        if driver != "psycopg":
+            raise ValueError(f"Driver '{driver}' does not support connection pools.")
+        ip_type: str | IPTypes = kwargs.get("ip_type", self._ip_type)
+        if isinstance(ip_type, str):
+            ip_type = IPTypes(ip_type.upper())
+        max_lifetime = kwargs.pop("max_lifetime", 3600.0)
+        pool: Any = None
+
+        def recycle() -> Any:
+            # draining closes idle connections, so keep it off the loop
+            if pool is not None:
+                return self._loop.run_in_executor(None, pool.drain)
+
+        rotation = PoolRotation(instance_uri, recycle, self._loop)
+        # recycle right away when the instance moves to another IP address
+        self.on_instance_change(rotation.instance_changed)
+
+        async def connect_async(**connect_kwargs: Any) -> Any:
+            conn = await self.connect_async(instance_uri, driver, **connect_kwargs)
+            cache = self._cache.get(instance_uri)
+            if cache is not None:
+                conn_info = await cache.connect_info()
+                rotation.observe(conn_info, conn_info.get_preferred_ip(ip_type))
+                # psycopg_pool sets the connection's expiry date when this
+                # returns
+                pool.max_lifetime = _max_lifetime(conn_info.expiration, max_lifetime)
+            return conn
+
+        def connect(**connect_kwargs: Any) -> Any:
+            if self._closed:
+                raise ClosedConnectorError(
+                    "Connection attempt failed because the connector has already been closed."
+                )
+            return asyncio.run_coroutine_threadsafe(
+                connect_async(**connect_kwargs), self._loop
+            ).result()
+
+        pool = psycopg.create_pool(
+            connect,
+            min_size=min_size,
+            max_size=max_size,
+            max_lifetime=max_lifetime,
+            **kwargs,
+        )
+        with self._lock:
+            self._pools.append((instance_uri, pool, rotation))
+        pool.open()
+        return pool
+
+    def on_instance_change(
+        self, callback: Callable[[InstanceChange], Any]
+    ) -> Callable[[], None]:
+        """
+        Subscribes a callback to changes of the connection info of the
+        instances connected to.
+
+        The callback is called with an InstanceChange after a refresh
+        returns different IP addresses (e.g. on failover or a PSC endpoint
+        change) or a new client certificate. It runs on the background event loop thread; it
+        may return an awaitable, which is run as a task there. Pools created
+        with create_pool already recycle their connections when the IP
+        address they connect to goes away.
+
+        Args:
+            callback (Callable): Called with the InstanceChange.
+
+        Returns:
+            Callable: Unsubscribes the callback.
+        """
+        return self._instance_listeners.add(callback)
+
+    def admin_api_stats(self) -> list[dict[str, Any]]:
+        """
+        Returns the calls made to the AlloyDB Admin API.
+
+        Returns:
+            list[dict]: For each API method, its name, number of calls,
+                number of hedged calls, how many of those the duplicate
+                answered first, and the current hedge delay in seconds.
+                Empty before the first connection attempt.
+        """
+        if self._client is None:
+            return []
+        return self._client.stats()
+
+    def stats(self) -> list[dict[str, Any]]:
+        """
+        Returns the state and refresh schedule of the connection info caches.
+
+        Returns:
+            list[dict]: For each cached instance, its instance URI, refresh
+                strategy ("BACKGROUND", "LAZY" or "STATIC"), certificate
+                expiration and IP addresses, whether the SSL context is
+                built, the time of the next refresh, the duration, outcome
+                ("success" or "failure") and error of the last refresh, the
+                consecutive failed refreshes, whether stale connection info
+                is served and how often, the refresh rate limiter's available
+                tokens (None without one) and the number of open psycopg
+                proxy connections to the instance's IP addresses. Times are
+                UTC datetimes; those not known yet are None.
+        """
+        return [
+            _instance_stats(instance_uri, cache)
+            for instance_uri, cache in list(self._cache.items())
+        ]
+
+    def cache_stats(self) -> list[dict[str, Any]]:
+        """
+        Returns the state of the connection info caches.
+
+        Returns:
+            list[dict]: For each cached instance, its instance URI, whether
+                its connection info is served stale because refreshing it
+                fails, and how many times stale connection info was served.
+        """
+        return [
+            {
+                "instance_uri": instance_uri,
+                "serving_stale": cache.serving_stale,
+                "stale_served": cache.stale_served,
+            }
+            for instance_uri, cache in list(self._cache.items())
+        ]
+
+    def pool_stats(self) -> list[dict[str, Any]]:
+        """
+        Returns the state of the pools created with create_pool.
+
+        Returns:
+            list[dict]: For each pool, its instance URI, current, idle,
+                minimum and maximum size, the IP address and certificate
+                expiration of its newest connection, and how many times its
+                connections were recycled and why.
+        """
+        with self._lock:
+            pools = list(self._pools)
+        return [
+            _pool_stats(instance_uri, pool, rotation)
+            for instance_uri, pool, rotation in pools
+        ]
+
+    def circuit_breaker_stats(self) -> list[dict[str, Any]]:
+        """
+        Returns the state of the circuit breakers.
+
+        Returns:
+            list[dict]: For each instance IP address connected to, its
+                instance URI, IP address, circuit state ("closed", "open" or
+                "half-open"), consecutive failures, and how many times the
+                circuit opened and turned down connection attempts. Empty if
+                the circuit breaker is disabled.
+        """
+        if self._breakers is None:
+            return []
+        return self._breakers.stats()
 
     def metadata_exchange(
         self,
@@ -283,6 +862,7 @@ class Connector:
         ip_address: str,
         ctx: ssl.SSLContext,
         enable_iam_auth: bool,
+        timeout: Optional[float] = None,
     ) -> ssl.SSLSocket:
         """
         Sends metadata about the connection prior to the database
@@ -310,23 +890,29 @@ class Connector:
             ctx (ssl.SSLContext): Context used to create a TLS connection
                 with AlloyDB instance ssl certificates.
             enable_iam_auth (bool): Flag to enable IAM database authentication.
+            timeout (float): Seconds allowed for the dial, TLS handshake and
+                exchange. Defaults to None, which only bounds each read of
+                the exchange by IO_TIMEOUT.
 
         Returns:
-            sock (ssl.SSLSocket): mTLS/SSL socket connected to AlloyDB Proxy server.
+            sock (ssl.SSLSocket): mTLS/SSL socket connected to AlloyDB Proxy
+                server. The socket is closed if the exchange fails.
         """
-        # Create socket and wrap with SSL/TLS context
-        sock = ctx.wrap_socket(
-            socket.create_connection((ip_address, SERVER_PROXY_PORT)),
-            server_hostname=ip_address,
-        )
         # set auth type for metadata exchange
+        # the metadata exchange messages are imported on first use, as
+        # drivers that don't use it shouldn't pay for importing them
+        import google.cloud.alloydb_connectors_v1.proto.resources_pb2 as connectorspb
+
         auth_type = connectorspb.MetadataExchangeRequest.DB_NATIVE
         if enable_iam_auth:
             auth_type = connectorspb.MetadataExchangeRequest.AUTO_IAM
 
-        # Ensure the credentials are in fact valid before proceeding.
-        if not self._db_credentials.token_state == TokenState.FRESH:
-            self._db_credentials.refresh(requests.Request())
+        # Ensure the credentials are in fact valid before proceeding. The
+        # request is re-serialized only when the token changes.
+        payload = self._token_manager.metadata_exchange_request(
+            f"{self._client._user_agent}",  # type: ignore
+            auth_type,
+        )
 
         logger.debug(
             f"['{instance_uri}']: Metadata exchange started "
@@ -335,72 +921,85 @@ class Connector:
             f"token size={len(self._db_credentials.token)}"
         )
 
-        # form metadata exchange request
-        req = connectorspb.MetadataExchangeRequest(
-            user_agent=f"{self._client._user_agent}",  # type: ignore
-            auth_type=auth_type,
-            oauth2_token=self._db_credentials.token,
+        # Create socket and wrap with SSL/TLS context. With a timeout, the dial
+        # and TLS handshake are bounded by it.
+        deadline = _deadline(timeout)
+        raw_sock = socket.create_connection(
+            (ip_address, SERVER_PROXY_PORT), timeout=timeout
         )
+        try:
+            sock = ctx.wrap_socket(raw_sock, server_hostname=ip_address)
+        except BaseException:
+            raw_sock.close()
+            raise
 
-        # set I/O timeout
-        sock.settimeout(IO_TIMEOUT)
+        # close the socket if the exchange fails
+        try:
+            # set I/O timeout
+            remaining = _remaining(deadline)
+            sock.settimeout(
+                IO_TIMEOUT if remaining is None else min(IO_TIMEOUT, remaining)
+            )
 
-        # pack big-endian unsigned integer (4 bytes)
-        packed_len = struct.pack(">I", req.ByteSize())
+            # send metadata message length and request message
+            sock.sendall(payload)
 
-        # send metadata message length and request message
-        sock.sendall(packed_len + req.SerializeToString())
+            # form metadata exchange response
+            resp = connectorspb.MetadataExchangeResponse()
 
-        # form metadata exchange response
-        resp = connectorspb.MetadataExchangeResponse()
+            # read metadata message length (4 bytes)
+            message_len_buffer_size = struct.Struct(">I").size
+            message_len_buffer = b""
+            while message_len_buffer_size > 0:
+                chunk = sock.recv(message_len_buffer_size)
+                if not chunk:
+                    raise RuntimeError(
+                        "Connection closed while getting metadata exchange length!"
+                    )
+                message_len_buffer += chunk
+                message_len_buffer_size -= len(chunk)
 
-        # read metadata message length (4 bytes)
-        message_len_buffer_size = struct.Struct(">I").size
-        message_len_buffer = b""
-        while message_len_buffer_size > 0:
-            chunk = sock.recv(message_len_buffer_size)
-            if not chunk:
-                raise RuntimeError(
-                    "Connection closed while getting metadata exchange length!"
-                )
-            message_len_buffer += chunk
-            message_len_buffer_size -= len(chunk)
-
-        (message_len,) = struct.unpack(">I", message_len_buffer)
-
-        # read metadata exchange message
-        buffer = b""
-        while message_len > 0:
-            chunk = sock.recv(message_len)
-            if not chunk:
-                raise RuntimeError(
-                    "Connection closed while performing metadata exchange!"
-                )
-            buffer += chunk
-            message_len -= len(chunk)
+            (message_len,) = struct.unpack(">I", message_len_buffer)
 
-        # parse metadata exchange response from buffer
-        resp.ParseFromString(buffer)
+            # read metadata exchange message
+            buffer = b""
+            while message_len > 0:
+                chunk = sock.recv(message_len)
+                if not chunk:
+                    raise RuntimeError(
+                        "Connection closed while performing metadata exchange!"
+                    )
+                buffer += chunk
+                message_len -= len(chunk)
 
-        # reset socket back to blocking mode
-        sock.setblocking(True)
+            # parse metadata exchange response from buffer
+            resp.ParseFromString(buffer)
 
-        # validate metadata exchange response
-        if resp.response_code != connectorspb.MetadataExchangeResponse.OK:
-            raise ValueError(
-                f"Metadata Exchange request has failed with error: {resp.error}"
-            )
+            # reset socket back to blocking mode
+            sock.setblocking(True)
 
-        return sock
+            # validate metadata exchange response
+            if resp.response_code != connectorspb.MetadataExchangeResponse.OK:
+                raise MetadataExchangeError(
+                    f"Metadata Exchange request has failed with error: {resp.error}"
+                )
+
+            return sock
+        except BaseException:
+            sock.close()
+            raise
 
     async def _remove_cached(self, instance_uri: str) -> None:
         """Stops all background refreshes and deletes the connection
         info cache from the map of caches.
         """
         logger.debug(f"['{instance_uri}']: Removing connection info from cache")
-        # remove cache from stored caches and close it
-        cache = self._cache.pop(instance_uri)
-        await cache.close()
+        # remove cache from stored caches and close it; a concurrent failed
+        # connection may have removed it already
+        with self._lock:
+            cache = self._cache.pop(instance_uri, None)
+        if cache is not None:
+            await cache.close()
 
     def __enter__(self) -> "Connector":
         """Enter context manager by returning Connector object"""
@@ -417,14 +1016,27 @@ class Connector:
 
     def close(self) -> None:
         """Close Connector by stopping tasks and releasing resources."""
+        # pool workers open connections on the loop, so pools are closed
+        # while it still runs
+        with self._lock:
+            pools = list(self._pools)
+        for _, pool, _ in pools:
+            if not pool.closed:
+                pool.close()
+        if self._credentials_resolved:
+            self._token_manager.close()
         if self._loop.is_running():
             close_future = asyncio.run_coroutine_threadsafe(
                 self.close_async(), loop=self._loop
             )
             # Will attempt to gracefully shut down tasks for 3s
             close_future.result(timeout=3)
+        if self._shared_loop is not None:
+            # other connectors may still be using the loop
+            if not self._closed:
+                release_loop_thread(self._shared_loop)
         # if background thread exists for Connector, clean it up
-        if self._thread.is_alive():
+        elif self._thread.is_alive():
             if self._loop.is_running():
                 # stop event loop running in background thread
                 self._loop.call_soon_threadsafe(self._loop.stop)
@@ -435,4 +1047,10 @@ class Connector:
     async def close_async(self) -> None:
         """Helper function to cancel RefreshAheadCaches' tasks
         and close client."""
+        with self._lock:
+            pools = list(self._pools)
+        for _, _, rotation in pools:
+            rotation.close()
         await asyncio.gather(*[cache.close() for cache in self._cache.values()])
+        if self._client is not None:
+            self._client.close()
@@ -48,3 +48,19 @@ class RefreshStrategy(Enum):
             f"Incorrect value for refresh_strategy, got '{value}'. Want one of: "
             f"{', '.join([repr(m.value) for m in cls])}."
         )
+
+
+class AdminAPITransport(Enum):
+    """
+    Enum for specifying the transport of AlloyDB Admin API calls.
+    """
+
+    GRPC = "GRPC"
+    REST = "REST"
+
+    @classmethod
+    def _missing_(cls, value: object) -> None:
+        raise ValueError(
+            f"Incorrect value for admin_api_transport, got '{value}'. Want one "
+            f"of: {', '.join([repr(m.value) for m in cls])}."
+        )
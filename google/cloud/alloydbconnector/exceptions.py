@@ -23,3 +23,11 @@ class IPTypeNotFoundError(Exception):
 
 class ClosedConnectorError(Exception):
     pass
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class MetadataExchangeError(ValueError):
+    pass
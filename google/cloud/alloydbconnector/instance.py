@@ -20,12 +20,18 @@ from datetime import timedelta
 from datetime import timezone
 import logging
 import re
+import threading
+import time
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Optional
 
 from google.cloud.alloydbconnector.connection_info import ConnectionInfo
 from google.cloud.alloydbconnector.exceptions import RefreshError
 from google.cloud.alloydbconnector.rate_limiter import AsyncRateLimiter
 from google.cloud.alloydbconnector.refresh_utils import _is_valid
+from google.cloud.alloydbconnector.refresh_utils import _RefreshStats
 from google.cloud.alloydbconnector.refresh_utils import _seconds_until_refresh
 
 if TYPE_CHECKING:
@@ -70,6 +76,9 @@ class RefreshAheadCache:
             ex. projects/<PROJECT>/locations/<REGION>/clusters/<CLUSTER>/instances/<INSTANCE>
         client (AlloyDBClient): Client used to make requests to AlloyDB APIs.
         keys (tuple[rsa.RSAPrivateKey, str]): Private and Public key pair.
+        on_change (Callable): Called with the instance URI and the previous
+            and new connection info after each successful refresh but the
+            first.
     """
 
     def __init__(
@@ -77,6 +86,9 @@ class RefreshAheadCache:
         instance_uri: str,
         client: AlloyDBClient,
         keys: asyncio.Future[tuple[rsa.RSAPrivateKey, str]],
+        on_change: Optional[
+            Callable[[str, ConnectionInfo, ConnectionInfo], None]
+        ] = None,
     ) -> None:
         # validate and parse instance_uri
         self._project, self._region, self._cluster, self._name = _parse_instance_uri(
@@ -91,6 +103,19 @@ class RefreshAheadCache:
             rate=1 / 30,
         )
         self._refresh_in_progress = asyncio.locks.Event()
+        # whether the last refresh failed while the current connection info
+        # is still valid, and how often it was served since
+        self._stale = False
+        self.stale_served = 0
+        # connections on other threads count stale connection info too
+        self._stale_lock = threading.Lock()
+        self._on_change = on_change
+        # the result of the last successful refresh
+        self._last: Optional[ConnectionInfo] = None
+        # the result of _current once it succeeded, published for threads
+        # other than the event loop's, which must not touch its tasks
+        self._ready: Optional[ConnectionInfo] = None
+        self._refresh_stats = _RefreshStats()
         # For the initial refresh operation, set current = next so that
         # connection requests block until the first refresh is complete.
         self._current: asyncio.Task = self._schedule_refresh(0)
@@ -150,6 +175,7 @@ class RefreshAheadCache:
             asyncio.Task[ConnectionInfo]: A task representing the scheduled
                 refresh operation.
         """
+        self._refresh_stats.scheduled(delay)
         return asyncio.create_task(self._refresh_operation(delay))
 
     async def _refresh_operation(self, delay: int) -> ConnectionInfo:
@@ -164,9 +190,11 @@ class RefreshAheadCache:
             ConnectionInfo: Refresh result for an AlloyDB instance.
         """
         refresh_task: asyncio.Task
+        started = 0.0
         try:
             if delay > 0:
                 await asyncio.sleep(delay)
+            started = time.monotonic()
             refresh_task = asyncio.create_task(self._perform_refresh())
             refresh_result = await refresh_task
             # check that refresh is valid
@@ -180,7 +208,8 @@ class RefreshAheadCache:
             )
             raise
         # bad refresh attempt
-        except Exception:
+        except Exception as e:
+            self._refresh_stats.failed(started, e)
             logger.info(
                 f"['{self._instance_uri}']: "
                 "An error occurred while performing refresh. "
@@ -190,11 +219,25 @@ class RefreshAheadCache:
             # don't want to replace valid result with invalid refresh
             if not await _is_valid(self._current):
                 self._current = refresh_task
+                self._ready = None
+                self._stale = False
+            elif not self._stale:
+                logger.warning(
+                    f"['{self._instance_uri}']: Serving stale connection info "
+                    "until it expires or a refresh succeeds"
+                )
+                self._stale = True
             # schedule new refresh attempt immediately
             self._next = self._schedule_refresh(0)
             raise
         # if valid refresh, replace current with valid refresh result and schedule next refresh
+        self._refresh_stats.succeeded(started)
         self._current = refresh_task
+        self._ready = refresh_result
+        self._stale = False
+        previous, self._last = self._last, refresh_result
+        if previous is not None and self._on_change is not None:
+            self._on_change(self._instance_uri, previous, refresh_result)
         # calculate refresh delay based on certificate expiration
         delay = _seconds_until_refresh(refresh_result.expiration)
         logger.debug(
@@ -219,12 +262,63 @@ class RefreshAheadCache:
         # block all sequential connection attempts on the next refresh result if current is invalid
         if not await _is_valid(self._current):
             self._current = self._next
+            self._ready = None
 
     async def connect_info(self) -> ConnectionInfo:
         """Retrieves ConnectionInfo instance for establishing a secure
         connection to the AlloyDB instance.
         """
-        return await self._current
+        if self._stale:
+            self._count_stale()
+        # a caller giving up must not cancel the refresh shared by all callers
+        return await asyncio.shield(self._current)
+
+    def connect_info_nowait(self) -> Optional[ConnectionInfo]:
+        """Returns the current ConnectionInfo if it is ready and valid, without
+        waiting on a refresh.
+
+        Unlike connect_info(), this may be called from any thread. It reads
+        the published result without locking.
+        """
+        conn_info = self._ready
+        if conn_info is not None and datetime.now(timezone.utc) < conn_info.expiration:
+            if self._stale:
+                self._count_stale()
+            return conn_info
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns the state of the cache. May be called from any thread.
+
+        Returns:
+            dict: The refresh strategy, the certificate expiration and IP
+                addresses of the current connection info, whether its SSL
+                context is built, the next scheduled refresh, the duration,
+                outcome and error of the last refresh, consecutive failed
+                refreshes, whether stale connection info is served and how
+                often, and the refresh rate limiter's available tokens.
+        """
+        info = self._ready
+        return {
+            "refresh_strategy": "BACKGROUND",
+            "expiration": info.expiration if info else None,
+            "ip_addrs": dict(info.ip_addrs) if info else {},
+            "ssl_context_built": info is not None and info.context is not None,
+            **self._refresh_stats.as_dict(),
+            "serving_stale": self._stale,
+            "stale_served": self.stale_served,
+            "rate_limiter_tokens": self._refresh_rate_limiter.tokens,
+        }
+
+    def _count_stale(self) -> None:
+        with self._stale_lock:
+            self.stale_served += 1
+
+    @property
+    def serving_stale(self) -> bool:
+        """Whether the connection info is served while refreshing it fails."""
+        return self._stale
 
     async def close(self) -> None:
         """
@@ -234,6 +328,7 @@ class RefreshAheadCache:
             f"['{self._instance_uri}']: Canceling connection info refresh"
             " operation tasks"
         )
+        self._ready = None
         self._current.cancel()
         self._next.cancel()
         # gracefully wait for tasks to cancel
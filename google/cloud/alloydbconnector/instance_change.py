@@ -0,0 +1,112 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import inspect
+import logging
+import threading
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+
+if TYPE_CHECKING:
+    from google.cloud.alloydbconnector.connection_info import ConnectionInfo
+
+logger = logging.getLogger(name=__name__)
+
+
+@dataclass(frozen=True)
+class InstanceChange:
+    """The connection info of an instance before and after a refresh."""
+
+    instance_uri: str
+    previous: ConnectionInfo
+    current: ConnectionInfo
+
+    @property
+    def ip_addrs_changed(self) -> bool:
+        """Whether the instance's IP addresses changed, e.g. on failover or
+        a PSC endpoint change."""
+        return self.previous.ip_addrs != self.current.ip_addrs
+
+    @property
+    def cert_rotated(self) -> bool:
+        """Whether the client certificate or the instance's CA changed."""
+        return self.previous.cert_digest != self.current.cert_digest
+
+
+class InstanceChangeListeners:
+    """
+    The callbacks subscribed to a connector's instance changes.
+
+    Callbacks are called on the connector's event loop with an
+    InstanceChange. A callback may return an awaitable, which is run as a
+    task on the loop. Errors raised by callbacks are logged and otherwise
+    ignored. Callbacks may be subscribed and unsubscribed from any thread.
+    """
+
+    def __init__(self) -> None:
+        self._callbacks: list[Callable[[InstanceChange], Any]] = []
+        self._lock = threading.Lock()
+        self._tasks: set[asyncio.Task] = set()
+
+    def add(self, callback: Callable[[InstanceChange], Any]) -> Callable[[], None]:
+        """Subscribes a callback and returns a function unsubscribing it."""
+        with self._lock:
+            self._callbacks.append(callback)
+
+        def remove() -> None:
+            with self._lock:
+                if callback in self._callbacks:
+                    self._callbacks.remove(callback)
+
+        return remove
+
+    def notify(
+        self, instance_uri: str, previous: ConnectionInfo, current: ConnectionInfo
+    ) -> None:
+        """Calls the callbacks if the connection info of an instance changed.
+
+        Must be called on the connector's event loop.
+        """
+        change = InstanceChange(instance_uri, previous, current)
+        if not (change.ip_addrs_changed or change.cert_rotated):
+            return
+        if change.ip_addrs_changed:
+            logger.debug(
+                f"['{instance_uri}']: IP addresses changed from "
+                f"{previous.ip_addrs} to {current.ip_addrs}"
+            )
+        with self._lock:
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            try:
+                result = callback(change)
+            except Exception as e:
+                logger.warning(
+                    f"['{instance_uri}']: Instance change callback failed: {e}"
+                )
+                continue
+            if inspect.isawaitable(result):
+                task = asyncio.ensure_future(result)
+                self._tasks.add(task)
+                task.add_done_callback(self._done)
+
+    def _done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Instance change callback failed: {task.exception()}")
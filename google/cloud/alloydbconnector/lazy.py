@@ -17,15 +17,22 @@ from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
 import logging
+import time
+from typing import Any
+from typing import Callable
 from typing import Optional
 
 from google.cloud.alloydbconnector.client import AlloyDBClient
 from google.cloud.alloydbconnector.connection_info import ConnectionInfo
 from google.cloud.alloydbconnector.instance import _parse_instance_uri
 from google.cloud.alloydbconnector.refresh_utils import _refresh_buffer
+from google.cloud.alloydbconnector.refresh_utils import _RefreshStats
 
 logger = logging.getLogger(name=__name__)
 
+# seconds between refresh attempts while serving stale connection info
+_stale_retry_interval = 30
+
 
 class LazyRefreshCache:
     """Cache that refreshes connection info when a caller requests a connection.
@@ -34,6 +41,10 @@ class LazyRefreshCache:
     certificate is close to or already expired.
 
     This is the recommended option for serverless environments.
+
+    If a refresh fails while the cached certificate has not expired yet, the
+    cached connection info is served until it expires, retrying the refresh
+    at most every 30 seconds.
     """
 
     def __init__(
@@ -41,6 +52,9 @@ class LazyRefreshCache:
         instance_uri: str,
         client: AlloyDBClient,
         keys: asyncio.Future,
+        on_change: Optional[
+            Callable[[str, ConnectionInfo, ConnectionInfo], None]
+        ] = None,
     ) -> None:
         """Initializes a LazyRefreshCache instance.
 
@@ -50,6 +64,9 @@ class LazyRefreshCache:
             client (AlloyDBClient): The AlloyDB client instance.
             keys (asyncio.Future): A future to the client's public-private key
                 pair.
+            on_change (Callable): Called with the instance URI and the
+                previous and new connection info after each successful
+                refresh but the first.
         """
         # validate and parse instance connection name
         self._project, self._region, self._cluster, self._name = _parse_instance_uri(
@@ -60,8 +77,15 @@ class LazyRefreshCache:
         self._keys = keys
         self._client = client
         self._lock = asyncio.Lock()
+        self._on_change = on_change
         self._cached: Optional[ConnectionInfo] = None
         self._needs_refresh = False
+        # whether a refresh failed while the cached connection info is still
+        # valid, and how often it was served since
+        self._stale = False
+        self._retry_at = 0.0
+        self.stale_served = 0
+        self._refresh_stats = _RefreshStats()
 
     async def force_refresh(self) -> None:
         """
@@ -90,9 +114,17 @@ class LazyRefreshCache:
                     "is still valid, using cached info"
                 )
                 return self._cached
+            if (
+                self._stale
+                and self._serve_stale()
+                and time.monotonic() < self._retry_at
+            ):
+                self.stale_served += 1
+                return self._cached  # type: ignore[return-value]
             logger.debug(
                 f"['{self._instance_uri}']: Connection info refresh operation started"
             )
+            started = time.monotonic()
             try:
                 conn_info = await self._client.get_connection_info(
                     self._project,
@@ -102,11 +134,23 @@ class LazyRefreshCache:
                     self._keys,
                 )
             except Exception as e:
+                self._refresh_stats.failed(started, e)
                 logger.debug(
                     f"['{self._instance_uri}']: Connection info "
                     f"refresh operation failed: {str(e)}"
                 )
-                raise
+                if not self._serve_stale():
+                    self._stale = False
+                    raise
+                if not self._stale:
+                    logger.warning(
+                        f"['{self._instance_uri}']: Serving stale connection "
+                        "info until it expires or a refresh succeeds"
+                    )
+                self._stale = True
+                self._retry_at = time.monotonic() + _stale_retry_interval
+                self.stale_served += 1
+                return self._cached  # type: ignore[return-value]
             logger.debug(
                 f"['{self._instance_uri}']: Connection info "
                 "refresh operation completed successfully"
@@ -115,10 +159,76 @@ class LazyRefreshCache:
                 f"['{self._instance_uri}']: Current certificate "
                 f"expiration = {str(conn_info.expiration)}"
             )
-            self._cached = conn_info
+            self._refresh_stats.succeeded(started)
+            previous, self._cached = self._cached, conn_info
             self._needs_refresh = False
+            self._stale = False
+            if previous is not None and self._on_change is not None:
+                self._on_change(self._instance_uri, previous, conn_info)
             return conn_info
 
+    def connect_info_nowait(self) -> Optional[ConnectionInfo]:
+        """Returns the cached ConnectionInfo if it can be used without a
+        refresh.
+
+        Unlike connect_info(), this may be called from any thread.
+        """
+        cached = self._cached
+        if (
+            cached
+            and not self._needs_refresh
+            and datetime.now(timezone.utc)
+            < (cached.expiration - timedelta(seconds=_refresh_buffer))
+        ):
+            return cached
+        return None
+
+    def _serve_stale(self) -> bool:
+        """Returns whether the cached connection info can still be served
+        after a failed refresh."""
+        return (
+            self._cached is not None
+            and datetime.now(timezone.utc) < self._cached.expiration
+        )
+
+    @property
+    def serving_stale(self) -> bool:
+        """Whether the connection info is served while refreshing it fails."""
+        return self._stale
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns the state of the cache. May be called from any thread.
+
+        Connection info is only refreshed by connections, so the next refresh
+        is the earliest time a connection will refresh it. There is no rate
+        limiter, so no tokens are reported.
+
+        Returns:
+            dict: The same keys as RefreshAheadCache.stats().
+        """
+        info = self._cached
+        stats = self._refresh_stats.as_dict()
+        if info is None or self._needs_refresh:
+            stats["next_refresh"] = None
+        elif self._stale:
+            retry_in = max(self._retry_at - time.monotonic(), 0)
+            stats["next_refresh"] = datetime.now(timezone.utc) + timedelta(
+                seconds=retry_in
+            )
+        else:
+            stats["next_refresh"] = info.expiration - timedelta(seconds=_refresh_buffer)
+        return {
+            "refresh_strategy": "LAZY",
+            "expiration": info.expiration if info else None,
+            "ip_addrs": dict(info.ip_addrs) if info else {},
+            "ssl_context_built": info is not None and info.context is not None,
+            **stats,
+            "serving_stale": self._stale,
+            "stale_served": self.stale_served,
+            "rate_limiter_tokens": None,
+        }
+
     async def close(self) -> None:
         """Close is a no-op and provided purely for a consistent interface with
         other cache types.
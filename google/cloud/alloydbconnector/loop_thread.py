@@ -0,0 +1,104 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import threading
+
+logger = logging.getLogger(name=__name__)
+
+
+class LoopThread:
+    """
+    An event loop running forever in a daemon thread.
+
+    Args:
+        name (str): Name of the thread.
+    """
+
+    def __init__(self, name: str = "alloydb-connector-loop") -> None:
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+            target=self.loop.run_forever, name=name, daemon=True
+        )
+        self.thread.start()
+        # number of connectors using the loop
+        self.refs = 0
+
+    def stop(self) -> None:
+        """Stops the loop and waits for its thread to finish."""
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        if self.thread is not threading.current_thread():
+            self.thread.join()
+
+
+_lock = threading.Lock()
+_shared: list[LoopThread] = []
+_thread_count = 1
+_thread_ids = itertools.count()
+
+
+def configure_loop_threads(threads: int = 1) -> None:
+    """
+    Configures the number of loop threads shared by Connectors created with
+    shared_loop=True.
+
+    Each new Connector is assigned to the shared loop thread used by the
+    fewest Connectors, starting a new thread while there are fewer than the
+    given number. Existing Connectors keep their loop thread.
+
+    Args:
+        threads (int): Number of shared loop threads. Defaults to 1.
+    """
+    if threads < 1:
+        raise ValueError(f"Arg `threads` must be at least 1, got {threads}.")
+    global _thread_count
+    with _lock:
+        _thread_count = threads
+
+
+def acquire_loop_thread() -> LoopThread:
+    """Returns the least used shared loop thread and adds a reference to it,
+    starting a new thread if fewer than the configured number are running."""
+    with _lock:
+        if len(_shared) < _thread_count:
+            loop_thread = LoopThread(f"alloydb-connector-loop-{next(_thread_ids)}")
+            _shared.append(loop_thread)
+            logger.debug(f"Started shared loop thread {loop_thread.thread.name}")
+        else:
+            loop_thread = min(_shared[:_thread_count], key=lambda t: t.refs)
+        loop_thread.refs += 1
+        return loop_thread
+
+
+def release_loop_thread(loop_thread: LoopThread) -> None:
+    """Removes a reference to a shared loop thread, stopping the thread when
+    no Connector uses it anymore."""
+    with _lock:
+        loop_thread.refs -= 1
+        if loop_thread.refs > 0:
+            return
+        _shared.remove(loop_thread)
+    logger.debug(f"Stopping shared loop thread {loop_thread.thread.name}")
+    loop_thread.stop()
+
+
+def loop_thread_count() -> int:
+    """Returns the number of running shared loop threads."""
+    with _lock:
+        return len(_shared)
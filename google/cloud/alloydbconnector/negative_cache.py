@@ -0,0 +1,114 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import NamedTuple
+from typing import Optional
+
+from google.cloud.alloydbconnector.enums import IPTypes
+from google.cloud.alloydbconnector.exceptions import IPTypeNotFoundError
+
+logger = logging.getLogger(name=__name__)
+
+# seconds an error is remembered after its first occurrence, doubling with
+# each consecutive occurrence up to the maximum
+_PERMANENT_TTL = 10.0
+_PERMANENT_MAX_TTL = 300.0
+_TRANSIENT_TTL = 1.0
+_TRANSIENT_MAX_TTL = 30.0
+
+
+def _is_permanent(e: Exception) -> bool:
+    """Returns whether getting connection info failed for good, as opposed
+    to failing on an error that may go away on its own."""
+    from google.api_core.exceptions import InvalidArgument
+    from google.api_core.exceptions import NotFound
+    from google.api_core.exceptions import PermissionDenied
+
+    # errors that retrying won't fix until the caller or the instance changes
+    return isinstance(
+        e, (NotFound, PermissionDenied, InvalidArgument, IPTypeNotFoundError)
+    )
+
+
+class _Failure(NamedTuple):
+    error: Exception
+    # consecutive occurrences
+    occurrences: int
+    expires_at: float
+
+
+class NegativeCache:
+    """
+    Remembers errors getting an instance's connection info, so that
+    connection attempts fail fast with the same error instead of calling the
+    AlloyDB Admin API again.
+
+    Errors from the Admin API are remembered per instance, errors for a
+    missing IP address type per instance and IP type. Permanent errors
+    (e.g. permission denied, instance not found, IP type not found) are
+    remembered for longer than transient ones, and each consecutive
+    occurrence doubles the time, up to a maximum.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._failures: dict[tuple[str, Optional[IPTypes]], _Failure] = {}
+
+    def __len__(self) -> int:
+        return len(self._failures)
+
+    def check(self, instance_uri: str, ip_type: IPTypes) -> None:
+        """Raises the remembered error for an instance and IP type, if any."""
+        if not self._failures:
+            return
+        now = time.monotonic()
+        for key in ((instance_uri, None), (instance_uri, ip_type)):
+            failure = self._failures.get(key)
+            if failure is not None and now < failure.expires_at:
+                logger.debug(
+                    f"['{instance_uri}']: Failing fast with error remembered "
+                    f"for {failure.expires_at - now:.1f}s: {failure.error}"
+                )
+                raise failure.error.with_traceback(None)
+
+    def record(self, instance_uri: str, ip_type: IPTypes, e: Exception) -> None:
+        """Remembers an error getting an instance's connection info."""
+        if isinstance(e, IPTypeNotFoundError):
+            key: tuple[str, Optional[IPTypes]] = (instance_uri, ip_type)
+            ttl, max_ttl = _PERMANENT_TTL, _PERMANENT_MAX_TTL
+        elif _is_permanent(e):
+            key = (instance_uri, None)
+            ttl, max_ttl = _PERMANENT_TTL, _PERMANENT_MAX_TTL
+        else:
+            key = (instance_uri, None)
+            ttl, max_ttl = _TRANSIENT_TTL, _TRANSIENT_MAX_TTL
+        with self._lock:
+            previous = self._failures.get(key)
+            occurrences = previous.occurrences + 1 if previous is not None else 1
+            ttl = min(ttl * 2 ** (occurrences - 1), max_ttl)
+            self._failures[key] = _Failure(e, occurrences, time.monotonic() + ttl)
+
+    def clear(self, instance_uri: str, ip_type: IPTypes) -> None:
+        """Forgets the errors of an instance and IP type that got its
+        connection info."""
+        if not self._failures:
+            return
+        with self._lock:
+            self._failures.pop((instance_uri, None), None)
+            self._failures.pop((instance_uri, ip_type), None)
@@ -25,7 +25,9 @@ def connect(sock: "ssl.SSLSocket", **kwargs: Any) -> "pg8000.dbapi.Connection":
 
     Args:
         sock (ssl.SSLSocket): SSL/TLS secure socket stream connected to the
-            AlloyDB proxy server.
+            AlloyDB proxy server. It is closed if the connection fails.
+        timeout (float): Seconds allowed for the handshake. Defaults to None,
+            for no timeout.
 
     Returns:
         pg8000.dbapi.Connection: A pg8000 Connection object for
@@ -41,10 +43,20 @@ def connect(sock: "ssl.SSLSocket", **kwargs: Any) -> "pg8000.dbapi.Connection":
     user = kwargs.pop("user")
     db = kwargs.pop("db")
     passwd = kwargs.pop("password", None)
-    return pg8000.dbapi.connect(
-        user,
-        database=db,
-        password=passwd,
-        sock=sock,
-        **kwargs,
-    )
+    # pg8000 ignores its timeout for a given socket, so bound the handshake
+    # with a socket timeout instead
+    timeout = kwargs.pop("timeout", None)
+    sock.settimeout(timeout)
+    try:
+        conn = pg8000.dbapi.connect(
+            user,
+            database=db,
+            password=passwd,
+            sock=sock,
+            **kwargs,
+        )
+    except BaseException:
+        sock.close()
+        raise
+    sock.settimeout(None)
+    return conn
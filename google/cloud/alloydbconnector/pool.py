@@ -0,0 +1,212 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from datetime import timezone
+import inspect
+import logging
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+from google.cloud.alloydbconnector.refresh_utils import _refresh_buffer
+
+if TYPE_CHECKING:
+    from google.cloud.alloydbconnector.connection_info import ConnectionInfo
+    from google.cloud.alloydbconnector.instance_change import InstanceChange
+
+logger = logging.getLogger(name=__name__)
+
+
+def _seconds_until_recycle(expiration: datetime) -> float:
+    """Returns the seconds until connections made with a certificate expiring
+    at the given time should be recycled."""
+    remaining = (expiration - datetime.now(timezone.utc)).total_seconds()
+    return max(remaining - _refresh_buffer, 0)
+
+
+def _max_lifetime(expiration: datetime, max_lifetime: float) -> float:
+    """Caps a pool's connection max lifetime at the time left before
+    connections made with a certificate expiring at the given time should be
+    recycled."""
+    recycle_in = _seconds_until_recycle(expiration)
+    # a certificate that is already due is about to be refreshed
+    if recycle_in > 0:
+        return min(max_lifetime, recycle_in)
+    return max_lifetime
+
+
+def _pool_stats(instance_uri: str, pool: Any, rotation: PoolRotation) -> dict[str, Any]:
+    """Returns the state of an asyncpg or psycopg_pool connection pool."""
+    if hasattr(pool, "get_idle_size"):
+        # asyncpg.Pool
+        size = pool.get_size()
+        idle = pool.get_idle_size()
+        min_size = pool.get_min_size()
+        max_size = pool.get_max_size()
+        closed = pool.is_closing()
+    else:
+        # psycopg_pool.ConnectionPool or AsyncConnectionPool
+        measures = pool.get_stats()
+        size = measures["pool_size"]
+        idle = measures["pool_available"]
+        min_size = pool.min_size
+        max_size = pool.max_size
+        closed = pool.closed
+    return {
+        "instance_uri": instance_uri,
+        "size": size,
+        "idle": idle,
+        "min_size": min_size,
+        "max_size": max_size,
+        "closed": closed,
+        "ip_address": rotation.ip_address,
+        "expiration": rotation.expiration,
+        "recycles": rotation.recycles,
+        "last_recycle_reason": rotation.last_recycle_reason,
+    }
+
+
+class PoolRotation:
+    """
+    Recycles the connections of a connection pool when the instance's client
+    certificate is about to expire or its IP address changes.
+
+    The pool's connection factory reports every new connection with
+    observe(), and the connector's instance changes with instance_changed().
+    Recycling calls the given function, which should make the
+    pool replace its connections (e.g. asyncpg's Pool.expire_connections or
+    psycopg_pool's ConnectionPool.drain). It may return an awaitable, which
+    is run as a task on the loop.
+
+    Args:
+        instance_uri (str): The instance URI of the AlloyDB instance.
+        recycle (Callable): Makes the pool replace its connections.
+        loop (asyncio.AbstractEventLoop): The loop used to schedule
+            recycling ahead of certificate expiry.
+    """
+
+    def __init__(
+        self,
+        instance_uri: str,
+        recycle: Callable[[], Any],
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        self._instance_uri = instance_uri
+        self._recycle_fn = recycle
+        self._loop = loop
+        self._ip_address: Optional[str] = None
+        self._expiration: Optional[datetime] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+        self.recycles = 0
+        self.last_recycle_reason: Optional[str] = None
+        self._closed = False
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    @property
+    def ip_address(self) -> Optional[str]:
+        return self._ip_address
+
+    @property
+    def expiration(self) -> Optional[datetime]:
+        return self._expiration
+
+    def observe(self, conn_info: ConnectionInfo, ip_address: str) -> None:
+        """
+        Records the connection info a new pool connection was made with.
+
+        Must be called on the rotation's event loop.
+
+        Args:
+            conn_info (ConnectionInfo): The connection info used.
+            ip_address (str): The IP address connected to.
+        """
+        if self._closed:
+            return
+        if self._ip_address is not None and ip_address != self._ip_address:
+            self._ip_address = ip_address
+            self.recycle(f"IP address changed to {ip_address}")
+        self._ip_address = ip_address
+        # only the latest certificate matters; connections made with an
+        # older one are recycled together with it
+        if self._expiration is None or conn_info.expiration > self._expiration:
+            self._expiration = conn_info.expiration
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = self._loop.call_later(
+                _seconds_until_recycle(conn_info.expiration),
+                self.recycle,
+                "client certificate expiring",
+            )
+
+    def instance_changed(self, change: InstanceChange) -> None:
+        """
+        Recycles the pool's connections right away if the instance no longer
+        has the IP address they were made to, e.g. after a failover.
+
+        Must be called on the rotation's event loop.
+
+        Args:
+            change (InstanceChange): The instance's connection info before
+                and after a refresh.
+        """
+        if (
+            change.instance_uri != self._instance_uri
+            or self._ip_address is None
+            or self._ip_address in change.current.ip_addrs.values()
+        ):
+            return
+        reason = f"IP address {self._ip_address} no longer assigned"
+        # the next connection is made to the new IP address without
+        # recycling again
+        self._ip_address = None
+        self.recycle(reason)
+
+    def recycle(self, reason: str) -> None:
+        """Makes the pool replace its connections."""
+        if self._closed:
+            return
+        logger.debug(f"['{self._instance_uri}']: Recycling pool connections: {reason}")
+        self.recycles += 1
+        self.last_recycle_reason = reason
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._expiration = None
+        try:
+            result = self._recycle_fn()
+        except Exception as e:
+            logger.debug(
+                f"['{self._instance_uri}']: Recycling pool connections failed: {e}"
+            )
+            return
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result, loop=self._loop)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def close(self) -> None:
+        """Stops recycling the pool's connections."""
+        self._closed = True
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
@@ -0,0 +1,807 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections import deque
+import errno
+import itertools
+import logging
+import os
+import selectors
+import socket
+import ssl
+import threading
+from typing import Callable
+from typing import Optional
+from typing import Union
+
+logger = logging.getLogger(name=__name__)
+
+# bytes per recv() call; the buffer is shared by every connection of an engine
+DEFAULT_BUFFER_SIZE = 64 * 1024
+# maximum reads for one direction before yielding to other connections
+_MAX_READS_PER_EVENT = 16
+
+_READ = selectors.EVENT_READ
+_WRITE = selectors.EVENT_WRITE
+
+# Linux kernel TLS socket options (linux/tls.h)
+_SOL_TLS = 282
+_TLS_TX = 1
+_TLS_RX = 2
+_CAN_SPLICE = hasattr(os, "splice") and hasattr(os, "pipe2")
+
+# open proxied connections per AlloyDB IP address, of both the proxy engines
+# and the asyncio proxies
+_peers_lock = threading.Lock()
+_peers: Counter[str] = Counter()
+
+
+def _count_peer(ip_address: Optional[str], delta: int) -> None:
+    if ip_address is None:
+        return
+    with _peers_lock:
+        _peers[ip_address] += delta
+        if _peers[ip_address] <= 0:
+            del _peers[ip_address]
+
+
+def enable_ktls(context: ssl.SSLContext) -> bool:
+    """
+    Asks OpenSSL to offload TLS record encryption and decryption to the
+    kernel for sockets created from the context.
+
+    Offload only happens when the kernel has the tls module loaded and
+    OpenSSL was built with kTLS support; otherwise TLS stays in user space.
+
+    Args:
+        context (ssl.SSLContext): The context to configure. Must be called
+            before any socket is wrapped with it.
+
+    Returns:
+        bool: False if this Python build cannot request kernel TLS.
+    """
+    option = getattr(ssl, "OP_ENABLE_KTLS", None)
+    if option is None:
+        return False
+    context.options |= option
+    return True
+
+
+def _pending(sock: socket.socket) -> int:
+    """Returns the number of already decrypted bytes held by a TLS socket."""
+    return sock.pending() if isinstance(sock, ssl.SSLSocket) else 0
+
+
+def _ktls_offload(sock: socket.socket) -> tuple[bool, bool]:
+    """Returns whether (transmit, receive) records of a TLS socket are
+    handled by the kernel."""
+    if not _CAN_SPLICE or not isinstance(sock, ssl.SSLSocket):
+        return False, False
+    offload = []
+    for direction in (_TLS_TX, _TLS_RX):
+        try:
+            sock.getsockopt(_SOL_TLS, direction, 64)
+            offload.append(True)
+        except OSError:
+            offload.append(False)
+    return offload[0], offload[1]
+
+
+class _Pipe:
+    """One direction of a proxied connection.
+
+    A pipe is always waiting on exactly one (socket, event) pair: either its
+    source to become readable, or its destination to accept pending bytes.
+    TLS sockets can invert this (e.g. a read that needs the socket to be
+    writable), which is why the wait is tracked explicitly.
+    """
+
+    __slots__ = (
+        "src",
+        "dst",
+        "pending",
+        "wait_sock",
+        "wait_event",
+        "kpipe",
+        "in_kpipe",
+    )
+
+    def __init__(self, src: socket.socket, dst: socket.socket) -> None:
+        self.src = src
+        self.dst = dst
+        self.pending: Optional[bytes] = None
+        self.wait_sock = src
+        self.wait_event = _READ
+        # (read fd, write fd) of a kernel pipe when bytes are moved with
+        # splice() instead of passing through user space
+        self.kpipe: Optional[tuple[int, int]] = None
+        self.in_kpipe = 0
+
+
+class ProxyConnection:
+    """A Unix socket to TLS socket connection owned by a ProxyEngine.
+
+    All socket operations happen on the engine's thread; close() may be
+    called from any thread.
+    """
+
+    __slots__ = ("_engine", "listener", "local", "remote", "pipes", "closed", "peer")
+
+    def __init__(
+        self,
+        engine: ProxyEngine,
+        remote: socket.socket,
+        local: Optional[socket.socket] = None,
+        listener: Optional[socket.socket] = None,
+    ) -> None:
+        self._engine = engine
+        self.listener = listener
+        self.local = local
+        self.remote = remote
+        self.pipes: tuple[_Pipe, ...] = ()
+        self.closed = False
+        # the AlloyDB IP address connected to
+        self.peer: Optional[str] = None
+        if remote.family in (socket.AF_INET, socket.AF_INET6):
+            try:
+                self.peer = remote.getpeername()[0]
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """Closes both sockets (and a not yet accepted listener)."""
+        if self.closed:
+            return
+        try:
+            self._engine._call_soon(self._engine._close, self)
+        except RuntimeError:
+            # a stopped engine has already closed all of its connections
+            if not self._engine.stopped:
+                raise
+
+
+class ProxyEngine:
+    """
+    Forwards bytes for many proxied connections on a single thread.
+
+    Each connection pairs a local (Unix domain) socket used by a database
+    driver with a TLS socket connected to the AlloyDB server-side proxy. All
+    sockets are non-blocking and multiplexed with the platform's best
+    selector (epoll on Linux), so idle connections cost no threads and only
+    a few bytes of bookkeeping. When either side reaches EOF or errors, both
+    sockets are closed.
+
+    If the kernel handles TLS for the remote socket (see enable_ktls), each
+    offloaded direction is moved with splice() through a kernel pipe, so its
+    bytes are never copied into Python.
+
+    Args:
+        buffer_size (int): Size in bytes of the receive buffer shared by all
+            connections of the engine.
+    """
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._selector = selectors.DefaultSelector()
+        self._conns: set[ProxyConnection] = set()
+        # pipes of TLS sockets holding already decrypted bytes that the
+        # selector cannot report
+        self._ready: set[tuple[ProxyConnection, _Pipe]] = set()
+        self._calls: deque[tuple[Callable[..., None], tuple]] = deque()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._retired = False
+        # set under _lock once the engine can no longer run calls
+        self._stopped = False
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._wakeup_r.setblocking(False)
+        self._wakeup_w.setblocking(False)
+        self._selector.register(self._wakeup_r, _READ, None)
+
+    @property
+    def connection_count(self) -> int:
+        """The number of connections currently owned by the engine."""
+        return len(self._conns)
+
+    def proxy(
+        self, local: socket.socket, remote: Union[socket.socket, ssl.SSLSocket]
+    ) -> ProxyConnection:
+        """
+        Starts forwarding bytes between two connected sockets.
+
+        Args:
+            local (socket.socket): The socket connected to the database driver.
+            remote (ssl.SSLSocket): The TLS socket connected to the AlloyDB
+                proxy server.
+
+        Returns:
+            ProxyConnection: A handle that can be used to close the connection.
+        """
+        conn = ProxyConnection(self, remote, local=local)
+        self._call_soon(self._add, conn)
+        return conn
+
+    def accept_and_proxy(
+        self, listener: socket.socket, remote: Union[socket.socket, ssl.SSLSocket]
+    ) -> ProxyConnection:
+        """
+        Accepts a single connection on a listening socket, then forwards
+        bytes between it and the remote socket.
+
+        The listener is closed after the first connection is accepted.
+
+        Args:
+            listener (socket.socket): A bound and listening socket.
+            remote (ssl.SSLSocket): The TLS socket connected to the AlloyDB
+                proxy server.
+
+        Returns:
+            ProxyConnection: A handle that can be used to close the connection.
+        """
+        conn = ProxyConnection(self, remote, listener=listener)
+        self._call_soon(self._add, conn)
+        return conn
+
+    @property
+    def stopped(self) -> bool:
+        """Whether the engine has retired and no longer accepts connections."""
+        return self._stopped
+
+    def retire(self) -> None:
+        """Stops the engine thread once its last connection has closed."""
+        with self._lock:
+            started = self._thread is not None
+            if not started and not self._stopped:
+                self._retired = True
+                self._stopped = True
+                self._release()
+        if started:
+            self._call_soon(self._retire)
+
+    def _call_soon(self, fn: Callable[..., None], *args: object) -> None:
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("Proxy engine has been retired.")
+            self._calls.append((fn, args))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="alloydb-proxy", daemon=True
+                )
+                self._thread.start()
+        try:
+            self._wakeup_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            # a pending wakeup byte is already enough
+            pass
+
+    def _run(self) -> None:
+        while True:
+            timeout = 0 if self._ready else None
+            for key, mask in self._selector.select(timeout):
+                if key.data is None:
+                    self._run_calls()
+                elif isinstance(key.data, ProxyConnection):
+                    self._on_event(key.data, key.fileobj, mask)  # type: ignore[arg-type]
+            if self._ready:
+                ready, self._ready = self._ready, set()
+                for conn, pipe in ready:
+                    if not conn.closed:
+                        try:
+                            self._pump(conn, pipe)
+                        except Exception as e:
+                            logger.debug("proxy: closing connection after error: %s", e)
+                            self._close(conn)
+            if self._retired and not self._conns:
+                # calls queued before stopping still have to run
+                with self._lock:
+                    if not self._calls:
+                        self._stopped = True
+                        break
+        self._release()
+        logger.debug("proxy: engine stopped")
+
+    def _release(self) -> None:
+        self._selector.close()
+        self._wakeup_r.close()
+        self._wakeup_w.close()
+
+    def _run_calls(self) -> None:
+        try:
+            while self._wakeup_r.recv(4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+        while self._calls:
+            fn, args = self._calls.popleft()
+            try:
+                fn(*args)
+            except Exception as e:
+                # never let one connection take down the shared thread
+                logger.debug("proxy: %s failed: %s", fn.__name__, e)
+
+    def _retire(self) -> None:
+        self._retired = True
+
+    def _add(self, conn: ProxyConnection) -> None:
+        if conn.closed:
+            return
+        self._conns.add(conn)
+        _count_peer(conn.peer, 1)
+        try:
+            if conn.listener is not None:
+                conn.listener.setblocking(False)
+                self._selector.register(conn.listener, _READ, conn)
+            else:
+                self._start(conn)
+        except Exception as e:
+            logger.debug("proxy: failed to start proxying: %s", e)
+            self._close(conn)
+
+    def _start(self, conn: ProxyConnection) -> None:
+        assert conn.local is not None
+        conn.local.setblocking(False)
+        conn.remote.setblocking(False)
+        upstream = _Pipe(conn.local, conn.remote)
+        downstream = _Pipe(conn.remote, conn.local)
+        conn.pipes = (upstream, downstream)
+        tx, rx = _ktls_offload(conn.remote)
+        if tx:
+            upstream.kpipe = os.pipe2(os.O_NONBLOCK | os.O_CLOEXEC)
+        # bytes already decrypted by OpenSSL must be drained by recv()
+        if rx and not _pending(conn.remote):
+            downstream.kpipe = os.pipe2(os.O_NONBLOCK | os.O_CLOEXEC)
+        if tx or rx:
+            logger.debug("proxy: kernel TLS offload tx=%s rx=%s, using splice", tx, rx)
+        self._selector.register(conn.local, _READ, conn)
+        self._selector.register(conn.remote, _READ, conn)
+        # bytes read ahead during the metadata exchange are already decrypted
+        if _pending(conn.remote):
+            self._ready.add((conn, downstream))
+
+    def _on_event(self, conn: ProxyConnection, sock: socket.socket, mask: int) -> None:
+        if conn.closed:
+            return
+        try:
+            if sock is conn.listener:
+                self._accept(conn)
+                return
+            for pipe in conn.pipes:
+                if pipe.wait_sock is sock and pipe.wait_event & mask:
+                    if not self._pump(conn, pipe):
+                        return
+        except Exception as e:
+            # never let one connection take down the shared thread, e.g.
+            # when os.pipe2() fails with EMFILE
+            logger.debug("proxy: closing connection after error: %s", e)
+            self._close(conn)
+
+    def _accept(self, conn: ProxyConnection) -> None:
+        assert conn.listener is not None
+        try:
+            local, _ = conn.listener.accept()
+        except BlockingIOError:
+            return
+        except OSError as e:
+            logger.debug("proxy: accept failed: %s", e)
+            self._close(conn)
+            return
+        self._selector.unregister(conn.listener)
+        conn.listener.close()
+        conn.listener = None
+        conn.local = local
+        logger.debug("proxy: accepted connection, starting proxy")
+        self._start(conn)
+
+    def _pump(self, conn: ProxyConnection, pipe: _Pipe) -> bool:
+        """Moves bytes through one direction until a socket would block.
+
+        Returns False if the connection was closed.
+        """
+        if pipe.kpipe is not None:
+            return self._splice(conn, pipe)
+        view = self._view
+        try:
+            for _ in range(_MAX_READS_PER_EVENT):
+                if pipe.pending is not None:
+                    if not self._flush(pipe, pipe.pending):
+                        break
+                try:
+                    n = pipe.src.recv_into(view)
+                except (BlockingIOError, ssl.SSLWantReadError):
+                    pipe.wait_sock, pipe.wait_event = pipe.src, _READ
+                    break
+                except ssl.SSLWantWriteError:
+                    pipe.wait_sock, pipe.wait_event = pipe.src, _WRITE
+                    break
+                if n == 0:
+                    logger.debug("proxy: EOF on %s, closing both sockets", pipe.src)
+                    self._close(conn)
+                    return False
+                if not self._flush(pipe, view[:n]):
+                    break
+            else:
+                # yield to other connections; TLS sockets may hold decrypted
+                # bytes the selector will not report
+                pipe.wait_sock, pipe.wait_event = pipe.src, _READ
+                if _pending(pipe.src):
+                    self._ready.add((conn, pipe))
+        except (OSError, ssl.SSLError) as e:
+            logger.debug("proxy: socket error on %s: %s", pipe.src, e)
+            self._close(conn)
+            return False
+        self._update(conn)
+        return True
+
+    def _splice(self, conn: ProxyConnection, pipe: _Pipe) -> bool:
+        """Moves bytes through one direction with splice() until a socket
+        would block.
+
+        Returns False if the connection was closed.
+        """
+        assert pipe.kpipe is not None
+        pipe_r, pipe_w = pipe.kpipe
+        flags = os.SPLICE_F_MOVE | os.SPLICE_F_NONBLOCK
+        try:
+            for _ in range(_MAX_READS_PER_EVENT):
+                if pipe.in_kpipe:
+                    try:
+                        n = os.splice(
+                            pipe_r, pipe.dst.fileno(), pipe.in_kpipe, flags=flags
+                        )
+                    except BlockingIOError:
+                        n = 0
+                    pipe.in_kpipe -= n
+                    if pipe.in_kpipe:
+                        pipe.wait_sock, pipe.wait_event = pipe.dst, _WRITE
+                        break
+                try:
+                    n = os.splice(
+                        pipe.src.fileno(), pipe_w, len(self._buffer), flags=flags
+                    )
+                except BlockingIOError:
+                    pipe.wait_sock, pipe.wait_event = pipe.src, _READ
+                    break
+                except OSError as e:
+                    # a kTLS socket refuses to splice TLS control records
+                    # (e.g. a post-handshake message); hand the pipe back to
+                    # OpenSSL, which reads them with recvmsg()
+                    if e.errno not in (errno.EINVAL, errno.EIO):
+                        raise
+                    logger.debug("proxy: splice unavailable (%s), falling back", e)
+                    self._close_kpipe(pipe)
+                    return self._pump(conn, pipe)
+                if n == 0:
+                    logger.debug("proxy: EOF on %s, closing both sockets", pipe.src)
+                    self._close(conn)
+                    return False
+                pipe.in_kpipe += n
+            else:
+                # yield to other connections; bytes left in the kernel pipe
+                # are sent once the destination is writable rather than
+                # waiting for more data on the source
+                if pipe.in_kpipe:
+                    pipe.wait_sock, pipe.wait_event = pipe.dst, _WRITE
+                else:
+                    pipe.wait_sock, pipe.wait_event = pipe.src, _READ
+        except OSError as e:
+            logger.debug("proxy: socket error on %s: %s", pipe.src, e)
+            self._close(conn)
+            return False
+        self._update(conn)
+        return True
+
+    @staticmethod
+    def _close_kpipe(pipe: _Pipe) -> None:
+        if pipe.kpipe is None:
+            return
+        for fd in pipe.kpipe:
+            os.close(fd)
+        pipe.kpipe = None
+
+    def _flush(self, pipe: _Pipe, data: Union[bytes, memoryview]) -> bool:
+        """Writes data to the pipe's destination.
+
+        Returns True if everything was written. Otherwise keeps a copy of
+        the remainder as pending and sets the pipe to wait on the
+        destination.
+        """
+        try:
+            sent = pipe.dst.send(data)
+        except (BlockingIOError, ssl.SSLWantWriteError):
+            sent = 0
+        except ssl.SSLWantReadError:
+            pipe.pending = bytes(data)
+            pipe.wait_sock, pipe.wait_event = pipe.dst, _READ
+            return False
+        if sent == len(data):
+            pipe.pending = None
+            return True
+        pipe.wait_sock, pipe.wait_event = pipe.dst, _WRITE
+        # the shared receive buffer is reused, so keep a copy
+        pipe.pending = bytes(data[sent:])
+        return False
+
+    def _update(self, conn: ProxyConnection) -> None:
+        """Registers each socket for the union of the events its pipes wait on."""
+        for pipe in conn.pipes:
+            sock = pipe.src
+            events = 0
+            for p in conn.pipes:
+                if p.wait_sock is sock:
+                    events |= p.wait_event
+            key = self._selector.get_map().get(sock)
+            if key is None:
+                if events:
+                    self._selector.register(sock, events, conn)
+            elif not events:
+                self._selector.unregister(sock)
+            elif key.events != events:
+                self._selector.modify(sock, events, conn)
+
+    def _close(self, conn: ProxyConnection) -> None:
+        if conn.closed:
+            return
+        conn.closed = True
+        self._conns.discard(conn)
+        _count_peer(conn.peer, -1)
+        for pipe in conn.pipes:
+            self._close_kpipe(pipe)
+        for sock in (conn.listener, conn.local, conn.remote):
+            if sock is None:
+                continue
+            try:
+                self._selector.unregister(sock)
+            except (KeyError, ValueError):
+                pass
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            try:
+                sock.close()
+            except OSError:
+                pass
+
+
+_config_lock = threading.Lock()
+_engines: list[ProxyEngine] = []
+_engine_count = 1
+_buffer_size = DEFAULT_BUFFER_SIZE
+_next_engine = itertools.count()
+
+
+def configure_proxy(engines: int = 1, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+    """
+    Configures the shared proxy engines used for psycopg connections.
+
+    Connections opened afterwards are spread round-robin across the given
+    number of engine threads. Existing connections keep running on their
+    current engine, which stops once they have all closed.
+
+    Args:
+        engines (int): Number of proxy threads. Defaults to 1.
+        buffer_size (int): Receive buffer size in bytes per engine.
+            Defaults to 64 KiB.
+    """
+    if engines < 1:
+        raise ValueError(f"Arg `engines` must be at least 1, got {engines}.")
+    if buffer_size < 1:
+        raise ValueError(f"Arg `buffer_size` must be positive, got {buffer_size}.")
+    global _engine_count, _buffer_size
+    with _config_lock:
+        retired = list(_engines)
+        _engines.clear()
+        _engine_count = engines
+        _buffer_size = buffer_size
+    for engine in retired:
+        engine.retire()
+
+
+def get_engine() -> ProxyEngine:
+    """Returns the next shared proxy engine, creating the engines on first use."""
+    with _config_lock:
+        if not _engines:
+            _engines.extend(ProxyEngine(_buffer_size) for _ in range(_engine_count))
+        return _engines[next(_next_engine) % len(_engines)]
+
+
+def accept_and_proxy(
+    listener: socket.socket, remote: Union[socket.socket, ssl.SSLSocket]
+) -> ProxyConnection:
+    """
+    Hands a listener and remote socket to the next shared proxy engine.
+
+    See ProxyEngine.accept_and_proxy. An engine retired by configure_proxy
+    between being picked and being handed the sockets is skipped.
+    """
+    while True:
+        engine = get_engine()
+        try:
+            return engine.accept_and_proxy(listener, remote)
+        except RuntimeError:
+            if not engine.stopped:
+                raise
+
+
+def connection_count(ip_address: Optional[str] = None) -> int:
+    """
+    Returns the number of open proxied connections across all engines.
+
+    Args:
+        ip_address (str): Only count the connections to this AlloyDB IP
+            address, including those proxied on asyncio event loops.
+            Optional.
+    """
+    if ip_address is not None:
+        with _peers_lock:
+            return _peers[ip_address]
+    with _config_lock:
+        engines = list(_engines)
+    return sum(engine.connection_count for engine in engines)
+
+
+class AsyncProxyProtocol(asyncio.Protocol):
+    """
+    One side of a proxied connection on an asyncio event loop.
+
+    Until it is linked to a peer, received bytes are buffered and can be
+    consumed with read_exactly, which is used for the metadata exchange.
+    Once linked, everything received is written to the peer's transport and
+    flow control is mirrored: when the peer's write buffer fills up, reading
+    from this side is paused until the peer drains.
+    """
+
+    def __init__(self) -> None:
+        self.transport: Optional[asyncio.Transport] = None
+        self.peer: Optional[AsyncProxyProtocol] = None
+        self._buffer = bytearray()
+        self._waiter: Optional[asyncio.Future[None]] = None
+        self._eof = False
+        # the IP address this side is counted as proxying to
+        self._counted: Optional[str] = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+
+    def data_received(self, data: bytes) -> None:
+        if self.peer is not None and self.peer.transport is not None:
+            self.peer.transport.write(data)
+            return
+        self._buffer += data
+        self._wake()
+
+    def eof_received(self) -> bool:
+        self._eof = True
+        self._wake()
+        if self.peer is not None:
+            self.close()
+        return False
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self._eof = True
+        self._wake()
+        counted, self._counted = self._counted, None
+        _count_peer(counted, -1)
+        if self.peer is not None:
+            self.close()
+
+    def pause_writing(self) -> None:
+        # our transport cannot take more bytes, stop reading the peer
+        if self.peer is not None and self.peer.transport is not None:
+            self.peer.transport.pause_reading()
+
+    def resume_writing(self) -> None:
+        if self.peer is not None and self.peer.transport is not None:
+            self.peer.transport.resume_reading()
+
+    def count_peer(self) -> None:
+        """Counts this connection in connection_count() until it is lost."""
+        if self._eof or self._counted is not None or self.transport is None:
+            return
+        peername = self.transport.get_extra_info("peername")
+        if peername:
+            self._counted = peername[0]
+            _count_peer(self._counted, 1)
+
+    def _wake(self) -> None:
+        waiter, self._waiter = self._waiter, None
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def read_exactly(self, n: int) -> bytes:
+        """
+        Reads exactly n bytes received before the protocol is linked.
+
+        Raises:
+            asyncio.IncompleteReadError: The connection was closed before n
+                bytes were received.
+        """
+        while len(self._buffer) < n:
+            if self._eof:
+                raise asyncio.IncompleteReadError(bytes(self._buffer), n)
+            self._waiter = asyncio.get_running_loop().create_future()
+            await self._waiter
+        data = bytes(self._buffer[:n])
+        del self._buffer[:n]
+        return data
+
+    def link(self, peer: AsyncProxyProtocol) -> None:
+        """Starts forwarding between this protocol and its peer."""
+        self.peer = peer
+        peer.peer = self
+        for side in (self, peer):
+            if side._buffer and side.peer is not None:
+                side.peer.write(bytes(side._buffer))
+                side._buffer.clear()
+        if self._eof or peer._eof:
+            self.close()
+
+    def write(self, data: bytes) -> None:
+        """Writes data to this side's transport."""
+        if self.transport is not None:
+            self.transport.write(data)
+
+    def close(self) -> None:
+        """Closes both sides of the proxied connection."""
+        for side in (self, self.peer):
+            if (
+                side is not None
+                and side.transport is not None
+                and not side.transport.is_closing()
+            ):
+                side.transport.close()
+
+
+async def accept_and_proxy_async(
+    path: str, remote: AsyncProxyProtocol
+) -> asyncio.AbstractServer:
+    """
+    Serves a single connection on a Unix socket and forwards bytes between
+    it and an established connection on the running event loop.
+
+    Args:
+        path (str): The filesystem path to bind the Unix socket to.
+        remote (AsyncProxyProtocol): The protocol of the TLS connection to
+            the AlloyDB proxy server.
+
+    Returns:
+        asyncio.AbstractServer: The listening server. It stops accepting once
+            the first connection arrives; close it, and the remote, to
+            abandon the proxy.
+    """
+    loop = asyncio.get_running_loop()
+    server: Optional[asyncio.AbstractServer] = None
+    accepted = False
+
+    class _Local(AsyncProxyProtocol):
+        def connection_made(self, transport: asyncio.BaseTransport) -> None:
+            nonlocal accepted
+            super().connection_made(transport)
+            if accepted:
+                # only the driver's first connection is proxied
+                transport.close()
+                return
+            accepted = True
+            if server is not None:
+                server.close()
+            remote.count_peer()
+            self.link(remote)
+
+    server = await loop.create_unix_server(_Local, path)
+    return server
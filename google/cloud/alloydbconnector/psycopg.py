@@ -12,67 +12,37 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import inspect
 import logging
+import math
 import os
 import socket
-import ssl
 import tempfile
-import threading
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Awaitable
+from typing import Callable
+
+from google.cloud.alloydbconnector.proxy import AsyncProxyProtocol
+from google.cloud.alloydbconnector.proxy import accept_and_proxy
+from google.cloud.alloydbconnector.proxy import accept_and_proxy_async
 
 if TYPE_CHECKING:
+    import ssl
+
     import psycopg
+    import psycopg_pool
 
 logger = logging.getLogger(name=__name__)
 
-_CHUNK_SIZE = 8 * 1024  # bytes per recv() call inside the proxy forwarding loop
-
-
-def _proxy(local: socket.socket, remote: "ssl.SSLSocket") -> None:
-    """Bidirectionally proxy bytes between a local Unix socket and a remote
-    SSL socket.
-
-    Spawns one daemon thread for the remote→local direction and runs the
-    local→remote direction in the calling thread. Blocks until the calling
-    thread's direction reaches EOF or a socket error, at which point both
-    sockets are closed so the other thread also unblocks and exits.
-
-    Args:
-        local: The Unix domain socket connected to the database driver.
-        remote: The SSL socket connected to the AlloyDB proxy server.
-    """
 
-    def forward(src: socket.socket, dst: socket.socket) -> None:
-        buf = bytearray(_CHUNK_SIZE)
-        view = memoryview(buf)
-        try:
-            while True:
-                n = src.recv_into(view)
-                if n == 0:
-                    logger.debug("psycopg proxy: EOF on %s, closing both sockets", src)
-                    break
-                dst.sendall(view[:n])
-        except (OSError, ssl.SSLError) as e:
-            logger.debug("psycopg proxy: socket error on %s: %s", src, e)
-        finally:
-            # Close both ends so the sibling thread also unblocks.
-            for s in (local, remote):
-                try:
-                    # shutdown is required on POSIX systems to forcefully
-                    # interrupt the sibling thread's blocking recv_into() call.
-                    # Simply closing the socket does not interrupt the system
-                    # call and leads to leaked threads.
-                    s.shutdown(socket.SHUT_RDWR)
-                except OSError:
-                    pass
-                try:
-                    s.close()
-                except OSError:
-                    pass
-
-    threading.Thread(target=forward, args=(remote, local), daemon=True).start()
-    forward(local, remote)  # run in calling thread rather than spawning a third
+def _set_connect_timeout(kwargs: dict[str, Any]) -> None:
+    """Turns the seconds left for the connection attempt into libpq's
+    connect_timeout, unless the caller set one."""
+    timeout = kwargs.pop("timeout", None)
+    if timeout is not None and "connect_timeout" not in kwargs:
+        # libpq takes whole seconds
+        kwargs["connect_timeout"] = max(math.ceil(timeout), 1)
 
 
 def connect(remote_sock: "ssl.SSLSocket", **kwargs: Any) -> "psycopg.Connection":
@@ -80,12 +50,14 @@ def connect(remote_sock: "ssl.SSLSocket", **kwargs: Any) -> "psycopg.Connection"
 
     Because psycopg does not accept a pre-connected socket, this function
     creates a temporary Unix domain socket, tells psycopg to connect there,
-    and runs a background proxy that forwards bytes between that socket and
-    the already-established AlloyDB TLS connection.
+    and hands both sockets to a shared proxy engine that forwards bytes
+    between that socket and the already-established AlloyDB TLS connection.
 
     Args:
         remote_sock (ssl.SSLSocket): SSL/TLS secure socket stream connected to the
             AlloyDB proxy server.
+        timeout (float): Seconds allowed for psycopg's connection, passed on
+            as connect_timeout. Defaults to None, for no timeout.
 
     Returns:
         psycopg.Connection: A psycopg Connection object for the AlloyDB instance.
@@ -97,6 +69,14 @@ def connect(remote_sock: "ssl.SSLSocket", **kwargs: Any) -> "psycopg.Connection"
             'Unable to import module "psycopg." Please install and try again.'
         )
 
+    user = kwargs.pop("user")
+    db = kwargs.pop("db")
+    passwd = kwargs.pop("password", None)
+    # SSL is already handled by the underlying SSLSocket; disable it on the
+    # Unix socket so psycopg does not attempt a second TLS handshake.
+    kwargs.pop("sslmode", None)
+    _set_connect_timeout(kwargs)
+
     tmpdir = tempfile.mkdtemp()
     socket_path = os.path.join(tmpdir, ".s.PGSQL.5432")
     logger.debug("psycopg: created Unix socket at %s", socket_path)
@@ -105,29 +85,8 @@ def connect(remote_sock: "ssl.SSLSocket", **kwargs: Any) -> "psycopg.Connection"
     local_sock.bind(socket_path)
     local_sock.listen(1)
 
-    def _accept_and_proxy() -> None:
-        """Accept one connection then proxy bytes until the connection closes."""
-        try:
-            unix_conn, _ = local_sock.accept()
-            local_sock.close()
-            logger.debug("psycopg proxy: accepted connection, starting proxy")
-        except OSError as e:
-            logger.debug("psycopg proxy: accept failed: %s", e)
-            try:
-                remote_sock.close()
-            except OSError:
-                pass
-            return
-        _proxy(unix_conn, remote_sock)
-
-    threading.Thread(target=_accept_and_proxy, daemon=True).start()
-
-    user = kwargs.pop("user")
-    db = kwargs.pop("db")
-    passwd = kwargs.pop("password", None)
-    # SSL is already handled by the underlying SSLSocket; disable it on the
-    # Unix socket so psycopg does not attempt a second TLS handshake.
-    kwargs.pop("sslmode", None)
+    # the engine accepts psycopg's connection and closes the listener
+    proxy_conn = accept_and_proxy(local_sock, remote_sock)
 
     logger.debug("psycopg: connecting as user=%s dbname=%s", user, db)
     try:
@@ -144,20 +103,86 @@ def connect(remote_sock: "ssl.SSLSocket", **kwargs: Any) -> "psycopg.Connection"
         return conn
     except Exception as e:
         logger.debug("psycopg: connection failed: %s", e)
-        # psycopg never connected (or failed mid-handshake); close the server
-        # socket so the proxy thread unblocks and exits cleanly.
+        # psycopg never connected (or failed mid-handshake); close the
+        # listener and both sockets from the engine thread.
+        proxy_conn.close()
+        raise
+    finally:
+        # The socket file and its parent directory are only needed during the
+        # initial connect() call; remove them now regardless of outcome.
         try:
-            local_sock.close()
+            os.remove(socket_path)
         except OSError:
             pass
         try:
-            remote_sock.close()
+            os.rmdir(tmpdir)
         except OSError:
             pass
+
+
+async def connect_async(
+    remote: AsyncProxyProtocol, **kwargs: Any
+) -> "psycopg.AsyncConnection":
+    """Create a psycopg asyncio connection object.
+
+    Like connect, but the temporary Unix domain socket is served on the
+    running event loop and bytes are forwarded with asyncio transports, so
+    no proxy threads are involved.
+
+    Args:
+        remote (AsyncProxyProtocol): Protocol of the SSL/TLS connection to the
+            AlloyDB proxy server, after the metadata exchange. It is closed if
+            the connection fails or is cancelled.
+        timeout (float): Seconds allowed for psycopg's connection, passed on
+            as connect_timeout. Defaults to None, for no timeout.
+
+    Returns:
+        psycopg.AsyncConnection: A psycopg AsyncConnection object for the
+            AlloyDB instance.
+    """
+    try:
+        import psycopg
+    except ImportError:
+        raise ImportError(
+            'Unable to import module "psycopg." Please install and try again.'
+        )
+
+    user = kwargs.pop("user")
+    db = kwargs.pop("db")
+    passwd = kwargs.pop("password", None)
+    # SSL is already handled by the TLS transport; disable it on the Unix
+    # socket so psycopg does not attempt a second TLS handshake.
+    kwargs.pop("sslmode", None)
+    _set_connect_timeout(kwargs)
+
+    tmpdir = tempfile.mkdtemp()
+    socket_path = os.path.join(tmpdir, ".s.PGSQL.5432")
+    logger.debug("psycopg: created Unix socket at %s", socket_path)
+
+    server = await accept_and_proxy_async(socket_path, remote)
+
+    logger.debug("psycopg: connecting as user=%s dbname=%s", user, db)
+    try:
+        conn = await psycopg.AsyncConnection.connect(
+            user=user,
+            dbname=db,
+            password=passwd,
+            host=tmpdir,
+            port=5432,
+            sslmode="disable",
+            **kwargs,
+        )
+        logger.debug("psycopg: connection established")
+        return conn
+    except BaseException as e:
+        # also on cancellation, so the transports don't leak
+        logger.debug("psycopg: connection failed: %s", e)
+        server.close()
+        remote.close()
         raise
     finally:
-        # The socket file and its parent directory are only needed during the
-        # initial connect() call; remove them now regardless of outcome.
+        # The server stops listening by itself once psycopg's connection is
+        # accepted, which happens before psycopg's handshake can complete.
         try:
             os.remove(socket_path)
         except OSError:
@@ -166,3 +191,113 @@ def connect(remote_sock: "ssl.SSLSocket", **kwargs: Any) -> "psycopg.Connection"
             os.rmdir(tmpdir)
         except OSError:
             pass
+
+
+def _split_pool_kwargs(
+    pool_class: type, kwargs: dict[str, Any]
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Splits keyword arguments into those for the pool class and those for
+    each connection."""
+    params = inspect.signature(pool_class).parameters
+    connect_kwargs = dict(kwargs.pop("kwargs", None) or {})
+    pool_kwargs = {}
+    for key, value in kwargs.items():
+        if key in params and key not in ("conninfo", "connection_class"):
+            pool_kwargs[key] = value
+        else:
+            connect_kwargs[key] = value
+    return pool_kwargs, connect_kwargs
+
+
+def _num_workers(min_size: int) -> int:
+    """Returns the number of pool workers used to open connections.
+
+    Opening a connection mostly waits on the network, so the pool prefills
+    with up to 8 concurrent opens instead of psycopg_pool's default of 3.
+    """
+    return max(3, min(min_size, 8))
+
+
+def create_pool(
+    connect: Callable[..., "psycopg.Connection"], **kwargs: Any
+) -> "psycopg_pool.ConnectionPool":
+    """Create a psycopg_pool connection pool that opens connections with the
+    given function.
+
+    The pool is not opened.
+
+    Args:
+        connect (Callable): Function used by the pool to open each
+            connection, called with the connection keyword arguments.
+        **kwargs: Keyword arguments for psycopg_pool.ConnectionPool.
+            Arguments not used by the pool are passed on to ``connect``.
+
+    Returns:
+        psycopg_pool.ConnectionPool: A closed psycopg_pool.ConnectionPool.
+    """
+    try:
+        import psycopg
+        import psycopg_pool
+    except ImportError:
+        raise ImportError(
+            'Unable to import module "psycopg_pool." Please install and try again.'
+        )
+
+    class PoolConnection(psycopg.Connection):
+        @classmethod
+        def connect(  # type: ignore[override]
+            cls, conninfo: str = "", **connect_kwargs: Any
+        ) -> "psycopg.Connection":
+            return connect(**connect_kwargs)
+
+    pool_kwargs, connect_kwargs = _split_pool_kwargs(
+        psycopg_pool.ConnectionPool, kwargs
+    )
+    pool_kwargs.setdefault("num_workers", _num_workers(pool_kwargs.get("min_size", 4)))
+    pool_kwargs["open"] = False
+    return psycopg_pool.ConnectionPool(
+        connection_class=PoolConnection, kwargs=connect_kwargs, **pool_kwargs
+    )
+
+
+def create_async_pool(
+    connect: Callable[..., Awaitable["psycopg.AsyncConnection"]], **kwargs: Any
+) -> "psycopg_pool.AsyncConnectionPool":
+    """Create a psycopg_pool asyncio connection pool that opens connections
+    with the given coroutine function.
+
+    The pool is not opened.
+
+    Args:
+        connect (Callable): Coroutine function used by the pool to open each
+            connection, called with the connection keyword arguments.
+        **kwargs: Keyword arguments for psycopg_pool.AsyncConnectionPool.
+            Arguments not used by the pool are passed on to ``connect``.
+
+    Returns:
+        psycopg_pool.AsyncConnectionPool: A closed
+            psycopg_pool.AsyncConnectionPool.
+    """
+    try:
+        import psycopg
+        import psycopg_pool
+    except ImportError:
+        raise ImportError(
+            'Unable to import module "psycopg_pool." Please install and try again.'
+        )
+
+    class AsyncPoolConnection(psycopg.AsyncConnection):
+        @classmethod
+        async def connect(  # type: ignore[override]
+            cls, conninfo: str = "", **connect_kwargs: Any
+        ) -> "psycopg.AsyncConnection":
+            return await connect(**connect_kwargs)
+
+    pool_kwargs, connect_kwargs = _split_pool_kwargs(
+        psycopg_pool.AsyncConnectionPool, kwargs
+    )
+    pool_kwargs.setdefault("num_workers", _num_workers(pool_kwargs.get("min_size", 4)))
+    pool_kwargs["open"] = False
+    return psycopg_pool.AsyncConnectionPool(
+        connection_class=AsyncPoolConnection, kwargs=connect_kwargs, **pool_kwargs
+    )
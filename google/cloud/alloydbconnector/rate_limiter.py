@@ -42,6 +42,12 @@ class AsyncRateLimiter(object):
         self._last_token_update = self._loop.time()
         self._lock = asyncio.Lock()
 
+    @property
+    def tokens(self) -> float:
+        """The tokens available now. May be read from any thread."""
+        elapsed = self._loop.time() - self._last_token_update
+        return min(self._tokens + elapsed * self._rate, self._max_capacity)
+
     def _update_token_count(self) -> None:
         """
         Calculates how much time has passed since the last leak and removes the
@@ -16,8 +16,15 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime
+from datetime import timedelta
 from datetime import timezone
 import logging
+import time
+from typing import Any
+from typing import Optional
+
+from google.cloud.alloydbconnector import proxy
+from google.cloud.alloydbconnector.exceptions import MetadataExchangeError
 
 logger = logging.getLogger(name=__name__)
 
@@ -60,3 +67,83 @@ async def _is_valid(task: asyncio.Task) -> bool:
         # suppress any errors from task
         logger.debug("Current refresh result is invalid.")
     return False
+
+
+def _refresh_may_help(e: BaseException) -> bool:
+    """
+    Returns whether a failed connection attempt may succeed with refreshed
+    connection info, i.e. a new client certificate or IP address.
+
+    Refused, reset and timed out connections and TLS errors may, including
+    those wrapped by a driver, as may the server closing the connection
+    during the metadata exchange. Errors returned by the metadata exchange
+    (e.g. IAM authentication) and by the database (e.g. a wrong password or
+    too many connections) won't.
+
+    Args:
+        e (BaseException): Error of the connection attempt.
+    Returns:
+        bool: Whether to force a refresh.
+    """
+    if isinstance(e, MetadataExchangeError):
+        return False
+    # the metadata exchange raises RuntimeError if the server closes the
+    # connection, e.g. after rejecting the client certificate
+    if isinstance(e, RuntimeError):
+        return True
+    error: Optional[BaseException] = e
+    while error is not None:
+        if isinstance(error, OSError):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class _RefreshStats:
+    """The outcome of a cache's last refresh and its next scheduled one."""
+
+    def __init__(self) -> None:
+        self.last_duration: Optional[float] = None
+        # "success" or "failure", None before the first refresh completes
+        self.last_outcome: Optional[str] = None
+        self.last_error: Optional[str] = None
+        self.consecutive_failures = 0
+        self.next_refresh: Optional[datetime] = None
+
+    def succeeded(self, started: float) -> None:
+        """Records a successful refresh started at the given monotonic
+        time."""
+        self.last_duration = time.monotonic() - started
+        self.last_outcome = "success"
+        self.last_error = None
+        self.consecutive_failures = 0
+
+    def failed(self, started: float, e: BaseException) -> None:
+        """Records a refresh started at the given monotonic time that failed
+        with the error."""
+        self.last_duration = time.monotonic() - started
+        self.last_outcome = "failure"
+        self.last_error = str(e) or type(e).__name__
+        self.consecutive_failures += 1
+
+    def scheduled(self, delay: float) -> None:
+        """Records the next refresh, due in delay seconds."""
+        self.next_refresh = datetime.now(timezone.utc) + timedelta(seconds=delay)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "next_refresh": self.next_refresh,
+            "last_refresh_duration": self.last_duration,
+            "last_refresh_outcome": self.last_outcome,
+            "last_refresh_error": self.last_error,
+            "consecutive_failures": self.consecutive_failures,
+        }
+
+
+def _instance_stats(instance_uri: str, cache: Any) -> dict[str, Any]:
+    """Returns the stats of an instance's connection info cache, with the
+    number of open proxied connections to its IP addresses."""
+    stats = {"instance_uri": instance_uri, **cache.stats()}
+    ip_addresses = {ip for ip in stats["ip_addrs"].values() if ip}
+    stats["proxy_connections"] = sum(proxy.connection_count(ip) for ip in ip_addresses)
+    return stats
@@ -0,0 +1,129 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+from typing import Optional
+
+if TYPE_CHECKING:
+    from google.auth.credentials import Credentials
+
+# the seconds a call may take when no deadline is set
+_DEFAULT_TIMEOUT = 60.0
+
+
+class ConnectionInfoResponse(NamedTuple):
+    ip_address: str
+    public_ip_address: str
+    psc_dns_name: str
+
+
+class ClientCertificateResponse(NamedTuple):
+    ca_cert: str
+    pem_certificate_chain: list[str]
+
+
+class AlloyDBRestClient:
+    """
+    A client of the AlloyDB Admin API's REST interface, for the two methods
+    the connector calls.
+
+    It has the methods of the generated AlloyDBAdminClient that the
+    connector uses, taking the fields of their requests as a dict. Unlike
+    the generated client, it doesn't import or start gRPC. Calls are
+    blocking and made over a pooled requests session.
+
+    Args:
+        api_endpoint (str): The host of the AlloyDB API.
+        api_version (str): The AlloyDB API version.
+        credentials (google.auth.credentials.Credentials): The credentials
+            the calls are authorized with.
+        quota_project (str): The project billed for the calls. Optional.
+        user_agent (str): The user agent of the calls.
+    """
+
+    def __init__(
+        self,
+        api_endpoint: str,
+        api_version: str,
+        credentials: Credentials,
+        quota_project: Optional[str],
+        user_agent: str,
+    ) -> None:
+        from google.auth.transport.requests import AuthorizedSession
+
+        self._session = AuthorizedSession(credentials)
+        self._base_url = f"https://{api_endpoint}/{api_version}"
+        self._headers = {"User-Agent": user_agent, "x-goog-api-client": user_agent}
+        if quota_project:
+            self._headers["x-goog-user-project"] = quota_project
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        timeout: Optional[float],
+        json: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        response = self._session.request(
+            method,
+            f"{self._base_url}/{path}",
+            json=json,
+            headers=self._headers,
+            timeout=_DEFAULT_TIMEOUT if timeout is None else timeout,
+        )
+        if response.status_code >= 400:
+            # imported on first use, as importing them is slow
+            from google.api_core import exceptions
+
+            raise exceptions.from_http_response(response)
+        return response.json()
+
+    def get_connection_info(
+        self, request: dict[str, Any], timeout: Optional[float] = None
+    ) -> ConnectionInfoResponse:
+        """Gets the IP addresses of an instance."""
+        resp = self._request("GET", f"{request['parent']}/connectionInfo", timeout)
+        return ConnectionInfoResponse(
+            resp.get("ipAddress", ""),
+            resp.get("publicIpAddress", ""),
+            resp.get("pscDnsName", ""),
+        )
+
+    def generate_client_certificate(
+        self, request: dict[str, Any], timeout: Optional[float] = None
+    ) -> ClientCertificateResponse:
+        """Generates a client certificate signed by the cluster's CA."""
+        duration: timedelta = request["cert_duration"]
+        resp = self._request(
+            "POST",
+            f"{request['parent']}:generateClientCertificate",
+            timeout,
+            json={
+                "publicKey": request["public_key"],
+                "certDuration": f"{int(duration.total_seconds())}s",
+                "useMetadataExchange": request["use_metadata_exchange"],
+            },
+        )
+        return ClientCertificateResponse(
+            resp.get("caCert", ""), resp.get("pemCertificateChain", [])
+        )
+
+    def close(self) -> None:
+        """Closes the session's connections."""
+        self._session.close()
@@ -12,16 +12,128 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
 import io
 import json
+import logging
+import os
+import threading
+import time
+from typing import Any
+from typing import Optional
 
 from cryptography.hazmat.primitives import serialization
 
 from google.cloud.alloydbconnector.connection_info import ConnectionInfo
 
+logger = logging.getLogger(name=__name__)
+
+# seconds between checks of whether a static connection info file changed
+_RELOAD_CHECK_INTERVAL = 1.0
+
+
+def _parse(static_conn_info: io.TextIOBase) -> dict[str, ConnectionInfo]:
+    """Parses static connection info JSON into the connection info of each
+    instance, keyed by instance URI. The private key is loaded once."""
+    static_info = json.load(static_conn_info)
+    priv_key = serialization.load_pem_private_key(
+        static_info["privateKey"].encode("UTF-8"), password=None
+    )
+    expiration = datetime.now(timezone.utc) + timedelta(hours=1)
+    index = {}
+    for instance_uri, info in static_info.items():
+        if instance_uri in ("publicKey", "privateKey"):
+            continue
+        dns = ""
+        if info["pscInstanceConfig"]:
+            dns = info["pscInstanceConfig"]["pscDnsName"].rstrip(".")
+        ip_addrs = {
+            "PRIVATE": info["ipAddress"],
+            "PUBLIC": info["publicIpAddress"],
+            "PSC": dns,
+        }
+        index[instance_uri] = ConnectionInfo(
+            info["pemCertificateChain"],
+            info["caCert"],
+            priv_key,
+            ip_addrs,
+            expiration,
+        )
+    return index
+
+
+class StaticConnectionInfo:
+    """
+    The static connection info of a set of instances, parsed once.
+
+    The static connection info is either a file-like JSON object, which is
+    read once, or the path of a JSON file. A file is reloaded when its
+    modification time changes, checked at most once a second, so that
+    certificates written by a sidecar are picked up without a restart. If
+    the reloaded file can't be parsed, e.g. while it is being written, the
+    previous connection info is kept.
+
+    Args:
+        static_conn_info (io.TextIOBase | str | os.PathLike): The static
+            connection info JSON, or the path of a file containing it.
+    """
+
+    def __init__(self, static_conn_info: io.TextIOBase | str | os.PathLike) -> None:
+        self._lock = threading.Lock()
+        self._path: Optional[str | os.PathLike] = None
+        self._mtime = 0
+        self._checked = 0.0
+        if isinstance(static_conn_info, (str, os.PathLike)):
+            self._path = static_conn_info
+            self._mtime = os.stat(static_conn_info).st_mtime_ns
+            self._checked = time.monotonic()
+            with open(static_conn_info) as f:
+                self._index = _parse(f)
+        else:
+            self._index = _parse(static_conn_info)
+
+    def _reload(self) -> None:
+        """Reloads the file if its modification time changed."""
+        assert self._path is not None
+        with self._lock:
+            now = time.monotonic()
+            if now - self._checked < _RELOAD_CHECK_INTERVAL:
+                return
+            self._checked = now
+            try:
+                mtime = os.stat(self._path).st_mtime_ns
+                if mtime == self._mtime:
+                    return
+                with open(self._path) as f:
+                    self._index = _parse(f)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to reload static connection info from "
+                    f"{self._path}, keeping the previous one: {e}"
+                )
+                return
+            self._mtime = mtime
+            logger.debug(f"Reloaded static connection info from {self._path}")
+
+    def get(self, instance_uri: str) -> ConnectionInfo:
+        """
+        Returns the connection info of an instance. May be called from any
+        thread.
+
+        Raises:
+            KeyError: The static connection info has no such instance.
+        """
+        if (
+            self._path is not None
+            and time.monotonic() - self._checked >= _RELOAD_CHECK_INTERVAL
+        ):
+            self._reload()
+        return self._index[instance_uri]
+
 
 class StaticConnectionInfoCache:
     """
@@ -30,8 +142,8 @@ class StaticConnectionInfoCache:
     should not be used in production as it will result in failed connections
     after the client certificate expires. It is also subject to breaking changes
     in the format. NOTE: The static connection info is not refreshed by the
-    connector. The JSON format supports multiple instances, regardless of
-    cluster.
+    connector, but a file given by path is reloaded when it changes. The JSON
+    format supports multiple instances, regardless of cluster.
 
     This static connection info should hold JSON with the following format:
         {
@@ -51,35 +163,34 @@ class StaticConnectionInfoCache:
         }
     """
 
-    def __init__(self, instance_uri: str, static_conn_info: io.TextIOBase) -> None:
+    def __init__(
+        self,
+        instance_uri: str,
+        static_conn_info: io.TextIOBase | str | os.PathLike | StaticConnectionInfo,
+    ) -> None:
         """
         Initializes a StaticConnectionInfoCache instance.
 
         Args:
             instance_uri (str): The AlloyDB instance's connection URI.
-            static_conn_info (io.TextIOBase): The static connection info JSON.
+            static_conn_info (io.TextIOBase | str | os.PathLike |
+                StaticConnectionInfo): The static connection info JSON, the
+                path of a file containing it, or the parsed static
+                connection info, which may be shared by several caches.
         """
-        static_info = json.load(static_conn_info)
-        ca_cert = static_info[instance_uri]["caCert"]
-        cert_chain = static_info[instance_uri]["pemCertificateChain"]
-        dns = ""
-        if static_info[instance_uri]["pscInstanceConfig"]:
-            dns = static_info[instance_uri]["pscInstanceConfig"]["pscDnsName"].rstrip(
-                "."
-            )
-        ip_addrs = {
-            "PRIVATE": static_info[instance_uri]["ipAddress"],
-            "PUBLIC": static_info[instance_uri]["publicIpAddress"],
-            "PSC": dns,
-        }
-        expiration = datetime.now(timezone.utc) + timedelta(hours=1)
-        priv_key = static_info["privateKey"]
-        priv_key_bytes = serialization.load_pem_private_key(
-            priv_key.encode("UTF-8"), password=None
-        )
-        self._info = ConnectionInfo(
-            cert_chain, ca_cert, priv_key_bytes, ip_addrs, expiration
-        )
+        if not isinstance(static_conn_info, StaticConnectionInfo):
+            static_conn_info = StaticConnectionInfo(static_conn_info)
+        self._instance_uri = instance_uri
+        self._static = static_conn_info
+        # fail early if the static connection info has no such instance
+        self._static.get(instance_uri)
+        # static connection info is never refreshed
+        self.serving_stale = False
+        self.stale_served = 0
+
+    @property
+    def _info(self) -> ConnectionInfo:
+        return self._static.get(self._instance_uri)
 
     async def force_refresh(self) -> None:
         """
@@ -95,6 +206,32 @@ class StaticConnectionInfoCache:
         """
         return self._info
 
+    def connect_info_nowait(self) -> ConnectionInfo:
+        """
+        Retrieves the ConnectionInfo instance. May be called from any thread.
+        """
+        return self._info
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns the state of the cache, with the same keys as
+        RefreshAheadCache.stats(). Static connection info is never refreshed.
+        """
+        return {
+            "refresh_strategy": "STATIC",
+            "expiration": self._info.expiration,
+            "ip_addrs": dict(self._info.ip_addrs),
+            "ssl_context_built": self._info.context is not None,
+            "next_refresh": None,
+            "last_refresh_duration": None,
+            "last_refresh_outcome": None,
+            "last_refresh_error": None,
+            "consecutive_failures": 0,
+            "serving_stale": False,
+            "stale_served": 0,
+            "rate_limiter_tokens": None,
+        }
+
     async def close(self) -> None:
         """
         This is a no-op.
@@ -0,0 +1,304 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+import logging
+import struct
+import threading
+from typing import TYPE_CHECKING
+from typing import Optional
+
+from google.auth import _helpers
+from google.auth.credentials import TokenState
+from google.cloud.alloydbconnector.auth_transport import AsyncRequest
+from google.cloud.alloydbconnector.auth_transport import is_async_credentials
+from google.cloud.alloydbconnector.auth_transport import sync_request
+from google.cloud.alloydbconnector.exceptions import ClosedConnectorError
+
+if TYPE_CHECKING:
+    from google.auth.credentials import Credentials
+    import google.cloud.alloydb_connectors_v1.proto.resources_pb2 as connectorspb
+
+logger = logging.getLogger(name=__name__)
+
+# _token_refresh_buffer is how long before the token would turn stale that a
+# proactive background refresh is started.
+_token_refresh_buffer = timedelta(minutes=1)
+
+
+class TokenManager:
+    """
+    Keeps the OAuth2 token used for database authentication fresh.
+
+    Refreshes the token in the background ahead of expiry so that connection
+    attempts do not block on token I/O, coalesces concurrent refreshes into a
+    single request, and caches the serialized MetadataExchangeRequest for the
+    current token.
+
+    Refreshes go through a process-wide pooled HTTP session. Async
+    credentials, whose refresh is a coroutine, are refreshed on the event
+    loop with an aiohttp session instead of in a thread.
+
+    Args:
+        credentials (google.auth.credentials.Credentials): The credentials
+            used to authenticate with the database.
+    """
+
+    def __init__(self, credentials: Credentials) -> None:
+        self._credentials = credentials
+        self._lock = threading.Lock()
+        # a single worker serializes refreshes; the thread is only started
+        # on the first refresh
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="alloydb-token-refresh"
+        )
+        self._refresh_future: Optional[Future[None]] = None
+        # the session used to refresh async credentials
+        self._async_request: Optional[AsyncRequest] = None
+        if is_async_credentials(credentials):
+            self._async_request = AsyncRequest()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # serialized metadata exchange requests keyed by
+        # (user agent, auth type), valid only for _requests_token
+        self._requests: dict[
+            tuple[str, connectorspb.MetadataExchangeRequest.AuthType], bytes
+        ] = {}
+        self._requests_token: Optional[str] = None
+        self._closed = False
+
+    @property
+    def credentials(self) -> Credentials:
+        return self._credentials
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Enables proactive background refreshes, scheduled on the given loop
+        after each successful refresh.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The event loop used to schedule
+                refreshes ahead of token expiry.
+        """
+        self._loop = loop
+
+    def refresh(self) -> Future[None]:
+        """
+        Starts a token refresh, or joins the refresh already in flight.
+
+        Returns:
+            concurrent.futures.Future: Completes once the token is refreshed.
+
+        Raises:
+            ClosedConnectorError: The token manager has been closed.
+        """
+        with self._lock:
+            if self._closed:
+                raise ClosedConnectorError(
+                    "Token refresh failed because the connector has already "
+                    "been closed."
+                )
+            future = self._refresh_future
+            started = future is None
+            if future is None:
+                future = self._start_refresh()
+                self._refresh_future = future
+        # registered outside the lock as an already finished future runs the
+        # callback immediately
+        if started:
+            future.add_done_callback(self._on_refresh_done)
+        return future
+
+    def _start_refresh(self) -> Future[None]:
+        if self._async_request is None:
+            # the pooled session reuses connections to the token endpoint
+            return self._executor.submit(self._credentials.refresh, sync_request())
+        # async credentials refresh on the event loop with an aiohttp
+        # session, without taking a thread
+        loop = self._loop or asyncio.get_running_loop()
+        return asyncio.run_coroutine_threadsafe(self._refresh_async(), loop)
+
+    async def _refresh_async(self) -> None:
+        assert self._async_request is not None
+        await self._credentials.refresh(self._async_request.get())
+
+    def _on_refresh_done(self, future: Future[None]) -> None:
+        with self._lock:
+            if self._refresh_future is future:
+                self._refresh_future = None
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            logger.debug(f"Database token refresh failed: {str(exc)}")
+            return
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        """Schedules the next proactive refresh ahead of token expiry."""
+        loop = self._loop
+        expiry = self._credentials.expiry
+        if self._closed or loop is None or loop.is_closed() or expiry is None:
+            return
+        # a token that is not fresh right after a refresh is short-lived;
+        # leave it to be refreshed on demand rather than spin
+        if self._credentials.token_state != TokenState.FRESH:
+            return
+        stale_at = expiry.replace(tzinfo=timezone.utc) - _helpers.REFRESH_THRESHOLD
+        delay = (
+            stale_at - _token_refresh_buffer - datetime.now(timezone.utc)
+        ).total_seconds()
+        logger.debug(
+            "Database token refresh scheduled for "
+            f"{(datetime.now(timezone.utc) + timedelta(seconds=max(delay, 0))).isoformat(timespec='seconds')}"
+        )
+        try:
+            loop.call_soon_threadsafe(self._set_timer, max(delay, 0))
+        except RuntimeError:
+            # loop closed concurrently
+            pass
+
+    def _set_timer(self, delay: float) -> None:
+        # runs on the event loop thread
+        if self._timer is not None:
+            self._timer.cancel()
+        if self._closed or self._loop is None:
+            return
+        self._timer = self._loop.call_later(delay, self._scheduled_refresh)
+
+    def _scheduled_refresh(self) -> None:
+        # runs on the event loop thread; close() may have raced the timer
+        self._timer = None
+        if not self._closed:
+            self.refresh()
+
+    def token(self) -> str:
+        """
+        Returns a valid token, blocking only if no usable token exists.
+
+        A stale but still valid token is returned immediately while a refresh
+        runs in the background.
+        """
+        state = self._credentials.token_state
+        if state == TokenState.INVALID:
+            self.refresh().result()
+        elif state == TokenState.STALE:
+            self.refresh()
+        return self._credentials.token
+
+    async def token_async(self) -> str:
+        """
+        Returns a valid token, awaiting a refresh only if no usable token
+        exists.
+        """
+        state = self._credentials.token_state
+        if state == TokenState.INVALID:
+            await asyncio.wrap_future(self.refresh())
+        elif state == TokenState.STALE:
+            self.refresh()
+        return self._credentials.token
+
+    def metadata_exchange_request(
+        self, user_agent: str, auth_type: connectorspb.MetadataExchangeRequest.AuthType
+    ) -> bytes:
+        """
+        Returns the length-prefixed, serialized MetadataExchangeRequest for
+        the current token.
+
+        Args:
+            user_agent (str): The user agent sent to the server.
+            auth_type (MetadataExchangeRequest.AuthType): The requested
+                authentication type.
+
+        Returns:
+            bytes: The big endian uint32 message length followed by the
+                serialized message.
+        """
+        return self._serialize_request(self.token(), user_agent, auth_type)
+
+    async def metadata_exchange_request_async(
+        self, user_agent: str, auth_type: connectorspb.MetadataExchangeRequest.AuthType
+    ) -> bytes:
+        """
+        Returns the length-prefixed, serialized MetadataExchangeRequest for
+        the current token, awaiting a refresh only if no usable token exists.
+
+        Args:
+            user_agent (str): The user agent sent to the server.
+            auth_type (MetadataExchangeRequest.AuthType): The requested
+                authentication type.
+
+        Returns:
+            bytes: The big endian uint32 message length followed by the
+                serialized message.
+        """
+        token = await self.token_async()
+        return self._serialize_request(token, user_agent, auth_type)
+
+    def _serialize_request(
+        self,
+        token: str,
+        user_agent: str,
+        auth_type: connectorspb.MetadataExchangeRequest.AuthType,
+    ) -> bytes:
+        key = (user_agent, auth_type)
+        with self._lock:
+            if self._requests_token != token:
+                self._requests.clear()
+                self._requests_token = token
+            payload = self._requests.get(key)
+        if payload is not None:
+            return payload
+        import google.cloud.alloydb_connectors_v1.proto.resources_pb2 as connectorspb
+
+        req = connectorspb.MetadataExchangeRequest(
+            user_agent=user_agent,
+            auth_type=auth_type,
+            oauth2_token=token,
+        )
+        # pack big-endian unsigned integer (4 bytes)
+        payload = struct.pack(">I", req.ByteSize()) + req.SerializeToString()
+        with self._lock:
+            if self._requests_token == token:
+                self._requests[key] = payload
+        return payload
+
+    def close(self) -> None:
+        """Cancels the scheduled refresh and releases the refresh thread."""
+        with self._lock:
+            self._closed = True
+        timer, self._timer = self._timer, None
+        if timer is not None:
+            loop = self._loop
+            if loop is not None and not loop.is_closed():
+                try:
+                    loop.call_soon_threadsafe(timer.cancel)
+                except RuntimeError:
+                    pass
+        self._executor.shutdown(wait=False)
+
+    async def close_async(self) -> None:
+        """Closes the token manager and the session used to refresh async
+        credentials. Must be called on the event loop they were refreshed
+        on."""
+        self.close()
+        if self._async_request is not None:
+            await self._async_request.close()
@@ -14,13 +14,41 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
+import time
+from typing import Optional
 
-import aiofiles
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
 
+# the port the AlloyDB server-side proxy receives connections on
+SERVER_PROXY_PORT = 5433
+# the maximum amount of time to wait before aborting a metadata exchange
+IO_TIMEOUT = 30
+# the default time allowed for a connection attempt, from waiting on the
+# connection info to the driver's handshake
+CONNECT_TIMEOUT = 60
+
+
+def _deadline(timeout: Optional[float]) -> Optional[float]:
+    """Returns the time.monotonic() deadline for a timeout in seconds."""
+    if timeout is None:
+        return None
+    return time.monotonic() + timeout
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """Returns the seconds left until a deadline, raising TimeoutError if it
+    has passed."""
+    if deadline is None:
+        return None
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError("Connection attempt exceeded its timeout.")
+    return remaining
+
 
 async def _write_to_file(
     dir_path: str, ca_cert: str, cert_chain: list[str], key: PrivateKeyTypes
@@ -39,6 +67,8 @@ async def _write_to_file(
         encryption_algorithm=serialization.NoEncryption(),
     )
 
+    import aiofiles
+
     async with aiofiles.open(ca_filename, "w+") as ca_out:
         await ca_out.write(ca_cert)
     async with aiofiles.open(cert_chain_filename, "w+") as chain_out:
@@ -50,6 +80,12 @@ async def _write_to_file(
 
 
 async def generate_keys() -> tuple[rsa.RSAPrivateKey, str]:
+    # generating the key takes tens of milliseconds of CPU, so it runs in a
+    # thread without blocking the event loop
+    return await asyncio.to_thread(_generate_keys)
+
+
+def _generate_keys() -> tuple[rsa.RSAPrivateKey, str]:
     priv_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
     pub_key = (
         priv_key.public_key()
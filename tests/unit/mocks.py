@@ -265,6 +265,14 @@ class FakeAlloyDBClient:
         self.instance = FakeInstance() if instance is None else instance
         self._user_agent = f"test-user-agent+{driver}"
         self._credentials = FakeCredentials()
+        self.closed = False
+
+    @property
+    def loop_bound(self) -> bool:
+        return False
+
+    def close(self) -> None:
+        self.closed = True
 
     async def _get_metadata(self, *args: Any, **kwargs: Any) -> str:
         return self.instance.ip_addrs
@@ -28,6 +28,7 @@ from google.api_core.retry.retry_unary_async import AsyncRetry
 from google.cloud.alloydbconnector import AsyncConnector
 from google.cloud.alloydbconnector import IPTypes
 from google.cloud.alloydbconnector.client import AlloyDBClient
+from google.cloud.alloydbconnector.exceptions import CircuitOpenError
 from google.cloud.alloydbconnector.exceptions import ClosedConnectorError
 from google.cloud.alloydbconnector.exceptions import IPTypeNotFoundError
 from google.cloud.alloydbconnector.instance import RefreshAheadCache
@@ -191,6 +192,25 @@ async def test_AsyncConnector_context_manager(
         assert connector._enable_iam_auth is False
 
 
+async def test_AsyncConnector_start(credentials: FakeCredentials) -> None:
+    """
+    Test that AsyncConnector discovers Application Default Credentials on
+    start, and that start with a driver creates the client for it.
+    """
+    with patch("google.auth.default") as mock_default:
+        mock_default.return_value = credentials, "my-project"
+        async with AsyncConnector() as connector:
+            mock_default.assert_not_called()
+            await asyncio.gather(connector.start(), connector.start("asyncpg"))
+            mock_default.assert_called_once()
+            assert connector._credentials == credentials
+            assert connector._client is not None
+            assert connector._keys is not None and connector._keys.done()
+            # the client was created for a driver without metadata exchange
+            with pytest.raises(ValueError):
+                await connector.start("psycopg")
+
+
 TEST_INSTANCE_NAME = "/".join(
     [
         "projects",
@@ -231,6 +251,41 @@ async def test_connect_and_close(credentials: FakeCredentials) -> None:
         assert connection.result() is True
 
 
+@pytest.mark.asyncio
+async def test_on_instance_change(credentials: FakeCredentials) -> None:
+    """
+    Test that subscribed callbacks are told about changed IP addresses, and
+    that async callbacks are run.
+    """
+    with patch("google.cloud.alloydbconnector.asyncpg.connect") as connect:
+        connect.return_value = True
+        connector = AsyncConnector(credentials, refresh_strategy="lazy")
+        client = FakeAlloyDBClient()
+        connector._client = client
+        changes = []
+        awaited = asyncio.Event()
+
+        async def async_callback(change: Any) -> None:
+            awaited.set()
+
+        connector.on_instance_change(changes.append)
+        unsubscribe = connector.on_instance_change(async_callback)
+        await connector.connect(TEST_INSTANCE_NAME, "asyncpg", user="u", db="d")
+        # fail over to a new private IP address
+        client.instance.ip_addrs = {**client.instance.ip_addrs, "PRIVATE": "10.0.0.99"}
+        await connector._cache[TEST_INSTANCE_NAME].force_refresh()
+        await connector.connect(TEST_INSTANCE_NAME, "asyncpg", user="u", db="d")
+
+        assert len(changes) == 1
+        assert changes[0].instance_uri == TEST_INSTANCE_NAME
+        assert changes[0].ip_addrs_changed is True
+        assert changes[0].current.ip_addrs["PRIVATE"] == "10.0.0.99"
+        await asyncio.wait_for(awaited.wait(), 1)
+        unsubscribe()
+        assert len(connector._instance_listeners._callbacks) == 1
+        await connector.close()
+
+
 @pytest.mark.asyncio
 async def test_connect_iam_authn(credentials: FakeCredentials) -> None:
     """
@@ -294,11 +349,12 @@ async def test_connect_db_credentials_iam_authn(credentials: FakeCredentials) ->
 @pytest.mark.asyncio
 async def test_force_refresh(credentials: FakeCredentials) -> None:
     """
-    Test that any failed connection results in a force refresh.
+    Test that a failed connection a refresh could fix results in a force
+    refresh.
     """
     with patch(
         "google.cloud.alloydbconnector.asyncpg.connect",
-        side_effect=Exception("connection failed"),
+        side_effect=ConnectionResetError("connection failed"),
     ):
         connector = AsyncConnector(credentials)
         connector._client = FakeAlloyDBClient()
@@ -323,6 +379,63 @@ async def test_force_refresh(credentials: FakeCredentials) -> None:
         await connector.close()
 
 
+@pytest.mark.asyncio
+async def test_no_force_refresh_on_database_error(credentials: FakeCredentials) -> None:
+    """
+    Test that a failed connection a refresh can't fix, like a wrong password,
+    doesn't force a refresh.
+    """
+    with patch(
+        "google.cloud.alloydbconnector.asyncpg.connect",
+        side_effect=Exception("password authentication failed"),
+    ):
+        connector = AsyncConnector(credentials)
+        connector._client = FakeAlloyDBClient()
+        fake = FakeConnectionInfo()
+        connector._cache[TEST_INSTANCE_NAME] = fake
+
+        with pytest.raises(Exception):
+            await connector.connect(
+                TEST_INSTANCE_NAME, "asyncpg", user="test-user", db="test-db"
+            )
+        assert fake._force_refresh_called is False
+
+        await connector.close()
+
+
+@pytest.mark.asyncio
+async def test_connect_circuit_breaker(credentials: FakeCredentials) -> None:
+    """
+    Test that repeated dial failures open the circuit, after which connect
+    fails fast without dialing or refreshing.
+    """
+    with patch(
+        "google.cloud.alloydbconnector.asyncpg.connect",
+        side_effect=ConnectionRefusedError(),
+    ) as mock_connect:
+        connector = AsyncConnector(credentials, circuit_breaker_threshold=1)
+        connector._client = FakeAlloyDBClient()
+        fake = FakeConnectionInfo()
+        # circuits are per IP address, so the address must be the same
+        fake.get_preferred_ip = lambda ip_type: "10.0.0.1"  # type: ignore[assignment, method-assign, return-value]
+        connector._cache[TEST_INSTANCE_NAME] = fake
+
+        with pytest.raises(ConnectionRefusedError):
+            await connector.connect(
+                TEST_INSTANCE_NAME, "asyncpg", user="test-user", db="test-db"
+            )
+        fake._force_refresh_called = False
+        with pytest.raises(CircuitOpenError):
+            await connector.connect(
+                TEST_INSTANCE_NAME, "asyncpg", user="test-user", db="test-db"
+            )
+        assert fake._force_refresh_called is False
+        assert mock_connect.call_count == 1
+        assert connector.circuit_breaker_stats()[0]["state"] == "open"
+
+        await connector.close()
+
+
 @pytest.mark.asyncio
 async def test_close_stops_instance(credentials: FakeCredentials) -> None:
     """
@@ -460,6 +573,7 @@ async def test_Connector_remove_cached_no_ip_type(credentials: FakeCredentials)
     fake_client.instance.ip_addrs = {"PUBLIC": "127.0.0.1"}
     async with AsyncConnector(credentials=credentials) as connector:
         connector._client = fake_client
+        await connector.start()
         # populate cache
         cache = RefreshAheadCache(instance_uri, fake_client, connector._keys)
         connector._cache[instance_uri] = cache
@@ -491,3 +605,289 @@ async def test_connect_when_closed(credentials: FakeCredentials) -> None:
         exc_info.value.args[0]
         == "Connection attempt failed because the connector has already been closed."
     )
+
+
+@pytest.mark.usefixtures("proxy_server")
+async def test_connect_psycopg(
+    credentials: FakeCredentials, fake_client: FakeAlloyDBClient
+) -> None:
+    """
+    Test that connector.connect performs the metadata exchange on the event
+    loop before handing the connection to psycopg.
+    """
+    received = []
+
+    async def fake_connect(remote: Any, **kwargs: Any) -> bool:
+        # the proxy server writes the instance name after the exchange
+        name = fake_client.instance.name.encode("utf-8")
+        received.append(await remote.read_exactly(len(name)))
+        remote.close()
+        return True
+
+    with patch("google.cloud.alloydbconnector.psycopg.connect_async", new=fake_connect):
+        async with AsyncConnector(credentials) as connector:
+            connector._client = fake_client
+            connection = await connector.connect(
+                TEST_INSTANCE_NAME,
+                "psycopg",
+                user="test-user",
+                password="test-password",
+                db="test-db",
+            )
+    assert connection is True
+    assert received == [fake_client.instance.name.encode("utf-8")]
+
+
+async def test_connect_mixed_metadata_exchange_drivers(
+    credentials: FakeCredentials,
+) -> None:
+    """
+    Test that drivers with and without the metadata exchange can't share an
+    AsyncConnector.
+    """
+    with patch("google.cloud.alloydbconnector.asyncpg.connect") as connect:
+        future = asyncio.Future()
+        future.set_result(True)
+        connect.return_value = future
+        async with AsyncConnector(credentials) as connector:
+            connector._client = FakeAlloyDBClient()
+            await connector.connect(
+                TEST_INSTANCE_NAME,
+                "asyncpg",
+                user="test-user",
+                password="test-password",
+                db="test-db",
+            )
+            with pytest.raises(ValueError, match="metadata exchange"):
+                await connector.connect(TEST_INSTANCE_NAME, "psycopg")
+
+
+class FakePool:
+    """Fake asyncpg.Pool that opens min_size connections on creation."""
+
+    def __init__(self, connect: Any, min_size: int, max_size: int, **kwargs: Any):
+        self.connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.kwargs = kwargs
+        self.expired = 0
+        self.terminated = False
+        self.conns: list = []
+
+    async def init(self) -> "FakePool":
+        # asyncpg passes its dsn positionally and the loop as a keyword
+        for _ in range(self.min_size):
+            self.conns.append(
+                await self.connect(None, loop=asyncio.get_running_loop(), **self.kwargs)
+            )
+        return self
+
+    async def expire_connections(self) -> None:
+        self.expired += 1
+
+    def get_size(self) -> int:
+        return len(self.conns)
+
+    def get_idle_size(self) -> int:
+        return len(self.conns)
+
+    def get_min_size(self) -> int:
+        return self.min_size
+
+    def get_max_size(self) -> int:
+        return self.max_size
+
+    def is_closing(self) -> bool:
+        return self.terminated
+
+    def terminate(self) -> None:
+        self.terminated = True
+
+
+async def test_create_pool(credentials: FakeCredentials) -> None:
+    """
+    Test that AsyncConnector.create_pool opens pool connections through the
+    connector and recycles them when the instance IP changes.
+    """
+    client = FakeAlloyDBClient()
+
+    async def fake_create_pool(connect: Any, **kwargs: Any) -> FakePool:
+        return await FakePool(connect, **kwargs).init()
+
+    with (
+        patch("google.cloud.alloydbconnector.asyncpg.connect") as connect,
+        patch(
+            "google.cloud.alloydbconnector.asyncpg.create_pool", new=fake_create_pool
+        ),
+    ):
+        future = asyncio.Future()
+        future.set_result(True)
+        connect.return_value = future
+        connector = AsyncConnector(credentials)
+        connector._client = client
+        pool = await connector.create_pool(
+            TEST_INSTANCE_NAME,
+            min_size=3,
+            max_size=5,
+            user="test-user",
+            password="test-password",
+            db="test-db",
+        )
+        assert pool.get_size() == 3
+        assert connect.call_count == 3
+        # driver arguments reach the driver, pool arguments do not
+        assert connect.call_args.kwargs["user"] == "test-user"
+        assert "loop" not in connect.call_args.kwargs
+        stats = connector.pool_stats()
+        assert stats[0]["instance_uri"] == TEST_INSTANCE_NAME
+        assert stats[0]["size"] == 3
+        assert stats[0]["ip_address"] == client.instance.ip_addrs["PRIVATE"]
+        assert stats[0]["recycles"] == 0
+
+        # a new connection to a failed over instance recycles the pool
+        conn_info = connector._cache[TEST_INSTANCE_NAME]._current.result()
+        conn_info.ip_addrs = {**conn_info.ip_addrs, "PRIVATE": "10.0.0.99"}
+        pool.conns.append(await pool.connect(None, user="u", password="p", db="d"))
+        await asyncio.sleep(0)
+        assert pool.expired == 1
+        assert connector.pool_stats()[0]["recycles"] == 1
+
+        await connector.close()
+        assert pool.terminated
+
+
+async def test_create_pool_psycopg(credentials: FakeCredentials) -> None:
+    """
+    Test that AsyncConnector.create_pool creates and opens a psycopg_pool
+    AsyncConnectionPool with connections made through the connector.
+    """
+    client = FakeAlloyDBClient()
+    created = {}
+
+    class FakeAsyncPool:
+        def __init__(self, connect: Any, **kwargs: Any) -> None:
+            self.connect = connect
+            self.min_size = kwargs.pop("min_size")
+            self.max_size = kwargs.pop("max_size")
+            self.max_lifetime = kwargs.pop("max_lifetime")
+            self.kwargs = kwargs
+            self.closed = True
+            self.drained = 0
+            created["pool"] = self
+
+        async def open(self) -> None:
+            self.closed = False
+
+        async def close(self) -> None:
+            self.closed = True
+
+        async def drain(self) -> None:
+            self.drained += 1
+
+        def get_stats(self) -> dict:
+            return {"pool_size": 0, "pool_available": 0}
+
+    with (
+        patch("google.cloud.alloydbconnector.psycopg.connect_async") as connect,
+        patch(
+            "google.cloud.alloydbconnector.psycopg.create_async_pool",
+            new=FakeAsyncPool,
+        ),
+        patch.object(AsyncConnector, "_metadata_exchange") as mdx,
+    ):
+        connect.return_value = "conn"
+        mdx.return_value = "remote"
+        connector = AsyncConnector(credentials)
+        connector._client = client
+        pool = await connector.create_pool(
+            TEST_INSTANCE_NAME, "psycopg", min_size=2, max_size=4, user="u", db="d"
+        )
+        assert pool is created["pool"]
+        assert not pool.closed
+        assert await pool.connect(**pool.kwargs) == "conn"
+        assert pool.max_lifetime < 3600.0
+        conn_info = connector._cache[TEST_INSTANCE_NAME]._current.result()
+        conn_info.ip_addrs = {**conn_info.ip_addrs, "PRIVATE": "10.0.0.99"}
+        await pool.connect(**pool.kwargs)
+        await asyncio.sleep(0)
+        assert pool.drained == 1
+        assert connector.pool_stats()[0]["max_size"] == 4
+        await connector.close()
+        assert pool.closed
+
+
+async def test_connect_timeout(credentials: FakeCredentials) -> None:
+    """
+    Test that AsyncConnector.connect raises TimeoutError when the connection
+    info doesn't arrive in time.
+    """
+    client = FakeAlloyDBClient()
+
+    async def hang(*args: Any, **kwargs: Any) -> None:
+        await asyncio.sleep(60)
+
+    client.get_connection_info = hang  # type: ignore[method-assign]
+    async with AsyncConnector(credentials=credentials, timeout=0.2) as connector:
+        connector._client = client
+        with pytest.raises(TimeoutError):
+            await connector.connect(
+                TEST_INSTANCE_NAME,
+                "asyncpg",
+                user="test-user",
+                password="test-password",
+                db="test-db",
+            )
+
+
+async def test_connect_from_other_event_loops(credentials: FakeCredentials) -> None:
+    """
+    Test that connections from event loops in other threads share the
+    connection info refreshed on the connector's loop, and are dialed on
+    their own loop.
+    """
+    dial_loops = []
+
+    async def fake_connect(*args: Any, **kwargs: Any) -> bool:
+        dial_loops.append(asyncio.get_running_loop())
+        return True
+
+    with patch("google.cloud.alloydbconnector.asyncpg.connect", new=fake_connect):
+        async with AsyncConnector(credentials) as connector:
+            connector._client = FakeAlloyDBClient()
+            await connector.connect(TEST_INSTANCE_NAME, "asyncpg", user="u")
+            cache = connector._cache[TEST_INSTANCE_NAME]
+
+            def connect_in_thread() -> bool:
+                return asyncio.run(
+                    connector.connect(TEST_INSTANCE_NAME, "asyncpg", user="u")
+                )
+
+            results = await asyncio.gather(
+                *[asyncio.to_thread(connect_in_thread) for _ in range(3)]
+            )
+            assert results == [True, True, True]
+            # a single cache, refreshing on the connector's loop
+            assert connector._cache == {TEST_INSTANCE_NAME: cache}
+            assert connector._loop is asyncio.get_running_loop()
+            assert len(set(dial_loops)) == 4
+
+
+def test_connect_after_event_loop_closed(credentials: FakeCredentials) -> None:
+    """
+    Test that a connector used with asyncio.run() more than once moves its
+    refreshes to the new loop, keeping its key pair.
+    """
+    with patch("google.cloud.alloydbconnector.asyncpg.connect") as connect:
+        connect.return_value = True
+        connector = AsyncConnector(credentials)
+        connector._client = FakeAlloyDBClient()
+
+        async def connect_once() -> Any:
+            return await connector.connect(TEST_INSTANCE_NAME, "asyncpg", user="u")
+
+        assert asyncio.run(connect_once()) is True
+        keys = connector._keys.result()
+        assert asyncio.run(connect_once()) is True
+        assert connector._keys.result() == keys
+        assert connect.call_count == 2
+        asyncio.run(connector.close())
@@ -0,0 +1,118 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import Any
+
+from mocks import FakeCredentials
+import pytest
+
+from google.cloud.alloydbconnector import channel_pool
+from google.cloud.alloydbconnector.channel_pool import acquire_channel
+from google.cloud.alloydbconnector.channel_pool import release_channel
+from google.cloud.alloydbconnector.client import AlloyDBClient
+
+
+class FakeChannel:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class ServiceAccountCredentials(FakeCredentials):
+    def __init__(self, email: str) -> None:
+        super().__init__()
+        self.service_account_email = email
+
+
+def test_channels_are_shared_and_released() -> None:
+    """
+    Test that acquiring a channel twice with the same key creates it once,
+    and that it is closed once unused for the idle timeout.
+    """
+    credentials = FakeCredentials()
+    created: list[FakeChannel] = []
+
+    def create() -> FakeChannel:
+        created.append(FakeChannel())
+        return created[-1]
+
+    key1, channel1 = acquire_channel("host:443", credentials, "p", create)
+    key2, channel2 = acquire_channel("host:443", credentials, "p", create)
+    assert channel1 is channel2
+    assert len(created) == 1
+    # a different quota project gets its own channel
+    key3, channel3 = acquire_channel("host:443", credentials, "other", create)
+    assert channel3 is not channel1
+    for key in (key1, key2, key3):
+        release_channel(key)
+    # unused channels are kept open until the idle timeout
+    assert not channel1.closed
+    key4, channel4 = acquire_channel("host:443", credentials, "p", create)
+    assert channel4 is channel1
+    release_channel(key4)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(channel_pool, "_IDLE_TIMEOUT", -1)
+        release_channel(object())
+    assert channel1.closed and channel3.closed
+
+
+def test_credentials_key() -> None:
+    """
+    Test that credentials for the same account share a key, and that other
+    credentials are told apart by identity.
+    """
+    key = channel_pool._credentials_key
+    assert key(ServiceAccountCredentials("a@p.iam")) == key(
+        ServiceAccountCredentials("a@p.iam")
+    )
+    assert key(ServiceAccountCredentials("a@p.iam")) != key(
+        ServiceAccountCredentials("b@p.iam")
+    )
+    assert key(FakeCredentials()) != key(FakeCredentials())
+
+
+def test_async_channels_dropped_with_their_loop() -> None:
+    """
+    Test that channels bound to an event loop are dropped once the loop is
+    closed.
+    """
+    loop = asyncio.new_event_loop()
+    channel: Any = FakeChannel()
+    key, _ = acquire_channel(
+        "host:443", FakeCredentials(), None, lambda: channel, loop=loop
+    )
+    loop.close()
+    release_channel(key)
+    assert key not in channel_pool._channels
+    # the channel can't be closed without its loop
+    assert not channel.closed
+
+
+def test_AlloyDBClient_shares_channel() -> None:
+    """
+    Test that AlloyDBClients for the same endpoint and credentials share a
+    gRPC channel.
+    """
+    credentials = ServiceAccountCredentials("shared@p.iam")
+    clients = [
+        AlloyDBClient("alloydb.googleapis.com", None, credentials, driver="pg8000")
+        for _ in range(2)
+    ]
+    channels = [c._client._transport.grpc_channel for c in clients]
+    assert channels[0] is channels[1]
+    for c in clients:
+        c.close()
@@ -0,0 +1,122 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from mock import patch
+import pytest
+
+from google.cloud.alloydbconnector.circuit_breaker import CircuitBreaker
+from google.cloud.alloydbconnector.circuit_breaker import CircuitBreakers
+from google.cloud.alloydbconnector.exceptions import CircuitOpenError
+
+
+def test_CircuitBreaker_opens_after_threshold() -> None:
+    """
+    Test that the circuit opens after consecutive dial failures and fails
+    attempts fast while open.
+    """
+    breaker = CircuitBreaker("instance", failure_threshold=2, reset_timeout=30)
+    for _ in range(2):
+        with pytest.raises(ConnectionRefusedError):
+            with breaker:
+                raise ConnectionRefusedError()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()
+    assert breaker.stats() == {
+        "state": "open",
+        "failures": 2,
+        "opens": 1,
+        "rejected": 1,
+    }
+
+
+def test_CircuitBreaker_ignores_database_errors() -> None:
+    """
+    Test that errors raised after reaching the instance reset the failure
+    count instead of opening the circuit.
+    """
+    breaker = CircuitBreaker("instance", failure_threshold=2, reset_timeout=30)
+    with pytest.raises(ConnectionRefusedError):
+        with breaker:
+            raise ConnectionRefusedError()
+    with pytest.raises(ValueError):
+        with breaker:
+            raise ValueError("password authentication failed")
+    with pytest.raises(ConnectionRefusedError):
+        with breaker:
+            raise ConnectionRefusedError()
+    assert breaker.state == "closed"
+
+
+def test_CircuitBreaker_half_open_single_trial() -> None:
+    """
+    Test that a half-open circuit lets a single trial through, which closes
+    the circuit on success and opens it again on failure.
+    """
+    breaker = CircuitBreaker("instance", failure_threshold=1, reset_timeout=30)
+    with patch("google.cloud.alloydbconnector.circuit_breaker.time") as mock_time:
+        mock_time.monotonic.return_value = 100.0
+        breaker.record_failure()
+        mock_time.monotonic.return_value = 131.0
+        assert breaker.state == "half-open"
+        breaker.acquire()
+        # only one trial at a time
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire()
+        assert breaker.record_failure() is True
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire()
+        mock_time.monotonic.return_value = 162.0
+        breaker.acquire()
+        breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.opens == 2
+
+
+def test_CircuitBreaker_cancelled_trial_counts_as_failure() -> None:
+    """
+    Test that a cancelled attempt releases the trial and counts as a failure.
+    """
+    breaker = CircuitBreaker("instance", failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    with pytest.raises(asyncio.CancelledError):
+        with breaker:
+            raise asyncio.CancelledError()
+    assert breaker.opens == 2
+    # the trial is released
+    breaker.acquire()
+
+
+def test_CircuitBreakers_per_ip_address() -> None:
+    """
+    Test that each instance IP address gets its own circuit.
+    """
+    breakers = CircuitBreakers(failure_threshold=1, reset_timeout=30)
+    breakers.get("instance", "10.0.0.1").record_failure()
+    assert breakers.get("instance", "10.0.0.1") is breakers.get("instance", "10.0.0.1")
+    assert breakers.get("instance", "10.0.0.2").state == "closed"
+    assert [(s["ip_address"], s["state"]) for s in breakers.stats()] == [
+        ("10.0.0.1", "open"),
+        ("10.0.0.2", "closed"),
+    ]
+
+
+def test_CircuitBreakers_rejects_bad_threshold() -> None:
+    """
+    Test that a failure threshold below 1 is rejected.
+    """
+    with pytest.raises(ValueError):
+        CircuitBreakers(failure_threshold=0, reset_timeout=30)
@@ -12,15 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import subprocess
+import sys
+from types import SimpleNamespace
+from typing import Any
 from typing import Optional
 
+from mock import patch
 from mocks import FakeAlloyDBAdminAsyncClient
 from mocks import FakeAlloyDBAdminClient
 from mocks import FakeCredentials
 import pytest
 
+from google.api_core.exceptions import NotFound
 import google.cloud.alloydb_v1beta as v1beta
 from google.cloud.alloydbconnector.client import AlloyDBClient
+from google.cloud.alloydbconnector.client import _RpcStats
 from google.cloud.alloydbconnector.utils import generate_keys
 from google.cloud.alloydbconnector.version import __version__ as version
 
@@ -273,3 +281,175 @@ async def test_AlloyDBClient_use_metadata(
         "www.test-endpoint.com", "my-quota-project", credentials, driver=driver
     )
     assert client._use_metadata == expected
+
+
+class SlowFirstCallClient(FakeAlloyDBAdminAsyncClient):
+    """Answers the first call of each method slowly, and records the
+    keyword arguments of every call."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+
+    async def get_connection_info(self, **kwargs: Any) -> Any:  # type: ignore[override]
+        self.calls.append(kwargs)
+        if len(self.calls) == 1:
+            await asyncio.sleep(10)
+        return await super().get_connection_info(kwargs["request"])
+
+
+@pytest.mark.asyncio
+async def test_AlloyDBClient_hedges_slow_call(credentials: FakeCredentials) -> None:
+    """
+    Test that a call slower than the hedge delay is duplicated and the
+    duplicate's answer is used.
+    """
+    fake = SlowFirstCallClient()
+    test_client = AlloyDBClient(
+        "", "", credentials, fake, rpc_timeout=5, hedge_percentile=0.95
+    )
+    with patch("google.cloud.alloydbconnector.client._INITIAL_HEDGE_DELAY", 0.01):
+        ip_addrs = await asyncio.wait_for(
+            test_client._get_metadata(
+                "test-project", "test-region", "test-cluster", "test-instance"
+            ),
+            1,
+        )
+    assert ip_addrs["PRIVATE"] == "10.0.0.1"
+    assert len(fake.calls) == 2
+    # the deadline is passed on to every call
+    assert all(call["timeout"] == 5 for call in fake.calls)
+    stats = {s["method"]: s for s in test_client.stats()}
+    assert stats["get_connection_info"]["calls"] == 1
+    assert stats["get_connection_info"]["hedges"] == 1
+    assert stats["get_connection_info"]["hedge_wins"] == 1
+    assert stats["generate_client_certificate"]["calls"] == 0
+
+
+@pytest.mark.asyncio
+async def test_AlloyDBClient_no_hedging_by_default(
+    credentials: FakeCredentials,
+) -> None:
+    """
+    Test that calls are neither hedged nor given a deadline by default.
+    """
+    fake = SlowFirstCallClient()
+    test_client = AlloyDBClient("", "", credentials, fake)
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(
+            test_client._get_metadata(
+                "test-project", "test-region", "test-cluster", "test-instance"
+            ),
+            0.1,
+        )
+    assert fake.calls == [{"request": fake.calls[0]["request"]}]
+
+
+def test_RpcStats_hedge_delay() -> None:
+    """
+    Test that the hedge delay is the percentile of the recent latencies,
+    once there are enough of them.
+    """
+    stats = _RpcStats()
+    stats.latencies.extend([0.1] * 5)
+    assert stats.hedge_delay(0.95) == 1.0
+    stats.latencies.extend([0.1 * i for i in range(1, 101)])
+    assert stats.hedge_delay(0.95) == pytest.approx(9.6)
+    assert stats.hedge_delay(0.5) == pytest.approx(5.1)
+
+
+def test_AlloyDBClient_rejects_bad_hedge_percentile(
+    credentials: FakeCredentials,
+) -> None:
+    """
+    Test that a hedge percentile outside (0, 1) is rejected.
+    """
+    with pytest.raises(ValueError):
+        AlloyDBClient(
+            "", "", credentials, FakeAlloyDBAdminAsyncClient(), hedge_percentile=95
+        )
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, body: dict[str, Any]) -> None:
+        self.status_code = status_code
+        self._body = body
+        self.headers: dict[str, str] = {}
+        self.request = SimpleNamespace(method="GET", url="")
+        self.text = ""
+
+    def json(self) -> dict[str, Any]:
+        return self._body
+
+
+class FakeSession:
+    """A requests session answering the AlloyDB REST API."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str, Optional[dict]]] = []
+
+    def request(
+        self, method: str, url: str, json: Optional[dict] = None, **kwargs: Any
+    ) -> FakeResponse:
+        self.calls.append((method, url, json))
+        if "missing" in url:
+            return FakeResponse(404, {"error": {"message": "not found"}})
+        if url.endswith("/connectionInfo"):
+            return FakeResponse(
+                200, {"ipAddress": "10.0.0.1", "pscDnsName": "x.y.alloydb.goog."}
+            )
+        return FakeResponse(
+            200, {"caCert": "ca", "pemCertificateChain": ["client", "root"]}
+        )
+
+    def close(self) -> None:
+        pass
+
+
+async def test_AlloyDBClient_rest_transport(credentials: FakeCredentials) -> None:
+    """
+    Test that the REST transport calls the AlloyDB REST API and maps its
+    responses and errors like the gRPC client's.
+    """
+    client = AlloyDBClient(
+        "alloydb.googleapis.com",
+        "my-quota-project",
+        credentials,
+        driver="psycopg",
+        transport="rest",
+    )
+    session = FakeSession()
+    client._client._session = session
+    ip_addrs = await client._get_metadata("p", "r", "c", "i")
+    assert ip_addrs == {"PRIVATE": "10.0.0.1", "PUBLIC": "", "PSC": "x.y.alloydb.goog"}
+    certs = await client._get_client_certificate("p", "r", "c", "pub-key")
+    assert certs == ("ca", ["client", "root"])
+    method, url, body = session.calls[1]
+    assert method == "POST"
+    assert url == (
+        "https://alloydb.googleapis.com/v1beta/projects/p/locations/r"
+        "/clusters/c:generateClientCertificate"
+    )
+    assert body == {
+        "publicKey": "pub-key",
+        "certDuration": "3600s",
+        "useMetadataExchange": True,
+    }
+    with pytest.raises(NotFound):
+        await client._get_metadata("p", "r", "c", "missing")
+    client.close()
+
+
+def test_AlloyDBClient_rest_transport_skips_grpc() -> None:
+    """
+    Test that creating a client with the REST transport doesn't import gRPC.
+    """
+    code = (
+        "import sys\n"
+        "from google.auth.credentials import AnonymousCredentials\n"
+        "from google.cloud.alloydbconnector.client import AlloyDBClient\n"
+        "AlloyDBClient('alloydb.googleapis.com', None, AnonymousCredentials(),"
+        " transport='rest')\n"
+        "print('grpc' in sys.modules)\n"
+    )
+    out = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert out.strip() == "False"
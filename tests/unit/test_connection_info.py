@@ -63,6 +63,52 @@ async def test_ConnectionInfo_init_(fake_instance: FakeInstance) -> None:
     assert context.minimum_version == ssl.TLSVersion.TLSv1_3
 
 
+async def test_ConnectionInfo_shares_and_drops_pems(
+    fake_instance: FakeInstance,
+) -> None:
+    """
+    Test that ConnectionInfos share the CA and intermediate certificates,
+    and drop the certificates and key once the SSL context is built.
+    """
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    root_cert, intermediate_cert, ca_cert = fake_instance.get_pem_certs()
+    client_cert = (
+        x509.CertificateBuilder()
+        .subject_name(fake_instance.intermediate_cert.subject)
+        .issuer_name(fake_instance.intermediate_cert.issuer)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(datetime.now(timezone.utc))
+        .not_valid_after(datetime.now(timezone.utc) + timedelta(minutes=10))
+        .sign(fake_instance.intermediate_key, hashes.SHA256())
+        .public_bytes(encoding=serialization.Encoding.PEM)
+        .decode("UTF-8")
+    )
+    infos = [
+        ConnectionInfo(
+            [client_cert, intermediate_cert.encode().decode(), root_cert],
+            ca_cert.encode().decode(),
+            key,
+            fake_instance.ip_addrs,
+            datetime.now(timezone.utc) + timedelta(minutes=10),
+        )
+        for _ in range(2)
+    ]
+    assert infos[0].ca_cert is infos[1].ca_cert
+    assert infos[0].cert_chain[1] is infos[1].cert_chain[1]
+    assert infos[0].cert_digest == infos[1].cert_digest
+    assert not hasattr(infos[0], "__dict__")
+
+    await infos[0].create_ssl_context()
+    assert infos[0].cert_chain == []
+    assert infos[0].ca_cert == ""
+    assert infos[0].key is None
+    # the certificates are still told apart after being dropped
+    assert infos[0].cert_digest == infos[1].cert_digest
+    other = ConnectionInfo(["other"], ca_cert, key, {}, datetime.now(timezone.utc))
+    assert other.cert_digest != infos[0].cert_digest
+
+
 async def test_ConnectionInfo_caches_sslcontext() -> None:
     info = ConnectionInfo(["cert"], "cert", "key".encode(), {}, datetime.now())
     # context should default to None
@@ -13,9 +13,16 @@
 # limitations under the License.
 
 import asyncio
+from datetime import datetime
+from datetime import timezone
+import socket
+import ssl
+import threading
 from threading import Thread
+from typing import Any
 from typing import Union
 
+from mock import MagicMock
 from mock import patch
 from mocks import FakeAlloyDBClient
 from mocks import FakeCredentials
@@ -23,14 +30,20 @@ from mocks import FakeCredentialsRequiresScopes
 from mocks import write_static_info
 import pytest
 
+from google.api_core.exceptions import PermissionDenied
 from google.api_core.exceptions import RetryError
 from google.api_core.retry.retry_unary import Retry
+from google.auth.exceptions import DefaultCredentialsError
 from google.cloud.alloydbconnector import Connector
 from google.cloud.alloydbconnector import IPTypes
 from google.cloud.alloydbconnector.client import AlloyDBClient
+from google.cloud.alloydbconnector.connector import _close_on_cancel
+from google.cloud.alloydbconnector.exceptions import CircuitOpenError
 from google.cloud.alloydbconnector.exceptions import ClosedConnectorError
 from google.cloud.alloydbconnector.exceptions import IPTypeNotFoundError
 from google.cloud.alloydbconnector.instance import RefreshAheadCache
+from google.cloud.alloydbconnector.loop_thread import configure_loop_threads
+from google.cloud.alloydbconnector.loop_thread import loop_thread_count
 from google.cloud.alloydbconnector.utils import generate_keys
 
 
@@ -183,6 +196,27 @@ def test_Connector_context_manager(credentials: FakeCredentials) -> None:
         assert connector._db_credentials == credentials
 
 
+def test_Connector_defers_credential_discovery(credentials: FakeCredentials) -> None:
+    """
+    Test that Connector doesn't discover Application Default Credentials
+    until it is started, and that a failed discovery is retried.
+    """
+    with patch("google.cloud.alloydbconnector.connector.default") as mock_default:
+        mock_default.side_effect = [
+            DefaultCredentialsError("no credentials"),
+            (credentials, "my-project"),
+        ]
+        with Connector() as connector:
+            mock_default.assert_not_called()
+            with pytest.raises(DefaultCredentialsError):
+                connector.start().result()
+            connector.start(driver="pg8000").result()
+            assert mock_default.call_count == 2
+            assert connector._credentials == credentials
+            assert connector._client is not None
+            assert connector._keys is not None and connector._keys.done()
+
+
 def test_Connector_close(credentials: FakeCredentials) -> None:
     """
     Test that Connector's close method stops event loop and
@@ -223,6 +257,41 @@ def test_connect(credentials: FakeCredentials, fake_client: FakeAlloyDBClient) -
         # check DB authentication refreshed the credentials
         assert connector._credentials.token
         assert connector._db_credentials.token
+        # no proactive refreshes without IAM database authentication
+        assert connector._token_manager._loop is None
+
+
+@pytest.mark.usefixtures("proxy_server")
+def test_Connector_stats(
+    credentials: FakeCredentials, fake_client: FakeAlloyDBClient
+) -> None:
+    """
+    Test that Connector.stats reports the state and refresh schedule of each
+    cached instance.
+    """
+    instance_uri = "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance"
+    with Connector(credentials) as connector:
+        connector._client = fake_client
+        assert connector.stats() == []
+        with patch("google.cloud.alloydbconnector.pg8000.connect") as mock_connect:
+            mock_connect.return_value = True
+            connector.connect(instance_uri, "pg8000", user="u", password="p", db="d")
+        [stats] = connector.stats()
+    assert stats["instance_uri"] == instance_uri
+    assert stats["refresh_strategy"] == "BACKGROUND"
+    # certificate times are to the second
+    assert stats["expiration"] == fake_client.instance.cert_expiry.replace(
+        microsecond=0
+    )
+    assert stats["ip_addrs"] == fake_client.instance.ip_addrs
+    assert stats["ssl_context_built"] is True
+    assert stats["next_refresh"] > datetime.now(timezone.utc)
+    assert stats["last_refresh_outcome"] == "success"
+    assert stats["last_refresh_duration"] >= 0
+    assert stats["consecutive_failures"] == 0
+    assert stats["serving_stale"] is False
+    assert 0 <= stats["rate_limiter_tokens"] <= 2
+    assert stats["proxy_connections"] == 0
 
 
 @pytest.mark.usefixtures("proxy_server")
@@ -273,6 +342,32 @@ def test_connect_bad_ip_type(
         )
 
 
+def test_connect_remembers_connection_info_errors(
+    credentials: FakeCredentials, fake_client: FakeAlloyDBClient
+) -> None:
+    """
+    Test that an error getting connection info is raised again on the next
+    connect without calling the AlloyDB API.
+    """
+    instance_uri = "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance"
+    with Connector(credentials) as connector:
+        connector._client = fake_client
+        with patch.object(
+            fake_client, "get_connection_info", side_effect=PermissionDenied("denied")
+        ) as get_connection_info:
+            with pytest.raises(PermissionDenied):
+                connector.connect(
+                    instance_uri, "pg8000", user="test-user", password="pw", db="db"
+                )
+            calls = get_connection_info.call_count
+            with pytest.raises(PermissionDenied):
+                connector.connect(
+                    instance_uri, "pg8000", user="test-user", password="pw", db="db"
+                )
+        assert get_connection_info.call_count == calls
+        assert instance_uri not in connector._cache
+
+
 @pytest.mark.usefixtures("proxy_server")
 def test_connect_psycopg(
     credentials: FakeCredentials, fake_client: FakeAlloyDBClient
@@ -294,6 +389,124 @@ def test_connect_psycopg(
         assert connection is True
 
 
+@pytest.mark.usefixtures("proxy_server")
+def test_connect_cached_runs_on_calling_thread(
+    credentials: FakeCredentials, fake_client: FakeAlloyDBClient
+) -> None:
+    """
+    Test that connector.connect connects on the calling thread once the
+    connection info and SSL context are cached.
+    """
+    threads = []
+
+    def fake_connect(sock: ssl.SSLSocket, **kwargs: Any) -> bool:
+        threads.append(threading.current_thread())
+        sock.close()
+        return True
+
+    with Connector(credentials) as connector:
+        connector._client = fake_client
+        with patch(
+            "google.cloud.alloydbconnector.pg8000.connect", side_effect=fake_connect
+        ):
+            for _ in range(2):
+                assert connector.connect(
+                    "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance",
+                    "pg8000",
+                    user="test-user",
+                    password="test-password",
+                    db="test-db",
+                )
+    # the first connect builds the cache through the event loop
+    assert threads[0] is not threading.current_thread()
+    assert threads[1] is threading.current_thread()
+
+
+@pytest.mark.usefixtures("proxy_server")
+def test_connect_cached_failure_forces_refresh(
+    credentials: FakeCredentials, fake_client: FakeAlloyDBClient
+) -> None:
+    """
+    Test that a failed connection on the calling thread forces a refresh.
+    """
+    instance_uri = "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance"
+    with Connector(credentials) as connector:
+        connector._client = fake_client
+        with patch("google.cloud.alloydbconnector.pg8000.connect") as mock_connect:
+            mock_connect.return_value = True
+            connector.connect(
+                instance_uri, "pg8000", user="test-user", password="pw", db="db"
+            )
+            mock_connect.side_effect = OSError("connection reset")
+            with patch.object(
+                connector._cache[instance_uri], "force_refresh"
+            ) as force_refresh:
+                with pytest.raises(OSError):
+                    connector.connect(
+                        instance_uri, "pg8000", user="test-user", password="pw", db="db"
+                    )
+            force_refresh.assert_called_once()
+
+
+def test_connect_database_error_skips_refresh(
+    credentials: FakeCredentials, fake_client: FakeAlloyDBClient
+) -> None:
+    """
+    Test that a failed connection a refresh can't fix, like a wrong password,
+    doesn't force a refresh.
+    """
+    instance_uri = "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance"
+    with Connector(credentials) as connector:
+        connector._client = fake_client
+        with patch("google.cloud.alloydbconnector.pg8000.connect") as mock_connect:
+            mock_connect.return_value = True
+            connector.connect(
+                instance_uri, "pg8000", user="test-user", password="pw", db="db"
+            )
+            mock_connect.side_effect = Exception("password authentication failed")
+            with patch.object(
+                connector._cache[instance_uri], "force_refresh"
+            ) as force_refresh:
+                with pytest.raises(Exception):
+                    connector.connect(
+                        instance_uri, "pg8000", user="test-user", password="pw", db="db"
+                    )
+            force_refresh.assert_not_called()
+
+
+def test_connect_circuit_breaker(
+    credentials: FakeCredentials, fake_client: FakeAlloyDBClient
+) -> None:
+    """
+    Test that repeated dial failures open the circuit, after which connect
+    fails fast without dialing or refreshing.
+    """
+    instance_uri = "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance"
+    with Connector(credentials, circuit_breaker_threshold=2) as connector:
+        connector._client = fake_client
+        with patch.object(
+            Connector, "metadata_exchange", side_effect=ConnectionRefusedError()
+        ) as mock_exchange:
+            for _ in range(2):
+                with pytest.raises(ConnectionRefusedError):
+                    connector.connect(
+                        instance_uri, "pg8000", user="test-user", password="pw", db="db"
+                    )
+            with patch.object(
+                connector._cache[instance_uri], "force_refresh"
+            ) as force_refresh:
+                with pytest.raises(CircuitOpenError):
+                    connector.connect(
+                        instance_uri, "pg8000", user="test-user", password="pw", db="db"
+                    )
+            force_refresh.assert_not_called()
+            assert mock_exchange.call_count == 2
+        stats = connector.circuit_breaker_stats()
+        assert len(stats) == 1
+        assert stats[0]["state"] == "open"
+        assert stats[0]["rejected"] == 1
+
+
 def test_connect_unsupported_driver(credentials: FakeCredentials) -> None:
     """
     Test that connector.connect errors with unsupported database driver.
@@ -327,6 +540,52 @@ def test_Connector_close_called_multiple_times(credentials: FakeCredentials) ->
     connector.close()
 
 
+def test_Connector_shared_loop(credentials: FakeCredentials) -> None:
+    """
+    Test that Connectors created with shared_loop=True run on one loop
+    thread that stops once all of them are closed.
+    """
+    first = Connector(credentials=credentials, shared_loop=True)
+    second = Connector(credentials=credentials, shared_loop=True)
+    assert first._loop is second._loop
+    assert loop_thread_count() == 1
+    first.close()
+    # closing twice does not release the loop for the other connector
+    first.close()
+    assert second._thread.is_alive()
+    assert second._loop.is_running()
+    second.close()
+    assert second._thread.is_alive() is False
+    assert loop_thread_count() == 0
+
+
+def test_Connector_shared_loop_threads(credentials: FakeCredentials) -> None:
+    """
+    Test that Connectors are spread across the configured number of shared
+    loop threads.
+    """
+    configure_loop_threads(2)
+    try:
+        connectors = [
+            Connector(credentials=credentials, shared_loop=True) for _ in range(4)
+        ]
+        assert loop_thread_count() == 2
+        loops = [connector._loop for connector in connectors]
+        assert len(set(loops)) == 2
+        assert loops.count(loops[0]) == 2
+        for connector in connectors:
+            connector.close()
+        assert loop_thread_count() == 0
+    finally:
+        configure_loop_threads(1)
+
+
+def test_configure_loop_threads_rejects_bad_values() -> None:
+    """Test that configure_loop_threads needs at least one thread."""
+    with pytest.raises(ValueError):
+        configure_loop_threads(0)
+
+
 def test_Connector_remove_cached_bad_instance(
     credentials: FakeCredentials,
 ) -> None:
@@ -420,3 +679,195 @@ def test_connect_when_closed(credentials: FakeCredentials) -> None:
         exc_info.value.args[0]
         == "Connection attempt failed because the connector has already been closed."
     )
+
+
+def test_connect_enable_ktls(
+    monkeypatch: pytest.MonkeyPatch,
+    credentials: FakeCredentials,
+    fake_client: FakeAlloyDBClient,
+) -> None:
+    """
+    Test that Connector(enable_ktls=True) requests kernel TLS on the context
+    used for the metadata exchange.
+    """
+    # stand in with an option that is harmless under TLS 1.3 on Python builds
+    # without kTLS support
+    ktls_option = getattr(ssl, "OP_ENABLE_KTLS", ssl.OP_NO_RENEGOTIATION)
+    monkeypatch.setattr(ssl, "OP_ENABLE_KTLS", ktls_option, raising=False)
+    with Connector(credentials, enable_ktls=True) as connector:
+        connector._client = fake_client
+        with (
+            patch.object(connector, "metadata_exchange") as mdx,
+            patch("google.cloud.alloydbconnector.pg8000.connect"),
+        ):
+            connector.connect(
+                "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance",
+                "pg8000",
+                user="test-user",
+                password="test-password",
+                db="test-db",
+            )
+        ctx = mdx.call_args.args[2]
+        assert ctx.options & ktls_option
+
+
+class FakePsycopgPool:
+    """Fake psycopg_pool.ConnectionPool that records its connection factory."""
+
+    def __init__(self, connect: Any, **kwargs: Any) -> None:
+        self.connect = connect
+        self.min_size = kwargs.pop("min_size")
+        self.max_size = kwargs.pop("max_size") or self.min_size
+        self.max_lifetime = kwargs.pop("max_lifetime")
+        self.kwargs = kwargs
+        self.closed = True
+        self.drained = threading.Event()
+        self.conns: list = []
+
+    def open(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> None:
+        self.drained.set()
+
+    def get_stats(self) -> dict:
+        return {"pool_size": len(self.conns), "pool_available": len(self.conns)}
+
+
+def test_create_pool(credentials: FakeCredentials) -> None:
+    """
+    Test that Connector.create_pool opens pool connections through the
+    connector, caps their lifetime at the certificate's and drains the pool
+    when the instance IP changes.
+    """
+    client = FakeAlloyDBClient()
+    instance_uri = "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance"
+    with (
+        patch("google.cloud.alloydbconnector.psycopg.connect") as mock_connect,
+        patch("google.cloud.alloydbconnector.psycopg.create_pool", new=FakePsycopgPool),
+        patch.object(Connector, "metadata_exchange", return_value="sock"),
+    ):
+        mock_connect.return_value = True
+        connector = Connector(credentials)
+        connector._client = client
+        pool = connector.create_pool(
+            instance_uri, min_size=2, user="test-user", password="pw", db="test-db"
+        )
+        assert not pool.closed
+        assert pool.max_lifetime == 3600.0
+        pool.conns.append(pool.connect(**pool.kwargs))
+        assert mock_connect.call_args.kwargs["user"] == "test-user"
+        # the test certificate expires within the hour
+        assert pool.max_lifetime < 3600.0
+        stats = connector.pool_stats()[0]
+        assert stats["instance_uri"] == instance_uri
+        assert stats["size"] == 1
+        assert stats["max_size"] == 2
+        assert stats["ip_address"] == client.instance.ip_addrs["PRIVATE"]
+
+        conn_info = connector._cache[instance_uri]._current.result()
+        conn_info.ip_addrs = {**conn_info.ip_addrs, "PRIVATE": "10.0.0.99"}
+        pool.conns.append(pool.connect(**pool.kwargs))
+        assert pool.drained.wait(timeout=5)
+        assert connector.pool_stats()[0]["recycles"] == 1
+
+        connector.close()
+        assert pool.closed
+        with pytest.raises(ClosedConnectorError):
+            pool.connect(**pool.kwargs)
+
+
+def test_create_pool_unsupported_driver(credentials: FakeCredentials) -> None:
+    """
+    Test that Connector.create_pool only supports psycopg.
+    """
+    with Connector(credentials) as connector:
+        with pytest.raises(ValueError, match="does not support connection pools"):
+            connector.create_pool("instance", "pg8000")
+
+
+def test_connect_timeout_covers_connection_info(credentials: FakeCredentials) -> None:
+    """
+    Test that the connection timeout covers the wait for connection info.
+    """
+    client = FakeAlloyDBClient()
+
+    async def hang(*args: Any, **kwargs: Any) -> None:
+        await asyncio.sleep(60)
+
+    client.get_connection_info = hang  # type: ignore[method-assign]
+    with Connector(credentials, timeout=0.2) as connector:
+        connector._client = client
+        with pytest.raises(TimeoutError):
+            connector.connect(
+                "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance",
+                "pg8000",
+                user="test-user",
+                password="test-password",
+                db="test-db",
+            )
+        # a per-call timeout overrides the connector's
+        with pytest.raises(TimeoutError, match="0.1s"):
+            connector.connect(
+                "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance",
+                "pg8000",
+                user="test-user",
+                password="test-password",
+                db="test-db",
+                timeout=0.1,
+            )
+
+
+def test_metadata_exchange_timeout_closes_socket(
+    credentials: FakeCredentials,
+) -> None:
+    """
+    Test that a metadata exchange with a server that never answers times out
+    and closes its socket.
+    """
+    server = socket.create_server(("127.0.0.1", 0))
+    port = server.getsockname()[1]
+    with (
+        Connector(credentials) as connector,
+        patch("google.cloud.alloydbconnector.connector.SERVER_PROXY_PORT", port),
+    ):
+        connector._client = FakeAlloyDBClient()
+        with pytest.raises(TimeoutError):
+            connector.metadata_exchange(
+                "instance", "127.0.0.1", ssl.create_default_context(), False, 0.2
+            )
+    conn, _ = server.accept()
+    conn.settimeout(5)
+    # the client hello, then EOF once the connector closed its socket
+    while conn.recv(4096):
+        pass
+    conn.close()
+    server.close()
+
+
+async def test_close_on_cancel() -> None:
+    """
+    Test that a socket finished by an executor after its wait was cancelled
+    is closed.
+    """
+    loop = asyncio.get_running_loop()
+    sock = MagicMock()
+    release = threading.Event()
+
+    def dial() -> MagicMock:
+        release.wait(5)
+        return sock
+
+    future = loop.run_in_executor(None, dial)
+    task = asyncio.create_task(_close_on_cancel(future))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    release.set()
+    await future
+    await asyncio.sleep(0)
+    sock.close.assert_called_once()
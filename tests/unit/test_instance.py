@@ -15,7 +15,10 @@
 import asyncio
 from datetime import datetime
 from datetime import timedelta
+from datetime import timezone
+import threading
 
+from mock import patch
 from mocks import FakeAlloyDBClient
 import pytest
 
@@ -23,6 +26,7 @@ from google.cloud.alloydbconnector.connection_info import ConnectionInfo
 from google.cloud.alloydbconnector.exceptions import RefreshError
 from google.cloud.alloydbconnector.instance import RefreshAheadCache
 from google.cloud.alloydbconnector.instance import _parse_instance_uri
+from google.cloud.alloydbconnector.rate_limiter import AsyncRateLimiter
 from google.cloud.alloydbconnector.refresh_utils import _is_valid
 from google.cloud.alloydbconnector.utils import generate_keys
 
@@ -196,6 +200,103 @@ async def test_schedule_refresh_wont_replace_valid_result_with_invalid() -> None
     await cache.close()
 
 
+@pytest.mark.asyncio
+async def test_RefreshAheadCache_serves_stale_on_error() -> None:
+    """
+    Test that a failed refresh keeps serving the valid current connection
+    info and reports it as stale until a refresh succeeds.
+    """
+    keys = asyncio.create_task(generate_keys())
+    client = FakeAlloyDBClient()
+    cache = RefreshAheadCache(
+        "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance",
+        client,
+        keys,
+    )
+    conn_info = await cache.connect_info()
+    assert cache.serving_stale is False
+    # leave room for the refreshes below without waiting on the rate limiter
+    cache._refresh_rate_limiter = AsyncRateLimiter(max_capacity=5, rate=1 / 30)
+    with patch.object(
+        client, "get_connection_info", side_effect=Exception("unavailable")
+    ):
+        with pytest.raises(Exception):
+            await cache._schedule_refresh(0)
+        # stop retrying in the background
+        cache._next.cancel()
+        assert cache.serving_stale is True
+        assert await cache.connect_info() is conn_info
+        assert cache.connect_info_nowait() is conn_info
+        assert cache.stale_served == 2
+    await cache._schedule_refresh(0)
+    assert cache.serving_stale is False
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_RefreshAheadCache_stats() -> None:
+    """
+    Test that RefreshAheadCache.stats reports the outcome of the last
+    refresh and the next scheduled one.
+    """
+    keys = asyncio.create_task(generate_keys())
+    client = FakeAlloyDBClient()
+    cache = RefreshAheadCache(
+        "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance",
+        client,
+        keys,
+    )
+    stats = cache.stats()
+    assert stats["expiration"] is None
+    assert stats["last_refresh_outcome"] is None
+    conn_info = await cache.connect_info()
+    stats = cache.stats()
+    assert stats["refresh_strategy"] == "BACKGROUND"
+    assert stats["expiration"] == conn_info.expiration
+    assert stats["ip_addrs"] == conn_info.ip_addrs
+    assert stats["ssl_context_built"] is False
+    assert stats["last_refresh_outcome"] == "success"
+    assert stats["next_refresh"] < conn_info.expiration
+    assert stats["rate_limiter_tokens"] == pytest.approx(1, abs=0.01)
+    cache._refresh_rate_limiter = AsyncRateLimiter(max_capacity=5, rate=1 / 30)
+    with patch.object(
+        client, "get_connection_info", side_effect=Exception("unavailable")
+    ):
+        for _ in range(2):
+            with pytest.raises(Exception):
+                await cache._schedule_refresh(0)
+            cache._next.cancel()
+    stats = cache.stats()
+    assert stats["last_refresh_outcome"] == "failure"
+    assert stats["last_refresh_error"] == "unavailable"
+    assert stats["consecutive_failures"] == 2
+    assert stats["serving_stale"] is True
+    await cache._schedule_refresh(0)
+    assert cache.stats()["consecutive_failures"] == 0
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_RefreshAheadCache_on_change() -> None:
+    """
+    Test that a refresh after the first reports the previous and new
+    connection info.
+    """
+    changes = []
+    keys = asyncio.create_task(generate_keys())
+    cache = RefreshAheadCache(
+        "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance",
+        FakeAlloyDBClient(),
+        keys,
+        on_change=lambda *args: changes.append(args),
+    )
+    conn_info = await cache.connect_info()
+    assert changes == []
+    conn_info2 = await cache._schedule_refresh(0)
+    assert changes == [(cache._instance_uri, conn_info, conn_info2)]
+    await cache.close()
+
+
 @pytest.mark.asyncio
 async def test_schedule_refresh_expired_cert() -> None:
     """
@@ -246,3 +347,57 @@ async def test_force_refresh_cancels_pending_refresh() -> None:
     assert isinstance(await cache._current, ConnectionInfo)
     # close instance
     await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_RefreshAheadCache_connect_info_nowait() -> None:
+    """
+    Test that connect_info_nowait only returns a completed, valid refresh
+    result.
+    """
+    keys = asyncio.create_task(generate_keys())
+    client = FakeAlloyDBClient()
+    cache = RefreshAheadCache(
+        "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance",
+        client,
+        keys,
+    )
+    # the first refresh is still running
+    assert cache.connect_info_nowait() is None
+    conn_info = await cache.connect_info()
+    assert cache.connect_info_nowait() is conn_info
+    # an expired result is not returned
+    conn_info.expiration = datetime.now(timezone.utc) - timedelta(minutes=1)
+    assert cache.connect_info_nowait() is None
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_RefreshAheadCache_connect_info_nowait_threads() -> None:
+    """
+    Test that connect_info_nowait may be called from many threads at once,
+    counting every stale connection info served.
+    """
+    keys = asyncio.create_task(generate_keys())
+    client = FakeAlloyDBClient()
+    cache = RefreshAheadCache(
+        "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance",
+        client,
+        keys,
+    )
+    conn_info = await cache.connect_info()
+    cache._stale = True
+
+    def connect_many() -> None:
+        for _ in range(1000):
+            assert cache.connect_info_nowait() is conn_info
+
+    threads = [threading.Thread(target=connect_many) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert cache.stale_served == 8000
+    await cache.close()
+    # a closed cache has no connection info to hand out
+    assert cache.connect_info_nowait() is None
@@ -13,6 +13,12 @@
 # limitations under the License.
 
 import asyncio
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+from mock import patch
+import pytest
 
 from google.cloud.alloydbconnector.client import AlloyDBClient
 from google.cloud.alloydbconnector.connection_info import ConnectionInfo
@@ -60,3 +66,97 @@ async def test_LazyRefreshCache_force_refresh(fake_client: AlloyDBClient) -> Non
     assert conn_info2 != conn_info
     assert cache._cached == conn_info2
     await cache.close()
+
+
+async def test_LazyRefreshCache_connect_info_nowait(fake_client: AlloyDBClient) -> None:
+    """
+    Test that LazyRefreshCache.connect_info_nowait returns cached info only
+    while it does not need a refresh.
+    """
+    keys = asyncio.create_task(generate_keys())
+    cache = LazyRefreshCache(
+        "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance",
+        client=fake_client,
+        keys=keys,
+    )
+    assert cache.connect_info_nowait() is None
+    conn_info = await cache.connect_info()
+    assert cache.connect_info_nowait() is conn_info
+    await cache.force_refresh()
+    assert cache.connect_info_nowait() is None
+
+
+async def test_LazyRefreshCache_stats(fake_client: AlloyDBClient) -> None:
+    """
+    Test that LazyRefreshCache.stats reports the last refresh and when a
+    connection will refresh next.
+    """
+    keys = asyncio.create_task(generate_keys())
+    cache = LazyRefreshCache(
+        "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance",
+        client=fake_client,
+        keys=keys,
+    )
+    assert cache.stats()["next_refresh"] is None
+    conn_info = await cache.connect_info()
+    stats = cache.stats()
+    assert stats["refresh_strategy"] == "LAZY"
+    assert stats["expiration"] == conn_info.expiration
+    assert stats["next_refresh"] == conn_info.expiration - timedelta(minutes=4)
+    assert stats["last_refresh_outcome"] == "success"
+    assert stats["consecutive_failures"] == 0
+    assert stats["rate_limiter_tokens"] is None
+    await cache.force_refresh()
+    assert cache.stats()["next_refresh"] is None
+
+
+async def test_LazyRefreshCache_serves_stale_on_error(
+    fake_client: AlloyDBClient,
+) -> None:
+    """
+    Test that a failed refresh serves the cached connection info until it
+    expires, retrying the refresh at most every 30 seconds.
+    """
+    keys = asyncio.create_task(generate_keys())
+    cache = LazyRefreshCache(
+        "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance",
+        client=fake_client,
+        keys=keys,
+    )
+    conn_info = await cache.connect_info()
+    await cache.force_refresh()
+    with patch.object(
+        fake_client, "get_connection_info", side_effect=Exception("unavailable")
+    ) as get_connection_info:
+        assert await cache.connect_info() is conn_info
+        assert await cache.connect_info() is conn_info
+        # the second call is served without retrying the refresh
+        get_connection_info.assert_called_once()
+        assert cache.serving_stale is True
+        assert cache.stale_served == 2
+        # expired connection info is not served
+        conn_info.expiration = datetime.now(timezone.utc) - timedelta(seconds=1)
+        cache._retry_at = 0
+        with pytest.raises(Exception):
+            await cache.connect_info()
+        assert cache.serving_stale is False
+
+
+async def test_LazyRefreshCache_on_change(fake_client: AlloyDBClient) -> None:
+    """
+    Test that a refresh after the first reports the previous and new
+    connection info.
+    """
+    changes = []
+    keys = asyncio.create_task(generate_keys())
+    cache = LazyRefreshCache(
+        "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance",
+        client=fake_client,
+        keys=keys,
+        on_change=lambda *args: changes.append(args),
+    )
+    conn_info = await cache.connect_info()
+    assert changes == []
+    await cache.force_refresh()
+    conn_info2 = await cache.connect_info()
+    assert changes == [(cache._instance_uri, conn_info, conn_info2)]
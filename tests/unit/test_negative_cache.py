@@ -0,0 +1,76 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from mock import patch
+import pytest
+
+from google.api_core.exceptions import PermissionDenied
+from google.api_core.exceptions import ServiceUnavailable
+from google.cloud.alloydbconnector import IPTypes
+from google.cloud.alloydbconnector.exceptions import IPTypeNotFoundError
+from google.cloud.alloydbconnector.negative_cache import NegativeCache
+
+TEST_INSTANCE_URI = "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance"
+
+
+def test_NegativeCache_permanent_error() -> None:
+    """
+    Test that a permanent error is raised again until it expires, with the
+    time doubling on each consecutive occurrence.
+    """
+    cache = NegativeCache()
+    with patch("google.cloud.alloydbconnector.negative_cache.time") as mock_time:
+        mock_time.monotonic.return_value = 0.0
+        cache.record(TEST_INSTANCE_URI, IPTypes.PRIVATE, PermissionDenied("denied"))
+        with pytest.raises(PermissionDenied):
+            cache.check(TEST_INSTANCE_URI, IPTypes.PUBLIC)
+        mock_time.monotonic.return_value = 10.0
+        cache.check(TEST_INSTANCE_URI, IPTypes.PRIVATE)
+        cache.record(TEST_INSTANCE_URI, IPTypes.PRIVATE, PermissionDenied("denied"))
+        mock_time.monotonic.return_value = 29.0
+        with pytest.raises(PermissionDenied):
+            cache.check(TEST_INSTANCE_URI, IPTypes.PRIVATE)
+        mock_time.monotonic.return_value = 30.0
+        cache.check(TEST_INSTANCE_URI, IPTypes.PRIVATE)
+
+
+def test_NegativeCache_transient_error() -> None:
+    """
+    Test that a transient error is remembered for a shorter time.
+    """
+    cache = NegativeCache()
+    with patch("google.cloud.alloydbconnector.negative_cache.time") as mock_time:
+        mock_time.monotonic.return_value = 0.0
+        cache.record(
+            TEST_INSTANCE_URI, IPTypes.PRIVATE, ServiceUnavailable("unavailable")
+        )
+        with pytest.raises(ServiceUnavailable):
+            cache.check(TEST_INSTANCE_URI, IPTypes.PRIVATE)
+        mock_time.monotonic.return_value = 1.0
+        cache.check(TEST_INSTANCE_URI, IPTypes.PRIVATE)
+
+
+def test_NegativeCache_ip_type_error() -> None:
+    """
+    Test that a missing IP type error only applies to that IP type, and that
+    clear forgets it.
+    """
+    cache = NegativeCache()
+    cache.record(TEST_INSTANCE_URI, IPTypes.PUBLIC, IPTypeNotFoundError("no public IP"))
+    with pytest.raises(IPTypeNotFoundError):
+        cache.check(TEST_INSTANCE_URI, IPTypes.PUBLIC)
+    cache.check(TEST_INSTANCE_URI, IPTypes.PRIVATE)
+    cache.clear(TEST_INSTANCE_URI, IPTypes.PUBLIC)
+    cache.check(TEST_INSTANCE_URI, IPTypes.PUBLIC)
+    assert len(cache) == 0
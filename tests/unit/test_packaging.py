@@ -36,3 +36,27 @@ def test_namespace_package_compat(tmp_path: pathlib.PosixPath) -> None:
     env = dict(os.environ, PYTHONPATH=str(tmp_path))
     cmd = [sys.executable, "-m", "google.cloud.othermod"]
     subprocess.check_call(cmd, env=env)
+
+
+def test_import_defers_heavy_dependencies() -> None:
+    # Importing the package should not load the dependencies only needed
+    # once connection info is fetched, so cold starts stay fast.
+    code = (
+        "import sys\n"
+        "from google.cloud.alloydbconnector import AsyncConnector, Connector\n"
+        "print(' '.join(sorted(sys.modules)))\n"
+    )
+    out = subprocess.check_output([sys.executable, "-c", code], text=True)
+    modules = set(out.split())
+    for name in (
+        "google.cloud.alloydb_v1beta",
+        "google.cloud.alloydb_connectors_v1.proto.resources_pb2",
+        "google.auth.transport.requests",
+        "google.api_core.exceptions",
+        "aiofiles",
+        "aiohttp",
+        "pg8000",
+        "asyncpg",
+        "psycopg",
+    ):
+        assert name not in modules, f"{name} imported eagerly"
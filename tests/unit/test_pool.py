@@ -0,0 +1,116 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+from google.cloud.alloydbconnector.connection_info import ConnectionInfo
+from google.cloud.alloydbconnector.instance_change import InstanceChange
+from google.cloud.alloydbconnector.pool import PoolRotation
+
+TEST_INSTANCE_URI = "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance"
+
+
+def _conn_info(expiration: datetime) -> ConnectionInfo:
+    return ConnectionInfo([], "", None, {"PRIVATE": "10.0.0.1"}, expiration)  # type: ignore[arg-type]
+
+
+async def test_PoolRotation_recycles_on_ip_change() -> None:
+    """
+    Test that a connection to a new IP address recycles the pool.
+    """
+    recycled = []
+    rotation = PoolRotation(
+        TEST_INSTANCE_URI, lambda: recycled.append(True), asyncio.get_running_loop()
+    )
+    info = _conn_info(datetime.now(timezone.utc) + timedelta(hours=1))
+    rotation.observe(info, "10.0.0.1")
+    rotation.observe(info, "10.0.0.1")
+    assert recycled == []
+    rotation.observe(info, "10.0.0.2")
+    assert recycled == [True]
+    assert rotation.recycles == 1
+    assert rotation.ip_address == "10.0.0.2"
+    assert "10.0.0.2" in rotation.last_recycle_reason
+    rotation.close()
+
+
+async def test_PoolRotation_recycles_on_instance_change() -> None:
+    """
+    Test that an instance change taking away the pool's IP address recycles
+    the pool right away, and only once.
+    """
+    recycled = []
+    rotation = PoolRotation(
+        TEST_INSTANCE_URI, lambda: recycled.append(True), asyncio.get_running_loop()
+    )
+    expiration = datetime.now(timezone.utc) + timedelta(hours=1)
+    info = _conn_info(expiration)
+    rotation.observe(info, "10.0.0.1")
+    # a new certificate for the same IP address
+    rotation.instance_changed(InstanceChange(TEST_INSTANCE_URI, info, info))
+    assert recycled == []
+    failed_over = ConnectionInfo([], "", None, {"PRIVATE": "10.0.0.2"}, expiration)  # type: ignore[arg-type]
+    rotation.instance_changed(InstanceChange(TEST_INSTANCE_URI, info, failed_over))
+    assert recycled == [True]
+    assert "10.0.0.1" in rotation.last_recycle_reason
+    # the next connection to the new IP address doesn't recycle again
+    rotation.observe(failed_over, "10.0.0.2")
+    assert recycled == [True]
+    rotation.close()
+
+
+async def test_PoolRotation_schedules_recycle_before_expiry() -> None:
+    """
+    Test that recycling is scheduled ahead of the newest certificate's
+    expiry.
+    """
+    loop = asyncio.get_running_loop()
+    rotation = PoolRotation(TEST_INSTANCE_URI, lambda: None, loop)
+    rotation.observe(
+        _conn_info(datetime.now(timezone.utc) + timedelta(minutes=30)), "10.0.0.1"
+    )
+    assert rotation._timer is not None
+    delay = rotation._timer.when() - loop.time()
+    # four minutes before expiry
+    assert timedelta(minutes=25) < timedelta(seconds=delay) < timedelta(minutes=27)
+    # an older certificate does not move the timer
+    timer = rotation._timer
+    rotation.observe(
+        _conn_info(datetime.now(timezone.utc) + timedelta(minutes=10)), "10.0.0.1"
+    )
+    assert rotation._timer is timer
+    rotation.close()
+    assert rotation._timer is None
+
+
+async def test_PoolRotation_expiring_certificate_recycles_async() -> None:
+    """
+    Test that an already expiring certificate recycles right away and that
+    an awaitable recycle function is run.
+    """
+    recycled = asyncio.Event()
+
+    async def recycle() -> None:
+        recycled.set()
+
+    rotation = PoolRotation(TEST_INSTANCE_URI, recycle, asyncio.get_running_loop())
+    rotation.observe(
+        _conn_info(datetime.now(timezone.utc) + timedelta(minutes=1)), "10.0.0.1"
+    )
+    await asyncio.wait_for(recycled.wait(), timeout=1)
+    assert rotation.last_recycle_reason == "client certificate expiring"
+    rotation.close()
@@ -12,17 +12,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import errno
 import os
 import socket
+import ssl
 import sys
+import tempfile
 import threading
 import types
 from typing import Any
 
 import pytest
 
-from google.cloud.alloydbconnector.psycopg import _proxy
+from google.cloud.alloydbconnector import proxy
+from google.cloud.alloydbconnector.proxy import AsyncProxyProtocol
+from google.cloud.alloydbconnector.proxy import ProxyEngine
+from google.cloud.alloydbconnector.proxy import configure_proxy
+from google.cloud.alloydbconnector.proxy import connection_count
+from google.cloud.alloydbconnector.proxy import enable_ktls
+from google.cloud.alloydbconnector.proxy import get_engine
 from google.cloud.alloydbconnector.psycopg import connect
+from google.cloud.alloydbconnector.psycopg import connect_async
+from google.cloud.alloydbconnector.psycopg import create_async_pool
+from google.cloud.alloydbconnector.psycopg import create_pool
 
 pytestmark = pytest.mark.skipif(
     not hasattr(socket, "AF_UNIX"),
@@ -106,55 +119,51 @@ def _make_fake_psycopg_module(captured: dict) -> types.ModuleType:
 
 
 def test_proxy_forwards_local_to_remote() -> None:
-    """_proxy() forwards bytes written to the local socket to the remote."""
+    """ProxyEngine forwards bytes written to the local socket to the remote."""
     local_a, local_b = _socketpair()
     remote_a, remote_b = _socketpair()
 
     remote_a.settimeout(2.0)
-    t = threading.Thread(target=_proxy, args=(local_b, remote_b), daemon=True)
-    t.start()
+    engine = ProxyEngine()
+    engine.proxy(local_b, remote_b)
 
     local_a.sendall(b"hello")
     received = remote_a.recv(5)
 
-    # Trigger EOF so the proxy thread exits.
-    local_a.shutdown(socket.SHUT_RDWR)
     local_a.close()
     remote_a.close()
-    t.join(timeout=2)
+    engine.retire()
 
     assert received == b"hello"
 
 
 def test_proxy_forwards_remote_to_local() -> None:
-    """_proxy() forwards bytes written to the remote socket to the local."""
+    """ProxyEngine forwards bytes written to the remote socket to the local."""
     local_a, local_b = _socketpair()
     remote_a, remote_b = _socketpair()
 
     local_a.settimeout(2.0)
-    t = threading.Thread(target=_proxy, args=(local_b, remote_b), daemon=True)
-    t.start()
+    engine = ProxyEngine()
+    engine.proxy(local_b, remote_b)
 
     remote_a.sendall(b"world")
     received = local_a.recv(5)
 
-    # Trigger EOF so the proxy thread exits.
-    local_a.shutdown(socket.SHUT_RDWR)
     local_a.close()
     remote_a.close()
-    t.join(timeout=2)
+    engine.retire()
 
     assert received == b"world"
 
 
 def test_proxy_eof_on_local_closes_remote() -> None:
-    """EOF on the local side causes _proxy() to close the remote socket."""
+    """EOF on the local side causes ProxyEngine to close the remote socket."""
     local_a, local_b = _socketpair()
     remote_a, remote_b = _socketpair()
 
     remote_a.settimeout(2.0)
-    t = threading.Thread(target=_proxy, args=(local_b, remote_b), daemon=True)
-    t.start()
+    engine = ProxyEngine()
+    engine.proxy(local_b, remote_b)
 
     # Signal EOF from the local driver side.
     local_a.shutdown(socket.SHUT_RDWR)
@@ -163,10 +172,231 @@ def test_proxy_eof_on_local_closes_remote() -> None:
     # remote_a should receive EOF once remote_b is shut down by the proxy.
     eof = remote_a.recv(1)
     remote_a.close()
-    t.join(timeout=2)
+    engine.retire()
+    assert engine._thread is not None
+    engine._thread.join(timeout=2)
 
     assert eof == b""
-    assert not t.is_alive()
+    assert engine.connection_count == 0
+    assert not engine._thread.is_alive()
+
+
+def test_proxy_forwards_large_payload_both_ways() -> None:
+    """ProxyEngine handles partial writes when a payload exceeds the socket
+    buffers, in both directions at once."""
+    local_a, local_b = _socketpair()
+    remote_a, remote_b = _socketpair()
+    payload = os.urandom(4 * 1024 * 1024)
+
+    engine = ProxyEngine(buffer_size=16 * 1024)
+    engine.proxy(local_b, remote_b)
+
+    def read_all(sock: socket.socket, out: list) -> None:
+        sock.settimeout(5.0)
+        chunks = []
+        remaining = len(payload)
+        while remaining:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        out.append(b"".join(chunks))
+
+    upstream: list = []
+    downstream: list = []
+    readers = [
+        threading.Thread(target=read_all, args=(remote_a, upstream)),
+        threading.Thread(target=read_all, args=(local_a, downstream)),
+    ]
+    for t in readers:
+        t.start()
+    writers = [
+        threading.Thread(target=local_a.sendall, args=(payload,)),
+        threading.Thread(target=remote_a.sendall, args=(payload,)),
+    ]
+    for t in writers:
+        t.start()
+    for t in writers + readers:
+        t.join(timeout=10)
+
+    local_a.close()
+    remote_a.close()
+    engine.retire()
+
+    assert upstream == [payload]
+    assert downstream == [payload]
+
+
+def test_connection_count_per_ip_address() -> None:
+    """connection_count counts open proxied connections per remote IP."""
+    listener = socket.create_server(("127.0.0.1", 0))
+    remote_a = socket.create_connection(listener.getsockname())
+    remote_b, _ = listener.accept()
+    listener.close()
+    local_a, local_b = _socketpair()
+    engine = ProxyEngine()
+    conn = engine.proxy(local_b, remote_a)
+    assert conn.peer == "127.0.0.1"
+    # the connection is added on the engine thread
+    remote_b.sendall(b"x")
+    assert local_a.recv(1) == b"x"
+    assert connection_count("127.0.0.1") == 1
+    assert connection_count("10.0.0.1") == 0
+    conn.close()
+    engine.retire()
+    assert engine._thread is not None
+    engine._thread.join(timeout=2)
+    assert connection_count("127.0.0.1") == 0
+    for sock in (local_a, remote_b):
+        sock.close()
+
+
+def test_proxy_multiplexes_connections_on_one_thread() -> None:
+    """Many connections share a single ProxyEngine thread."""
+    before = set(threading.enumerate())
+    engine = ProxyEngine()
+    pairs = []
+    for i in range(50):
+        local_a, local_b = _socketpair()
+        remote_a, remote_b = _socketpair()
+        engine.proxy(local_b, remote_b)
+        pairs.append((local_a, remote_a))
+    for i, (local_a, remote_a) in enumerate(pairs):
+        remote_a.settimeout(2.0)
+        local_a.sendall(f"ping-{i:02d}".encode())
+        assert remote_a.recv(7) == f"ping-{i:02d}".encode()
+    # threads of engines retired by earlier tests may still be exiting, so
+    # only look at threads started since
+    assert engine._thread is not None and engine._thread.is_alive()
+    assert set(threading.enumerate()) - before == {engine._thread}
+    assert engine.connection_count == 50
+    for local_a, remote_a in pairs:
+        local_a.close()
+        remote_a.close()
+    engine.retire()
+
+
+def test_proxy_connection_close() -> None:
+    """ProxyConnection.close closes both sockets from the engine thread."""
+    local_a, local_b = _socketpair()
+    remote_a, remote_b = _socketpair()
+    remote_a.settimeout(2.0)
+    local_a.settimeout(2.0)
+    engine = ProxyEngine()
+    conn = engine.proxy(local_b, remote_b)
+    conn.close()
+    assert remote_a.recv(1) == b""
+    assert local_a.recv(1) == b""
+    assert conn.closed
+    local_a.close()
+    remote_a.close()
+    engine.retire()
+
+
+def test_proxy_retired_engine_rejects_calls() -> None:
+    """A stopped engine raises instead of silently dropping new connections."""
+    engine = ProxyEngine()
+    local_a, local_b = _socketpair()
+    remote_a, remote_b = _socketpair()
+    conn = engine.proxy(local_b, remote_b)
+    local_a.close()
+    remote_a.close()
+    engine.retire()
+    assert engine._thread is not None
+    engine._thread.join(timeout=2)
+    assert engine.stopped
+    with pytest.raises(RuntimeError, match="retired"):
+        engine.proxy(*_socketpair())
+    # closing a connection of a stopped engine is a no-op
+    conn.close()
+
+
+def test_proxy_retire_unstarted_engine_releases_fds() -> None:
+    """Retiring an engine that never started closes its selector and wakeup
+    sockets."""
+    engine = ProxyEngine()
+    engine.retire()
+    assert engine.stopped
+    assert engine._thread is None
+    assert engine._wakeup_r.fileno() == -1
+    assert engine._wakeup_w.fileno() == -1
+    with pytest.raises(RuntimeError):
+        engine.proxy(*_socketpair())
+
+
+@pytest.fixture
+def reset_proxy() -> Any:
+    """Restores the default shared proxy configuration after a test."""
+    yield
+    configure_proxy()
+
+
+@pytest.mark.usefixtures("reset_proxy")
+def test_configure_proxy_round_robin() -> None:
+    """get_engine() spreads connections across the configured engines."""
+    configure_proxy(engines=3, buffer_size=8 * 1024)
+    engines = [get_engine() for _ in range(6)]
+    assert len({id(e) for e in engines}) == 3
+    assert engines[:3] == engines[3:]
+    assert all(len(e._buffer) == 8 * 1024 for e in engines)
+
+
+@pytest.mark.usefixtures("reset_proxy")
+def test_configure_proxy_keeps_existing_connections() -> None:
+    """Reconfiguring retires the old engines only once their connections
+    have closed."""
+    configure_proxy(engines=1)
+    old = get_engine()
+    local_a, local_b = _socketpair()
+    remote_a, remote_b = _socketpair()
+    local_a.settimeout(2.0)
+    remote_a.settimeout(2.0)
+    old.proxy(local_b, remote_b)
+    local_a.sendall(b"before")
+    assert remote_a.recv(6) == b"before"
+    assert connection_count() == 1
+
+    configure_proxy(engines=2)
+    assert get_engine() is not old
+    # the old engine is no longer counted but still forwards bytes
+    assert connection_count() == 0
+    remote_a.sendall(b"after")
+    assert local_a.recv(5) == b"after"
+    assert not old.stopped
+
+    local_a.close()
+    remote_a.close()
+    assert old._thread is not None
+    old._thread.join(timeout=2)
+    assert old.stopped
+
+
+def test_configure_proxy_rejects_bad_values() -> None:
+    """configure_proxy() validates its arguments."""
+    with pytest.raises(ValueError, match="engines"):
+        configure_proxy(engines=0)
+    with pytest.raises(ValueError, match="buffer_size"):
+        configure_proxy(buffer_size=0)
+
+
+@pytest.mark.usefixtures("reset_proxy")
+def test_accept_and_proxy_skips_retired_engine(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """accept_and_proxy() moves on when its engine is retired under it."""
+    retired = ProxyEngine()
+    retired.retire()
+    live = ProxyEngine()
+    picks = iter([retired, live])
+    monkeypatch.setattr(proxy, "get_engine", lambda: next(picks))
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    remote_a, remote_b = _socketpair()
+    conn = proxy.accept_and_proxy(listener, remote_b)
+    assert conn._engine is live
+    conn.close()
+    remote_a.close()
+    live.retire()
 
 
 def test_connect_strips_caller_sslmode(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -202,6 +432,23 @@ def test_connect_passes_extra_kwargs(monkeypatch: pytest.MonkeyPatch) -> None:
     assert captured["application_name"] == "myapp"
 
 
+def test_connect_timeout_becomes_connect_timeout(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """connect() passes the time left for the attempt on as connect_timeout,
+    rounded up to whole seconds."""
+    captured: dict = {}
+    mod = _make_fake_psycopg_module(captured)
+    monkeypatch.setitem(sys.modules, "psycopg", mod)
+
+    ssl_a, ssl_b = _socketpair()
+    connect(ssl_a, user="u", db="d", timeout=2.2)  # type: ignore[arg-type]
+    ssl_b.close()
+
+    assert captured["connect_timeout"] == 3
+    assert "timeout" not in captured
+
+
 def test_connect_cleanup_on_success(monkeypatch: pytest.MonkeyPatch) -> None:
     """connect() removes the Unix socket file and tmpdir after a successful connect."""
     captured: dict = {}
@@ -221,9 +468,8 @@ def test_connect_cleanup_on_success(monkeypatch: pytest.MonkeyPatch) -> None:
 def test_no_thread_leak(monkeypatch: pytest.MonkeyPatch) -> None:
     """Opening and closing N connections must not permanently increase thread count.
 
-    The fake psycopg actually connects to the Unix socket so _accept_and_proxy
-    can proceed and both proxy threads wind down naturally when the client
-    closes its end.
+    The fake psycopg actually connects to the Unix socket so the proxy engine
+    can accept and then close the connection when the client closes its end.
     """
     import time
 
@@ -233,9 +479,8 @@ def test_no_thread_leak(monkeypatch: pytest.MonkeyPatch) -> None:
     for _ in range(N):
 
         def fake_connect(**kw: Any) -> object:
-            # Connect to the Unix socket so _accept_and_proxy can accept(), then
-            # close immediately to send EOF through the proxy, letting both proxy
-            # threads unwind.
+            # Connect to the Unix socket so the proxy engine can accept(),
+            # then close immediately to send EOF through the proxy.
             path = os.path.join(kw["host"], f".s.PGSQL.{kw['port']}")
             c = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             c.connect(path)
@@ -250,7 +495,7 @@ def test_no_thread_leak(monkeypatch: pytest.MonkeyPatch) -> None:
         connect(ssl_a, user="u", db="d")  # type: ignore[arg-type]
         ssl_b.close()
 
-    # Give daemon threads a moment to observe EOF and exit.
+    # Give the proxy engine a moment to observe EOF.
     time.sleep(0.2)
     assert threading.active_count() <= baseline + 2
 
@@ -279,3 +524,339 @@ def test_connect_cleanup_on_failure(monkeypatch: pytest.MonkeyPatch) -> None:
     socket_path = os.path.join(tmpdir, ".s.PGSQL.5432")
     assert not os.path.exists(socket_path)
     assert not os.path.exists(tmpdir)
+
+
+@pytest.mark.skipif(not hasattr(os, "splice"), reason="os.splice requires Linux")
+def test_proxy_splice_forwarding(monkeypatch: pytest.MonkeyPatch) -> None:
+    """ProxyEngine moves bytes with splice() when the kernel handles TLS."""
+    monkeypatch.setattr(proxy, "_ktls_offload", lambda sock: (True, True))
+    local_a, local_b = _socketpair()
+    remote_a, remote_b = _socketpair()
+    local_a.settimeout(2.0)
+    remote_a.settimeout(2.0)
+    engine = ProxyEngine()
+    conn = engine.proxy(local_b, remote_b)
+
+    local_a.sendall(b"hello")
+    assert remote_a.recv(5) == b"hello"
+    remote_a.sendall(b"world")
+    assert local_a.recv(5) == b"world"
+    assert all(pipe.kpipe is not None for pipe in conn.pipes)
+
+    local_a.close()
+    assert remote_a.recv(1) == b""
+    remote_a.close()
+    assert conn.closed
+    assert all(pipe.kpipe is None for pipe in conn.pipes)
+    engine.retire()
+
+
+def _send_in_background(sock: socket.socket, data: bytes) -> threading.Thread:
+    t = threading.Thread(target=sock.sendall, args=(data,))
+    t.start()
+    return t
+
+
+def _recv_exactly(sock: socket.socket, n: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(min(n - len(buf), 65536))
+        if not chunk:
+            break
+        buf += chunk
+    return bytes(buf)
+
+
+@pytest.mark.skipif(not hasattr(os, "splice"), reason="os.splice requires Linux")
+def test_proxy_splice_burst_larger_than_one_event(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A burst longer than _MAX_READS_PER_EVENT buffers is fully delivered,
+    including the bytes left in the kernel pipe when the engine yields."""
+    monkeypatch.setattr(proxy, "_ktls_offload", lambda sock: (True, True))
+    buffer_size = 16 * 1024
+    payload = os.urandom(buffer_size * proxy._MAX_READS_PER_EVENT * 4)
+    local_a, local_b = _socketpair()
+    remote_a, remote_b = _socketpair()
+    local_a.settimeout(5.0)
+    engine = ProxyEngine(buffer_size)
+    engine.proxy(local_b, remote_b)
+    writer = _send_in_background(remote_a, payload)
+    assert _recv_exactly(local_a, len(payload)) == payload
+    writer.join(timeout=5)
+    local_a.close()
+    remote_a.close()
+    engine.retire()
+
+
+@pytest.mark.skipif(not hasattr(os, "splice"), reason="os.splice requires Linux")
+def test_proxy_splice_flushes_kernel_pipe_on_yield(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Bytes spliced on the last read before yielding are sent even when no
+    more data arrives on the source."""
+    monkeypatch.setattr(proxy, "_ktls_offload", lambda sock: (True, True))
+    # yield after every read, so the final read of a burst always ends the
+    # event with bytes still in the kernel pipe
+    monkeypatch.setattr(proxy, "_MAX_READS_PER_EVENT", 1)
+    local_a, local_b = _socketpair()
+    remote_a, remote_b = _socketpair()
+    local_a.settimeout(2.0)
+    engine = ProxyEngine()
+    engine.proxy(local_b, remote_b)
+    remote_a.sendall(b"last chunk")
+    assert _recv_exactly(local_a, 10) == b"last chunk"
+    local_a.close()
+    remote_a.close()
+    engine.retire()
+
+
+@pytest.mark.skipif(not hasattr(os, "splice"), reason="os.splice requires Linux")
+def test_proxy_splice_falls_back_to_recv(monkeypatch: pytest.MonkeyPatch) -> None:
+    """When splice() refuses a kTLS socket mid-stream, the pipe falls back to
+    recv() without losing bytes."""
+    monkeypatch.setattr(proxy, "_ktls_offload", lambda sock: (True, True))
+    real_splice = os.splice
+    calls = {"n": 0}
+    local_a, local_b = _socketpair()
+    remote_a, remote_b = _socketpair()
+
+    def flaky_splice(src: int, dst: int, count: int, **kwargs: Any) -> int:
+        if src == remote_b.fileno():
+            calls["n"] += 1
+            if calls["n"] == 3:
+                raise OSError(errno.EINVAL, "Invalid argument")
+        return real_splice(src, dst, count, **kwargs)
+
+    monkeypatch.setattr(os, "splice", flaky_splice)
+    buffer_size = 8 * 1024
+    payload = os.urandom(buffer_size * 64)
+    local_a.settimeout(5.0)
+    engine = ProxyEngine(buffer_size)
+    conn = engine.proxy(local_b, remote_b)
+    writer = _send_in_background(remote_a, payload)
+    assert _recv_exactly(local_a, len(payload)) == payload
+    writer.join(timeout=5)
+    assert calls["n"] >= 3
+    # downstream now uses recv(); upstream still splices
+    assert conn.pipes[1].kpipe is None
+    assert conn.pipes[0].kpipe is not None
+    local_a.close()
+    remote_a.close()
+    engine.retire()
+
+
+@pytest.mark.skipif(not hasattr(os, "splice"), reason="os.splice requires Linux")
+def test_proxy_no_rx_splice_with_pending_bytes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Received bytes already decrypted by OpenSSL keep the downstream pipe on
+    recv() so they are not skipped."""
+    monkeypatch.setattr(proxy, "_ktls_offload", lambda sock: (True, True))
+    local_a, local_b = _socketpair()
+    remote_a, remote_b = _socketpair()
+    # only report pending bytes while the connection is being started
+    pending = {"n": 1}
+    monkeypatch.setattr(
+        proxy, "_pending", lambda sock: pending["n"] if sock is remote_b else 0
+    )
+    local_a.settimeout(2.0)
+    engine = ProxyEngine()
+    conn = engine.proxy(local_b, remote_b)
+    remote_a.sendall(b"hello")
+    assert local_a.recv(5) == b"hello"
+    pending["n"] = 0
+    assert conn.pipes[0].kpipe is not None
+    assert conn.pipes[1].kpipe is None
+    local_a.close()
+    remote_a.close()
+    engine.retire()
+
+
+def test_proxy_engine_survives_start_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """An error while starting one accepted connection closes only that
+    connection."""
+    monkeypatch.setattr(proxy, "_ktls_offload", lambda sock: (True, True))
+    real_pipe2 = os.pipe2
+    fail = {"on": True}
+
+    def failing_pipe2(flags: int) -> tuple[int, int]:
+        if fail["on"]:
+            raise OSError(errno.EMFILE, "Too many open files")
+        return real_pipe2(flags)
+
+    monkeypatch.setattr(os, "pipe2", failing_pipe2)
+    engine = ProxyEngine()
+    tmpdir = tempfile.mkdtemp()
+    path = os.path.join(tmpdir, "sock")
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(path)
+    listener.listen(1)
+    remote_a, remote_b = _socketpair()
+    remote_a.settimeout(2.0)
+    conn = engine.accept_and_proxy(listener, remote_b)
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.connect(path)
+    # the failed connection is closed
+    assert remote_a.recv(1) == b""
+    assert conn.closed
+    os.remove(path)
+    os.rmdir(tmpdir)
+    client.close()
+    remote_a.close()
+    # the engine thread keeps serving other connections
+    fail["on"] = False
+    local_a, local_b = _socketpair()
+    remote_a, remote_b = _socketpair()
+    remote_a.settimeout(2.0)
+    engine.proxy(local_b, remote_b)
+    local_a.sendall(b"alive")
+    assert remote_a.recv(5) == b"alive"
+    local_a.close()
+    remote_a.close()
+    engine.retire()
+
+
+def test_ktls_offload_plain_socket() -> None:
+    """Sockets without kernel TLS are not spliced."""
+    a, b = _socketpair()
+    assert proxy._ktls_offload(a) == (False, False)
+    a.close()
+    b.close()
+
+
+def test_enable_ktls() -> None:
+    """enable_ktls sets OP_ENABLE_KTLS when the ssl module supports it."""
+    ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    supported = enable_ktls(ctx)
+    assert supported == hasattr(ssl, "OP_ENABLE_KTLS")
+    if supported:
+        assert ctx.options & ssl.OP_ENABLE_KTLS
+
+
+def _fake_async_psycopg_module(connect: Any) -> types.ModuleType:
+    """Return a fake psycopg module whose AsyncConnection.connect is ``connect``."""
+    mod = types.ModuleType("psycopg")
+    mod.AsyncConnection = types.SimpleNamespace(connect=connect)  # type: ignore[attr-defined]
+    return mod
+
+
+async def test_connect_async_forwards_both_ways(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """connect_async() proxies the driver's Unix socket over asyncio transports."""
+    loop = asyncio.get_running_loop()
+    remote_sock, server = _socketpair()
+    server.setblocking(False)
+    _, remote = await loop.create_connection(AsyncProxyProtocol, sock=remote_sock)
+    captured: dict = {}
+
+    async def fake_connect(**kwargs: Any) -> tuple:
+        captured.update(kwargs)
+        path = os.path.join(kwargs["host"], ".s.PGSQL.5432")
+        reader, writer = await asyncio.open_unix_connection(path)
+        # like psycopg's handshake, wait for the server to respond
+        captured["early"] = await reader.readexactly(5)
+        return reader, writer
+
+    monkeypatch.setitem(
+        sys.modules, "psycopg", _fake_async_psycopg_module(fake_connect)
+    )
+    # bytes sent by the server before psycopg connects are not lost
+    await loop.sock_sendall(server, b"early")
+    await asyncio.sleep(0.05)
+    reader, writer = await connect_async(remote, user="u", db="d", password="p")
+    assert captured["sslmode"] == "disable"
+    assert captured["dbname"] == "d"
+    assert not os.path.exists(captured["host"])
+
+    assert captured["early"] == b"early"
+    payload = os.urandom(1024 * 1024)
+    writer.write(payload)
+    received = bytearray()
+    while len(received) < len(payload):
+        received += await loop.sock_recv(server, 65536)
+    assert received == payload
+    # the driver reads concurrently as backpressure reaches the server
+    _, echoed = await asyncio.gather(
+        loop.sock_sendall(server, payload), reader.readexactly(len(payload))
+    )
+    assert echoed == payload
+
+    # closing the driver side closes the remote
+    writer.close()
+    assert await loop.sock_recv(server, 1) == b""
+    server.close()
+
+
+async def test_connect_async_closes_remote_on_failure(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """connect_async() closes the remote connection when psycopg raises."""
+    loop = asyncio.get_running_loop()
+    remote_sock, server = _socketpair()
+    server.setblocking(False)
+    _, remote = await loop.create_connection(AsyncProxyProtocol, sock=remote_sock)
+
+    async def failing_connect(**kwargs: Any) -> None:
+        raise RuntimeError("db unavailable")
+
+    monkeypatch.setitem(
+        sys.modules, "psycopg", _fake_async_psycopg_module(failing_connect)
+    )
+    with pytest.raises(RuntimeError, match="db unavailable"):
+        await connect_async(remote, user="u", db="d")
+    assert await loop.sock_recv(server, 1) == b""
+    server.close()
+
+
+def test_create_pool_routes_connections() -> None:
+    """
+    Test that create_pool splits pool and connection arguments and opens the
+    pool's connections with the given function.
+    """
+    pytest.importorskip("psycopg_pool")
+    calls = []
+
+    def fake_connect(**kwargs: Any) -> str:
+        calls.append(kwargs)
+        return "conn"
+
+    pool = create_pool(
+        fake_connect,
+        min_size=10,
+        max_idle=60.0,
+        user="test-user",
+        db="test-db",
+        kwargs={"application_name": "app"},
+    )
+    assert pool.closed
+    assert pool.min_size == 10
+    assert pool.max_idle == 60.0
+    # prefill is spread over more workers than the psycopg_pool default
+    assert pool.num_workers == 8
+    assert pool.kwargs == {
+        "application_name": "app",
+        "user": "test-user",
+        "db": "test-db",
+    }
+    assert pool.connection_class.connect("", **pool.kwargs) == "conn"
+    assert calls == [pool.kwargs]
+
+
+async def test_create_async_pool_routes_connections() -> None:
+    """
+    Test that create_async_pool opens the pool's connections with the given
+    coroutine function.
+    """
+    pytest.importorskip("psycopg_pool")
+
+    async def fake_connect(**kwargs: Any) -> dict:
+        return kwargs
+
+    pool = create_async_pool(fake_connect, min_size=2, user="test-user", db="db")
+    assert pool.closed
+    assert pool.num_workers == 3
+    assert pool.kwargs == {"user": "test-user", "db": "db"}
+    conn = await pool.connection_class.connect("", **pool.kwargs)
+    assert conn == {"user": "test-user", "db": "db"}
@@ -15,9 +15,12 @@
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
+import ssl
 
 import pytest
 
+from google.cloud.alloydbconnector.exceptions import MetadataExchangeError
+from google.cloud.alloydbconnector.refresh_utils import _refresh_may_help
 from google.cloud.alloydbconnector.refresh_utils import _seconds_until_refresh
 
 
@@ -60,3 +63,35 @@ def test_seconds_until_refresh_under_4_mins() -> None:
     assert (
         _seconds_until_refresh(datetime.now(timezone.utc) + timedelta(minutes=3)) == 0
     )
+
+
+class DriverError(Exception):
+    pass
+
+
+def _wrapped(e: BaseException) -> DriverError:
+    try:
+        raise DriverError("network error") from e
+    except DriverError as wrapped:
+        return wrapped
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (ConnectionRefusedError(), True),
+        (TimeoutError(), True),
+        (ssl.SSLError(), True),
+        (_wrapped(ConnectionResetError()), True),
+        (RuntimeError("Connection closed while performing metadata exchange!"), True),
+        (MetadataExchangeError("Metadata Exchange request has failed"), False),
+        (DriverError("password authentication failed"), False),
+        (DriverError("sorry, too many clients already"), False),
+    ],
+)
+def test_refresh_may_help(error: BaseException, expected: bool) -> None:
+    """
+    Test that only failures a new certificate or IP address could fix force
+    a refresh.
+    """
+    assert _refresh_may_help(error) is expected
@@ -12,13 +12,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+import json
+import os
+from pathlib import Path
+
 from mocks import FakeInstance
 from mocks import write_static_info
+import pytest
 
+from google.cloud.alloydbconnector import static
 from google.cloud.alloydbconnector.connection_info import ConnectionInfo
+from google.cloud.alloydbconnector.static import StaticConnectionInfo
 from google.cloud.alloydbconnector.static import StaticConnectionInfoCache
 
 
+def _two_instances() -> tuple[FakeInstance, FakeInstance, dict]:
+    """Returns two instances and the static connection info of both."""
+    i, j = FakeInstance(), FakeInstance(name="other-instance")
+    info = json.loads(write_static_info(i).getvalue())
+    info[j.uri()] = json.loads(write_static_info(j).getvalue())[j.uri()]
+    return i, j, info
+
+
 def test_StaticConnectionInfoCache_init() -> None:
     """
     Test that StaticConnectionInfoCache.__init__ populates its ConnectionInfo
@@ -99,3 +115,50 @@ async def test_StaticConnectionInfoCache_close() -> None:
     await cache.close()
     conn_info2 = cache._info
     assert conn_info2 == conn_info
+
+
+def test_StaticConnectionInfo_multiple_instances() -> None:
+    """
+    Test that StaticConnectionInfo parses a stream once for all of its
+    instances, loading the private key once.
+    """
+    i, j, info = _two_instances()
+    static_info = StaticConnectionInfo(io.StringIO(json.dumps(info)))
+    first = StaticConnectionInfoCache(i.uri(), static_info)
+    second = StaticConnectionInfoCache(j.uri(), static_info)
+    assert first._info.ip_addrs["PRIVATE"] == i.ip_addrs["PRIVATE"]
+    assert second._info.ip_addrs["PRIVATE"] == j.ip_addrs["PRIVATE"]
+    assert first._info.key is second._info.key
+    with pytest.raises(KeyError):
+        StaticConnectionInfoCache(
+            "projects/p/locations/r/clusters/c/instances/x", static_info
+        )
+
+
+def test_StaticConnectionInfo_reloads_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that StaticConnectionInfo reloads a file when its modification time
+    changes, and keeps the previous connection info if it can't be parsed.
+    """
+    monkeypatch.setattr(static, "_RELOAD_CHECK_INTERVAL", 0.0)
+    i, _, info = _two_instances()
+    path = tmp_path / "static.json"
+    path.write_text(json.dumps(info))
+    cache = StaticConnectionInfoCache(i.uri(), str(path))
+    before = cache._info
+    # unchanged files are not reloaded
+    assert cache._info is before
+
+    info[i.uri()]["ipAddress"] = "10.0.0.99"
+    path.write_text(json.dumps(info))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache._info is not before
+    assert cache._info.ip_addrs["PRIVATE"] == "10.0.0.99"
+
+    reloaded = cache._info
+    path.write_text("{")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+    assert cache._info is reloaded
@@ -0,0 +1,217 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+import struct
+import threading
+import time
+from typing import Any
+from typing import Callable
+
+from mocks import FakeCredentials
+import pytest
+
+import google.cloud.alloydb_connectors_v1.proto.resources_pb2 as connectorspb
+from google.cloud.alloydbconnector.auth_transport import sync_request
+from google.cloud.alloydbconnector.exceptions import ClosedConnectorError
+from google.cloud.alloydbconnector.token_manager import TokenManager
+
+
+class SlowFakeCredentials(FakeCredentials):
+    """FakeCredentials that count refreshes and take time to refresh."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.refresh_count = 0
+        self._count_lock = threading.Lock()
+
+    def refresh(self, request: Callable) -> None:
+        with self._count_lock:
+            self.refresh_count += 1
+        time.sleep(0.1)
+        self.token = f"token-{self.refresh_count}"
+        self.expiry = datetime.now(timezone.utc) + timedelta(minutes=60)
+
+
+def test_TokenManager_token_refreshes_invalid_token() -> None:
+    """
+    Test that TokenManager.token blocks on a refresh when there is no token.
+    """
+    credentials = SlowFakeCredentials()
+    manager = TokenManager(credentials)
+    assert manager.token() == "token-1"
+    # a fresh token is returned without another refresh
+    assert manager.token() == "token-1"
+    assert credentials.refresh_count == 1
+    manager.close()
+
+
+def test_TokenManager_coalesces_concurrent_refreshes() -> None:
+    """
+    Test that concurrent callers share a single in-flight refresh.
+    """
+    credentials = SlowFakeCredentials()
+    manager = TokenManager(credentials)
+    tokens: list[str] = []
+    threads = [
+        threading.Thread(target=lambda: tokens.append(manager.token()))
+        for _ in range(10)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert tokens == ["token-1"] * 10
+    assert credentials.refresh_count == 1
+    manager.close()
+
+
+def test_TokenManager_stale_token_refreshes_in_background() -> None:
+    """
+    Test that a stale token is returned immediately while a refresh runs in
+    the background.
+    """
+    credentials = SlowFakeCredentials()
+    credentials.token = "stale-token"
+    credentials.expiry = datetime.now(timezone.utc) + timedelta(minutes=1)
+    manager = TokenManager(credentials)
+    assert manager.token() == "stale-token"
+    manager.refresh().result()
+    assert manager.token() == "token-1"
+    assert credentials.refresh_count == 1
+    manager.close()
+
+
+async def test_TokenManager_token_async() -> None:
+    """
+    Test that TokenManager.token_async awaits a refresh of an invalid token.
+    """
+    credentials = SlowFakeCredentials()
+    manager = TokenManager(credentials)
+    tokens = await asyncio.gather(*[manager.token_async() for _ in range(5)])
+    assert tokens == ["token-1"] * 5
+    assert credentials.refresh_count == 1
+    manager.close()
+
+
+async def test_TokenManager_schedules_proactive_refresh() -> None:
+    """
+    Test that a successful refresh schedules the next one ahead of expiry.
+    """
+    credentials = SlowFakeCredentials()
+    manager = TokenManager(credentials)
+    manager.start(asyncio.get_running_loop())
+    await manager.token_async()
+    # allow the scheduling callback to run on the loop
+    await asyncio.sleep(0.1)
+    assert manager._timer is not None
+    # the refresh is due roughly five minutes before the token expires
+    delay = manager._timer.when() - asyncio.get_running_loop().time()
+    assert timedelta(minutes=54) < timedelta(seconds=delay) < timedelta(minutes=56)
+    manager.close()
+    await asyncio.sleep(0)
+    assert manager._timer is None
+
+
+def test_TokenManager_metadata_exchange_request() -> None:
+    """
+    Test that the serialized metadata exchange request is cached per token.
+    """
+    credentials = FakeCredentials()
+    manager = TokenManager(credentials)
+    auth_type = connectorspb.MetadataExchangeRequest.AUTO_IAM
+    payload = manager.metadata_exchange_request("test-agent", auth_type)
+    (message_len,) = struct.unpack(">I", payload[:4])
+    assert message_len == len(payload) - 4
+    req = connectorspb.MetadataExchangeRequest()
+    req.ParseFromString(payload[4:])
+    assert req.user_agent == "test-agent"
+    assert req.auth_type == auth_type
+    assert req.oauth2_token == credentials.token
+    # same token returns the cached bytes
+    assert manager.metadata_exchange_request("test-agent", auth_type) is payload
+    # a new token invalidates the cached bytes
+    credentials.token = "new-token"
+    new_payload = manager.metadata_exchange_request("test-agent", auth_type)
+    assert new_payload is not payload
+    req.ParseFromString(new_payload[4:])
+    assert req.oauth2_token == "new-token"
+    manager.close()
+
+
+async def test_TokenManager_refresh_after_close() -> None:
+    """
+    Test that a closed TokenManager raises instead of submitting a refresh,
+    and that an already queued scheduled refresh is a no-op.
+    """
+    credentials = SlowFakeCredentials()
+    manager = TokenManager(credentials)
+    manager.start(asyncio.get_running_loop())
+    manager.close()
+    with pytest.raises(ClosedConnectorError):
+        manager.token()
+    # a timer that fired before its cancellation reached the loop
+    manager._scheduled_refresh()
+    assert credentials.refresh_count == 0
+
+
+class AsyncFakeCredentials(FakeCredentials):
+    """FakeCredentials refreshed with a coroutine, recording the request
+    and thread of each refresh."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.requests: list[Any] = []
+        self.threads: list[threading.Thread] = []
+
+    async def refresh(self, request: Callable) -> None:  # type: ignore[override]
+        self.requests.append(request)
+        self.threads.append(threading.current_thread())
+        self.token = f"token-{len(self.requests)}"
+        self.expiry = datetime.now(timezone.utc) + timedelta(minutes=60)
+
+
+async def test_TokenManager_refreshes_async_credentials_on_loop() -> None:
+    """
+    Test that async credentials are refreshed on the event loop with an
+    aiohttp session that is reused across refreshes and closed with the
+    manager.
+    """
+    credentials = AsyncFakeCredentials()
+    manager = TokenManager(credentials)  # type: ignore[arg-type]
+    assert await manager.token_async() == "token-1"
+    credentials.token = None
+    assert await manager.token_async() == "token-2"
+    assert credentials.threads == [threading.current_thread()] * 2
+    assert credentials.requests[0] is credentials.requests[1]
+    session = credentials.requests[0].session
+    await manager.close_async()
+    assert session.closed
+
+
+def test_sync_request_is_shared() -> None:
+    """
+    Test that sync credentials are refreshed with a single pooled session.
+    """
+    credentials = SlowFakeCredentials()
+    requests: list[Any] = []
+    credentials.refresh = requests.append  # type: ignore[method-assign]
+    manager = TokenManager(credentials)
+    manager.refresh().result()
+    manager.refresh().result()
+    assert requests[0] is requests[1] is sync_request()
+    manager.close()
@@ -12,6 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pytest
+
+from google.cloud.alloydbconnector.utils import _deadline
+from google.cloud.alloydbconnector.utils import _remaining
 from google.cloud.alloydbconnector.utils import strip_http_prefix
 
 
@@ -25,3 +29,15 @@ def test_strip_http_prefix_with_url_having_http_prefix() -> None:
 
 def test_strip_http_prefix_with_url_having_https_prefix() -> None:
     assert strip_http_prefix("https://google.com") == "google.com"
+
+
+def test_remaining() -> None:
+    """
+    Test that _remaining counts down to a deadline and raises once it has
+    passed.
+    """
+    assert _deadline(None) is None
+    assert _remaining(None) is None
+    assert 0 < _remaining(_deadline(10)) <= 10  # type: ignore[operator]
+    with pytest.raises(TimeoutError):
+        _remaining(_deadline(-1))